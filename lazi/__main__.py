@@ -0,0 +1,168 @@
+"""Run a module or script with lazi installed, without changing its code.
+
+    python -m lazi [options] -m module [args...]
+    python -m lazi [options] script.py [args...]
+
+    python -m lazi --level LAZY --lazy '^yaml(\\.|$)=UNLO' -m mytool --help
+    python -m lazi --ab 5 -m mytool --help      # Eager vs lazy, 5 fresh runs each.
+
+Configuration keys can also be set with `--conf KEY=VALUE` (parsed as environment variables are,
+see `lazi.conf.envs`), before lazi is imported.
+
+With `--ab N`, the target is run N times without lazi and N times with it, in fresh interpreters,
+and the median wall time, run time, module counts and peak RSS are compared. The target should
+exit on its own (e.g. a CLI command, or a service with a `--check` option).
+"""
+from __future__ import annotations
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+from time import perf_counter
+from statistics import median
+
+START = perf_counter()
+
+LEVELS = "NONE", "LAZY", "SWAP", "LOAD", "UNMO", "UNLO"  # Same as `Spec.Level`, which would import lazi.conf.
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m lazi", description=__doc__.splitlines()[0],
+        usage="python -m lazi [options] (-m module | script.py) [args...]",
+    )
+    parser.add_argument("-l", "--level", type=str.upper, choices=LEVELS, help="Default level (conf.NO_LAZY).")
+    parser.add_argument(
+        "--lazy", action="append", default=[], metavar="PATTERN=LEVEL",
+        help="Level of the modules matching a regex, first match wins (prepended to conf.LAZY). Repeatable.",
+    )
+    parser.add_argument("-t", "--trace", type=int, help="Trace level (conf.TRACE).")
+    parser.add_argument("-c", "--conf", action="append", default=[], metavar="KEY=VALUE", help="Conf value. Repeatable.")
+    parser.add_argument("--eager", action="store_true", help="Run without installing lazi.")
+    parser.add_argument("--report", metavar="JSON", help="Write run time, Stat counters and peak RSS at exit.")
+    parser.add_argument("--ab", type=int, metavar="N", help="Compare N eager and N lazy runs.")
+    parser.add_argument("-m", dest="module", nargs=argparse.REMAINDER, help="Module to run, and its arguments.")
+    parser.add_argument("script", nargs=argparse.REMAINDER, help="Script to run, and its arguments.")
+    return parser
+
+
+def report(path: str) -> None:
+    import resource
+
+    data = dict(run=perf_counter() - START, modules=len(sys.modules))
+    data["rss_kib"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+
+    if "lazi.core.stat" in sys.modules or "lazi.core" in sys.modules:
+        from dataclasses import asdict
+        from lazi.core.stat import Stat
+        data["stat"] = asdict(Stat())
+
+    with open(path, "w") as file:
+        json.dump(data, file)
+
+
+def run(args: argparse.Namespace) -> None:
+    for item in args.conf:
+        key, _, value = item.partition("=")
+        os.environ[key] = value
+
+    if args.trace is not None:
+        os.environ["TRACE"] = str(args.trace)
+
+    if not args.eager:
+        from lazi.core import lazi
+
+        if args.level is not None:
+            lazi.NO_LAZY = lazi.Spec.Level[args.level]
+
+        if args.lazy:
+            cli = dict(_.rsplit("=", 1) for _ in args.lazy)
+            lazi.LAZY = {**cli, **{k: v for k, v in lazi.LAZY.items() if k not in cli}}
+
+        lazi.__enter__()
+
+    if args.report:  # Registered after lazi's own exit handler, so that it runs before it.
+        import atexit
+        atexit.register(report, args.report)
+
+    import runpy
+
+    if args.module:
+        name, *argv = args.module
+        sys.argv = [name, *argv]
+        runpy.run_module(name, run_name="__main__", alter_sys=True)
+    else:
+        path, *argv = args.script
+        sys.argv = [path, *argv]
+        sys.path[0] = os.path.dirname(os.path.abspath(path))
+        runpy.run_path(path, run_name="__main__")
+
+
+def ab(args: argparse.Namespace) -> None:
+    options = [
+        *(["--level", args.level] if args.level else []),
+        *(_ for lazy in args.lazy for _ in ("--lazy", lazy)),
+        *(["--trace", str(args.trace)] if args.trace is not None else []),
+        *(_ for item in args.conf for _ in ("--conf", item)),
+    ]
+    target = ["-m", *args.module] if args.module else args.script
+
+    results: dict[str, list[dict]] = dict(eager=[], lazy=[])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for index in range(args.ab):
+            for mode in results:
+                command = [
+                    sys.executable, "-m", "lazi", *options, *(["--eager"] if mode == "eager" else []),
+                    "--report", path := os.path.join(tmp, f"{mode}-{index}.json"), *target,
+                ]
+                start = perf_counter()
+                subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+                wall = perf_counter() - start
+
+                with open(path) as file:
+                    results[mode].append(dict(json.load(file), wall=wall))
+
+    def med(mode: str, key: str, field: str | None = None) -> float:
+        return median(run[key][field] if field else run[key] for run in results[mode])
+
+    rows = [
+        ("wall [ms]", med("eager", "wall") * 1e3, med("lazy", "wall") * 1e3),
+        ("run [ms]", med("eager", "run") * 1e3, med("lazy", "run") * 1e3),
+        ("sys.modules", med("eager", "modules"), med("lazy", "modules")),
+        ("peak RSS [KiB]", med("eager", "rss_kib"), med("lazy", "rss_kib")),
+    ]
+
+    print(f"{' '.join(target)}: median of {args.ab} runs", file=sys.stderr)
+    print(f"{'':>16} {'eager':>10} {'lazy':>10} {'diff':>8}", file=sys.stderr)
+
+    for label, eager, lazy in rows:
+        diff = f"{(lazy / eager - 1) * 100:+7.1f}%" if eager else ""
+        print(f"{label:>16} {eager:>10.1f} {lazy:>10.1f} {diff:>8}", file=sys.stderr)
+
+    print(
+        f"{'hooked modules':>16}: {med('lazy', 'stat', 'load_lazy'):.0f} never materialized, "
+        f"{med('lazy', 'stat', 'load_full'):.0f} loaded (eagerly or through proxies), "
+        f"{med('lazy', 'stat', 'find_spec'):.0f} specs",
+        file=sys.stderr,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    args = parser().parse_args(argv)
+
+    if not (args.module or args.script):
+        parser().error("a module (-m) or a script is required")
+
+    if args.ab:
+        ab(args)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,22 +21,90 @@ LAZY: dict[str, int | str] = {}         # Specify loading behavior for specific
 #
 NO_HOOK: bool = False                   # Disable all spec loader hooks.
 NO_HOOK_STD: bool = False               # Disable spec loader hooking for stdlib modules.
-NO_HOOK_BI: bool = False                # Disable spec loader hooking for built-in modules.
-NO_CHECK_STD_BI: bool = True            # Disable stdlib/built-in module checks (prevents autoloading of sysconfig data).
+NO_HOOK_BI: bool = True                 # Disable spec loader hooking for built-in (and frozen) modules.
+NO_CHECK_STD_BI: bool = False           # Disable stdlib/built-in module checks.
 #                                       # - This renders NO_HOOK_STD and NO_HOOK_BI ineffective, and simply disables
 #                                       #   the display of stdlib/built-in module tags (S/B) in the debug traces.
+#                                       # - The checks are cheap name/prefix lookups (sys.stdlib_module_names etc.).
 #
 AUTO_AUTO: bool = True                  # Automatically install when importing lazi.auto.
 CORE_AUTO: bool = False                 # Automatically install when importing lazi.core.
 #
 CONTEXT_INVALIDATION: bool = False      # Call invalidate_caches() when exiting a `with Finder()` statement.
 #
+EFFECTS: bool = False                   # Analyze module sources for import-time side effects (see `lazi.core.effects`).
+#                                       # - Modules that patch, register into or read the config of other modules, and
+#                                       #   modules imported only for their side effects, get at least EFFECTS_LEVEL.
+EFFECTS_LEVEL: int | str = "UNLO"       # Level of the modules with side effects.
+EFFECTS_CACHE: str | None = None        # Path of a persistent analysis cache (keyed by source file and hash).
+#
+RECOVER: bool = False                   # Recover from failed lazy module materializations (see `lazi.core.recover`).
+#                                       # - Rolls the failed modules back, loads the pending lazy modules of the same
+#                                       #   top-level package in import order, and retries once.
+#                                       # - On success, the modules involved get at least RECOVER_LEVEL from then on.
+RECOVER_LEVEL: int | str = "UNLO"       # Level of the modules learned by recovery.
+RECOVER_RULES: str | None = None        # Path of a JSON file to persist the learned levels to (loaded at startup).
+#
+RELEASE: bool = False                   # Drop the lazi state of modules once they're loaded.
+#                                       # - UNMO modules get their own loader back (and leave the Stat counters).
+#                                       # - SWAP and lazier modules drop their REBIND and LAZY_FROM state.
+#
+REBIND: bool = False                    # Replace references to a proxy with the real module once it's loaded.
+#                                       # - Rebinds sys.modules, the parent package attribute, the globals of the
+#                                       #   importing module, and the globals of any module that accesses the proxy.
+#
+LAZY_FROM: bool = False                 # Defer `from <lazy module> import name` until the name is first used.
+#                                       # - Binds a `lazi.core.defer.Deferred` that resolves and rebinds itself,
+#                                       #   but is not the real object until then (`is`, `type()`, `except`).
+#
+PROFILE: int = 0                        # Record exec times of hooked modules (see `lazi.core.prof`).
+#                                       # - 1: Record only (read them with `lazi.core.stat.Prof`).
+#                                       # - 2: Also write `python -X importtime` compatible output to stderr at exit.
+#
+GRAPH: str | None = None                # Path of a .json or .dot file to write the import graph of this run to, at exit.
+#                                       # - Import, trigger and nested exec edges, exec order and startup critical path
+#                                       #   (see `lazi.core.graph`).
+#
+MEMORY: int = 0                         # Record the net memory allocated by hooked module execs (see `lazi.core.mem`).
+#                                       # - 1: tracemalloc (Python allocations, slows allocations down).
+#                                       # - 2: RSS delta (whole process, page granularity).
+#
+RECORD: str | None = None               # Path of a JSON file to write a recording of this run to, at exit.
+#                                       # - Feed one or more recordings to `python -m lazi.core.tune` to generate
+#                                       #   a conf module with LAZY rules tuned to the recorded workload.
+#
+PREFETCH: str | None = None             # Path of a recording (see RECORD) to prefetch lazy modules from, in the
+#                                       #   recorded first-access order, on a background thread while idle.
+PREFETCH_IDLE: float = 0.05             # Seconds without hooked module activity before the next prefetch.
+#
+WARMUP_REPORT: str | None = None        # Path of a JSON report of the modules materialized by each forked
+#                                       #   worker after `Finder.warmup()`, written at exit ("{pid}" is replaced).
+#
+SPEC_INDEX: str | None = None           # Path of a persistent spec index file (opt-in).
+#                                       # - Caches sys.path lookups across runs, keyed by sys.path and directory mtimes.
+#                                       # - Written at exit when new specs were found, ignored per entry when stale.
+#
+BUNDLE: str | None = None               # Path of a code bundle to load modules from (see `lazi.core.bundle`).
+BUNDLE_CHECK: int = 2                   # Validate bundled code against the module sources.
+#                                       # - 0: Trust the bundle (immutable deployments).
+#                                       # - 1: Source mtime and size (one stat per module).
+#                                       # - 2: Source hash (reads the source, but not the .pyc).
+#
+EXPORT: str | None = None               # Serve Prometheus metrics over HTTP (see `lazi.core.export`).
+#                                       # - "PORT" or "HOST:PORT" (default host 127.0.0.1), or "unix:PATH".
+EXPORT_JSONL: str | None = None         # Path of a JSONL file to append a snapshot to every EXPORT_INTERVAL.
+EXPORT_INTERVAL: float = 10.0           # Seconds between JSONL snapshots.
+EXPORT_RING: int = 1000                 # Snapshots to keep in the JSONL file (trimmed at twice that).
+#
 #
 #
 CONF_NO_CACHING: bool | None = None     # Disable caching of conf vars.
 #                                         - None: Use the default caching behavior, which will disable
 #                                                 caching if `lazi.core` is already present in sys.modules
 #                                                 when lazi.conf.conf is imported.
+CONF_CACHE: str | None = None           # Path of a file to cache the merged configuration in (opt-in).
+#                                       # - Read from base.py and the environment only, not from other conf modules.
+#                                       # - Keyed by the conf module mtimes and conf env vars; rebuilt when stale.
 #
 __all__: list = [                       # Configuration keys that are allowed to be set.
     key for key in globals()            # - Not inherited or mutable.
@@ -22,13 +22,18 @@ But not like this:
 >>> import lazi.conf        # This is not the same as the above.
 >>> from lazi import conf   # Still no worky. Only imports the namespace module without loading.
 """
+from __future__ import annotations
+
+import os as _os
 import sys as _sys
+import marshal as _marshal
 
-from types import ModuleType, EllipsisType
-from typing import Iterator
-from pkgutil import ModuleInfo, iter_modules as _iter_modules
+from types import ModuleType, EllipsisType, MappingProxyType
+from collections.abc import Iterator
 from importlib import import_module as _import_module
 
+from lazi.util.util import atomic_write as _atomic_write
+
 __all__ = [
     "base", "conf", "__root__", "__conf__", "__core__", "__auto__", "__keys__",
 ]
@@ -66,6 +71,8 @@ class Conf(ModuleType):
     conf: dict[str, object | EllipsisType] = {key: ... for key in __keys__}
 
     __mods: dict[str, ModuleType] = base.__meta__.get("mods", {})
+    __snap: MappingProxyType | None = None
+    __CONF_CACHE: str | None = _os.environ.get("CONF_CACHE", base.CONF_CACHE) or None
     __CONF_NO_CACHING: bool = base.__meta__.get("CONF_NO_CACHING", __core__ in _sys.modules)
     __CONF_NO_CACHING_DFL: bool = __CONF_NO_CACHING
 
@@ -92,8 +99,11 @@ class Conf(ModuleType):
                 delattr(_sys.modules[self.__auto__], key)
 
         self.__CONF_NO_CACHING = self.__CONF_NO_CACHING_DFL
+        self.__snap = None
 
     def __mods__(self) -> Iterator[ModuleInfo]:
+        from pkgutil import iter_modules as _iter_modules  # Not needed when reading from CONF_CACHE.
+
         return (
             mi for mi in _iter_modules(self.__conf__.__path__, self.__conf__.__name__ + ".")
             if mi.name not in {self.__root__.__name__, self.base.__name__, self.__auto__, self.__name__}
@@ -105,6 +115,12 @@ class Conf(ModuleType):
             raise AttributeError(f"Module {__name__!r} has no attribute {attr!r}")
 
         elif value is ...:
+            if not self.__CONF_NO_CACHING:
+                if (value := self.__snapshot__().get(attr, miss)) is miss:
+                    raise AttributeError(f"Conf key {attr!r} has no value.")
+                self.__setattr__(attr, value)
+                return value
+
             value = getattr(self.base, attr)
 
             for mi in self.__mods__():
@@ -119,6 +135,61 @@ class Conf(ModuleType):
 
         return value
 
+    def __snapshot__(self) -> MappingProxyType:
+        """Merged values of all the conf modules, built (or read from CONF_CACHE) once.
+        """
+        if (snap := self.__snap) is None:
+            if (path := self.__CONF_CACHE) is None or (snap := self.__load(path)) is None:
+                snap = self.__build()
+                if path is not None:
+                    self.__save(path, snap)
+            snap = self.__snap = MappingProxyType(snap)
+        return snap
+
+    def __build(self) -> dict[str, object]:
+        snap = {key: getattr(self.base, key) for key in self.__keys__ if hasattr(self.base, key)}
+
+        for mi in self.__mods__():
+            if (mod := self.__mods.get(mi.name)) is None:
+                mod = self.__mods[mi.name] = _import_module(mi.name)
+            snap.update((key, getattr(mod, key)) for key in self.__keys__ if hasattr(mod, key))
+
+        return snap
+
+    def __stamp(self, files: tuple[str, ...] | None = None) -> tuple:
+        """Cache key: the conf dirs and modules with their mtimes, and the conf env vars.
+        """
+        if files is None:
+            files = (*self.__conf__.__path__, self.base.__file__, *(_.__file__ for _ in self.__mods.values()))
+
+        mtimes = []
+        for file in files:
+            try:
+                mtimes.append(_os.stat(file).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+
+        return (
+            _sys.implementation.cache_tag, files, tuple(mtimes),
+            tuple(sorted((key, _os.environ[key]) for key in self.__keys__ if key in _os.environ)),
+        )
+
+    def __load(self, path: str) -> dict[str, object] | None:
+        try:
+            with open(path, "rb") as file:
+                stamp, snap = _marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        # The conf dirs are those on sys.path now (a conf dir may have been added since), then the stamped modules.
+        files = (*self.__conf__.__path__, self.base.__file__)
+        return snap if stamp[1][:len(files)] == files and stamp == self.__stamp(stamp[1]) else None
+
+    def __save(self, path: str, snap: dict[str, object]) -> None:
+        try:
+            _atomic_write(path, _marshal.dumps((self.__stamp(), snap)))
+        except (OSError, ValueError):
+            pass  # Unwritable, or values that marshal doesn't support: build every time.
+
     def __setattr__(self, attr: str, value: object) -> None:
         if attr.startswith("_") or not attr.isupper():
             super().__setattr__(attr, value)
@@ -135,4 +206,4 @@ _sys.modules[__name__] = Conf()  # Replace module with instance.
 
 __all__.extend(_sys.modules[__name__].__keys__)
 
-del ModuleType, EllipsisType, Iterator, ModuleInfo
+del ModuleType, EllipsisType, MappingProxyType, Iterator
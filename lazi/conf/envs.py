@@ -34,7 +34,7 @@ def parse_item(typp: type, valu: str) -> object:
 
 def load():
     from lazi.conf import base
-    typd: dict[str, type] = _typing.get_type_hints(base)
+    typd: dict[str, type] = base.__annotations__  # Not postponed (no `from __future__ import annotations`).
     keys: set[str] = set(base.__all__) | base.__meta__.get("keys", set())
 
     for key in (_ for _ in keys if _ in _os.environ and _ in typd):
@@ -14,12 +14,12 @@ corresponding to the same `lazi.core.spec.Spec.Level` names:
 
 LAZY: dict[str, int | str] = {
 
-    r"^pandas\.core\.|^pandas\._config": "UNLO",
+    r"^pandas\.core\.|^pandas\._config\.": "UNLO",
 
     # r"^pandas": "LOAD",
 
     r"^requests\.utils|^certifi": "UNLO",
 
-    r"^django\.(db\.models.*|conf.*|utils.*)": "UNLO",
+    r"^django\.(db\.models|conf|utils)\.": "UNLO",
 
 }
@@ -9,9 +9,30 @@ conf = _conf
 lazi = __finder__
 lazy = Finder.lazy
 
+if _conf.PROFILE:
+    from . import prof  # noqa: Installs the profiler.
+
+if _conf.GRAPH:
+    from . import graph  # noqa: Installs the graph recorder.
+
+if _conf.MEMORY:
+    from . import mem  # noqa: Installs memory accounting.
+
+if _conf.RECOVER:
+    from . import recover  # noqa: Installs recovery.
+
+if _conf.RECORD:
+    from . import record  # noqa: Installs the recorder.
+
 if _conf.CORE_AUTO:
     __finder__.__enter__()
 
+if _conf.PREFETCH:
+    from . import prefetch  # noqa: Starts the prefetcher.
+
+if _conf.EXPORT or _conf.EXPORT_JSONL:
+    from . import export  # noqa: Starts the exporter.
+
 for _ in __all__:
     setattr(_conf.__root__, _, globals()[_])
 del _
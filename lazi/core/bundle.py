@@ -0,0 +1,196 @@
+"""Memory-mapped code bundle.
+
+Collects the code objects of the (source) modules of a recorded run (see `lazi.core.record`)
+into one file, which is memory-mapped read-only by every process that uses it:
+
+    python -m lazi.core.bundle BUNDLE RECORDING.json [...]
+
+With `conf.BUNDLE`, the Finder serves specs for the bundled modules from the bundle index, and
+their loader unmarshals the code straight from the mapping instead of stat'ing, opening and
+reading a separate .pyc per module. Modules that are not in the bundle, whose source changed (see
+`conf.BUNDLE_CHECK`), or that an earlier search path entry would shadow, go through the regular
+finders and loaders.
+
+Layout: MAGIC, index offset (8 bytes, little endian), marshaled code objects, marshaled index.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import mmap
+import json
+import marshal
+import argparse
+from types import CodeType
+from importlib.util import MAGIC_NUMBER, source_hash, spec_from_file_location
+from importlib.machinery import ModuleSpec, PathFinder, SourceFileLoader
+
+from lazi.conf import conf
+from lazi.util import debug, atomic_write, Persistent
+
+__all__ = "Bundle", "BundleLoader", "build", "main"
+
+MAGIC = b"LAZIBND1"
+HEADER = len(MAGIC) + 8
+
+Entry = tuple[str, bool, bytes, int, int, int, int]  # origin, package, source hash, mtime, size, offset, length
+
+
+class BundleLoader(SourceFileLoader):
+    """SourceFileLoader that gets the code from a bundle (validated by `Bundle.find_spec()`).
+    """
+    bundle: Bundle
+
+    def __init__(self, fullname: str, path: str, bundle: Bundle):
+        super().__init__(fullname, path)
+        self.bundle = bundle
+
+    def get_code(self, fullname: str) -> CodeType:
+        if (code := self.bundle.code(fullname)) is not None:
+            return code
+        return super().get_code(fullname)
+
+
+class Bundle(Persistent):
+    CHECK: int = conf.BUNDLE_CHECK
+
+    path: str
+    map: mmap.mmap | None = None
+    entries: dict[str, Entry]
+    hits: int = 0
+    miss: int = 0
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = {}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "rb") as file:
+                self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if self.map[:len(MAGIC)] != MAGIC:
+                raise ValueError("bad magic")
+
+            magic, entries = marshal.loads(memoryview(self.map)[int.from_bytes(self.map[len(MAGIC):HEADER], "little"):])
+
+            if magic != (MAGIC_NUMBER, sys.flags.optimize):
+                raise ValueError("bytecode magic or optimization level")
+
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            assert None is debug.traced(1, f"[BUNDLE] MISS {self.path} {type(e).__name__}: {e}")
+            return
+
+        self.entries = entries
+        assert None is debug.traced(1, f"[BUNDLE] LOAD {self.path} {len(entries)}")
+
+    def find_spec(self, name: str, path: list[str] | None) -> ModuleSpec | None:
+        if (entry := self.entries.get(name)) is None:
+            return None
+
+        origin, package = entry[:2]
+        location = os.path.dirname(os.path.dirname(origin) if package else origin)
+        search = path if path is not None else sys.path
+
+        if location not in search:  # Resolved from elsewhere in this run.
+            return None
+
+        if (index := search.index(location)) and (
+                (spec := PathFinder.find_spec(name, search[:index])) is not None and spec.origin is not None
+        ):
+            assert None is debug.traced(1, f"[BUNDLE] SHAD {name} {spec.origin}")
+            return None  # Shadowed by an earlier entry (namespace portions don't count).
+
+        if not self.valid(entry):
+            self.miss += 1
+            assert None is debug.traced(1, f"[BUNDLE] STAL {name}")
+            return None
+
+        return spec_from_file_location(
+            name, origin, loader=BundleLoader(name, origin, self),
+            submodule_search_locations=[os.path.dirname(origin)] if package else None,
+        )
+
+    def valid(self, entry: Entry) -> bool:
+        origin, _, digest, mtime, size = entry[:5]
+
+        if self.CHECK <= 0:
+            return True
+
+        try:
+            if self.CHECK == 1:
+                return (st := os.stat(origin)).st_mtime_ns == mtime and st.st_size == size
+            with open(origin, "rb") as file:
+                return source_hash(file.read()) == digest
+        except OSError:
+            return False
+
+    def code(self, name: str) -> CodeType | None:
+        if (entry := self.entries.get(name)) is None or self.map is None:
+            return None
+
+        self.hits += 1
+        offset, length = entry[5:]
+        return marshal.loads(memoryview(self.map)[offset:offset + length])
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.entries = {}
+
+
+def build(path: str, names: list[str]) -> int:
+    """Write a bundle of the source modules among `names`, without importing them. Returns the count.
+    """
+    specs: dict[str, ModuleSpec | None] = {}
+
+    def find(name: str) -> ModuleSpec | None:
+        if name not in specs:
+            parent = name.rpartition(".")[0]
+            if parent and ((pspec := find(parent)) is None or pspec.submodule_search_locations is None):
+                specs[name] = None
+            else:
+                specs[name] = PathFinder.find_spec(name, pspec.submodule_search_locations if parent else None)
+        return specs[name]
+
+    entries, blobs, offset = {}, [], HEADER
+
+    for name in sorted(set(names)):
+        if (spec := find(name)) is None or type(spec.loader) is not SourceFileLoader:
+            continue
+
+        source = spec.loader.get_data(spec.origin)
+        blob = marshal.dumps(compile(source, spec.origin, "exec", dont_inherit=True))
+        st = os.stat(spec.origin)
+
+        entries[name] = (
+            spec.origin, spec.submodule_search_locations is not None, source_hash(source),
+            st.st_mtime_ns, st.st_size, offset, len(blob),
+        )
+        blobs.append(blob)
+        offset += len(blob)
+
+    atomic_write(path, [
+        MAGIC + offset.to_bytes(8, "little"), *blobs, marshal.dumps(((MAGIC_NUMBER, sys.flags.optimize), entries)),
+    ])
+    return len(entries)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m lazi.core.bundle", description=__doc__.splitlines()[0])
+    parser.add_argument("bundle", help="Bundle file to write (see conf.BUNDLE).")
+    parser.add_argument("recordings", nargs="+", help="Recording JSON files (see conf.RECORD).")
+    args = parser.parse_args(argv)
+
+    names = []
+    for recording in args.recordings:
+        with open(recording) as file:
+            names.extend(json.load(file)["specs"])
+
+    print(f"{build(args.bundle, names)} modules -> {args.bundle}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Deferred `from module import name` bindings (see `conf.LAZY_FROM`).
+
+With LAZY_FROM, `from pkg import name` on a lazy module binds a `Deferred` instead of
+materializing `pkg`. The deferred object resolves `pkg.name` (or the `pkg.name` submodule)
+on first use: a call, attribute access, operator, iteration, isinstance check, subclassing...
+It then replaces itself with the resolved object in the globals it was imported into.
+
+Identity checks (`is`), `type()`, `except` clauses and C functions that require an exact
+type see the deferred object until it's resolved and rebound, which is why this is opt-in.
+"""
+from __future__ import annotations
+
+import os
+import math
+import operator
+import importlib
+from opcode import opmap
+from importlib._bootstrap import _handle_fromlist  # noqa: Shared with importlib.
+
+from lazi.util import debug, oid
+
+__all__ = "Deferred", "resolve"
+
+IMPORT_FROM = opmap["IMPORT_FROM"]
+FROMLIST = _handle_fromlist.__code__  # Checks `hasattr(module, name)` before IMPORT_FROM.
+
+UNSET = object()
+
+_get = object.__getattribute__
+_set = object.__setattr__
+
+
+class Deferred:
+    __slots__ = "__modu", "__name", "__attr", "__valu", "__glob"
+
+    def __init__(self, module, name: str, attr: str):
+        _set(self, "_Deferred__modu", module)
+        _set(self, "_Deferred__name", name)
+        _set(self, "_Deferred__attr", attr)
+        _set(self, "_Deferred__valu", UNSET)
+        _set(self, "_Deferred__glob", [])
+
+    @classmethod
+    def imported(cls, module, spec, attr: str, frame) -> Deferred | None:
+        """The deferred `attr` of a lazy module, if `frame` is running a `from` import of it.
+        """
+        if attr[:2] == "__":
+            return None
+
+        if (code := frame.f_code) is not FROMLIST and code.co_code[frame.f_lasti] != IMPORT_FROM:
+            return None
+
+        if (deferreds := (loader := spec.loader).deferred) is None:
+            deferreds = loader.deferred = {}
+
+        if (deferred := deferreds.get(attr)) is None:
+            deferred = deferreds.setdefault(attr, cls(module, spec.name, attr))
+
+        if code is not FROMLIST:
+            _get(deferred, "_Deferred__glob").append(frame.f_globals)
+            assert None is debug.traced(2, f"[{oid(deferred)}] DEFR {spec.name}.{attr} -> {frame.f_globals.get('__name__')}")
+
+        return deferred
+
+    def __getattribute__(self, attr):
+        return getattr(resolve(self), attr)
+
+    def __setattr__(self, attr, valu):
+        setattr(resolve(self), attr, valu)
+
+    def __delattr__(self, attr):
+        delattr(resolve(self), attr)
+
+
+def resolve(deferred: Deferred):
+    """Resolve a deferred import, and rebind it in the globals it was imported into.
+    """
+    if (valu := _get(deferred, "_Deferred__valu")) is not UNSET:
+        return valu
+
+    module, name, attr = (_get(deferred, f"_Deferred__{_}") for _ in ("modu", "name", "attr"))
+
+    try:
+        valu = getattr(module, attr)
+    except AttributeError as e:
+        if getattr(module, "__path__", None) is None:
+            raise ImportError(f"cannot import name {attr!r} from {name!r}", name=name) from e
+        try:
+            valu = importlib.import_module(f"{name}.{attr}")
+        except ModuleNotFoundError:
+            raise ImportError(f"cannot import name {attr!r} from {name!r}", name=name) from e
+
+    while type(valu) is Deferred:  # Re-exported from another lazy module.
+        valu = resolve(valu)
+
+    _set(deferred, "_Deferred__valu", valu)
+
+    assert None is debug.traced(2, f"[{oid(deferred)}] RSLV {name}.{attr} -> [{oid(valu)}]")
+
+    for namespace in _get(deferred, "_Deferred__glob"):
+        for key in [key for key, val in namespace.items() if val is deferred]:
+            namespace[key] = valu
+
+    _get(deferred, "_Deferred__glob").clear()
+    return valu
+
+
+def forward(func):
+    def method(self, *args, **kwds):
+        return func(resolve(self), *args, **kwds)
+    return method
+
+
+def reflect(func):
+    def method(self, other):
+        return func(other, resolve(self))
+    return method
+
+
+for _name, _func in dict(
+    __call__=lambda valu, *args, **kwds: valu(*args, **kwds),
+    __repr__=repr, __str__=str, __bytes__=bytes, __format__=format, __dir__=dir, __hash__=hash,
+    __bool__=bool, __int__=int, __float__=float, __complex__=complex, __index__=operator.index,
+    __round__=round, __trunc__=math.trunc, __floor__=math.floor, __ceil__=math.ceil, __fspath__=os.fspath,
+    __neg__=operator.neg, __pos__=operator.pos, __abs__=abs, __invert__=operator.invert,
+    __lt__=operator.lt, __le__=operator.le, __eq__=operator.eq,
+    __ne__=operator.ne, __gt__=operator.gt, __ge__=operator.ge,
+    __len__=len, __iter__=iter, __next__=next, __reversed__=reversed,
+    __contains__=lambda valu, item: item in valu,
+    __getitem__=operator.getitem, __setitem__=operator.setitem, __delitem__=operator.delitem,
+    __enter__=lambda valu: valu.__enter__(), __exit__=lambda valu, *args: valu.__exit__(*args),
+    __aenter__=lambda valu: valu.__aenter__(), __aexit__=lambda valu, *args: valu.__aexit__(*args),
+    __await__=lambda valu: valu.__await__(), __aiter__=lambda valu: valu.__aiter__(),
+    __anext__=lambda valu: valu.__anext__(),
+    __get__=lambda valu, obj, cls=None: valu.__get__(obj, cls) if hasattr(type(valu), "__get__") else valu,
+    __set_name__=lambda valu, owner, name: getattr(type(valu), "__set_name__", lambda *_: None)(valu, owner, name),
+    __instancecheck__=lambda valu, obj: isinstance(obj, valu),
+    __subclasscheck__=lambda valu, cls: issubclass(cls, valu),
+    __mro_entries__=lambda valu, bases: (
+        valu.__mro_entries__(bases) if not isinstance(valu, type) and hasattr(valu, "__mro_entries__") else (valu,)
+    ),
+).items():
+    setattr(Deferred, _name, forward(_func))
+
+for _name in ("add", "sub", "mul", "matmul", "truediv", "floordiv", "mod", "pow", "lshift", "rshift", "and", "xor", "or"):
+    _func = getattr(operator, _name, None) or getattr(operator, f"{_name}_")
+    setattr(Deferred, f"__{_name}__", forward(_func))
+    setattr(Deferred, f"__r{_name}__", reflect(_func))
+    setattr(Deferred, f"__i{_name}__", forward(getattr(operator, f"i{_name}")))
+
+Deferred.__divmod__, Deferred.__rdivmod__ = forward(divmod), reflect(divmod)
+
+del _name, _func
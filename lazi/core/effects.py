@@ -0,0 +1,287 @@
+"""Static analysis of import-time side effects.
+
+Deferring a module is only safe if nothing depends on it having run. Module-level code that
+changes or reads the state of *other* modules breaks that (see "Expected global state is not
+there" in the readme), so with `conf.EFFECTS` the Finder parses the source of every module it
+finds, and gives the level `conf.EFFECTS_LEVEL` (at least) to:
+
+- Modules with module-level statements that have effects on imported modules or objects:
+  - "patch":  assigning to, or deleting, attributes or items of them (or `setattr`).
+  - "regs":   calling registration or mutation methods on them (`register*`, `add_*`, `set_*`,
+              `connect`, `append`...), or decorating a module-level definition with one.
+  - "conf":   reading configuration (`get_option()`, `settings.X`...).
+- Modules that are only imported for their side effects: `import pkg.mod` statements whose
+  name is never used by the importing module (so a lazy `pkg.mod` would never execute).
+
+Function bodies are not analyzed, nor are `if __name__ == "__main__"` and `if TYPE_CHECKING` blocks.
+Results are cached per source file (by mtime and size, then by source hash), in memory and in
+`conf.EFFECTS_CACHE` across runs.
+"""
+from __future__ import annotations
+
+import os
+import re
+import ast
+import marshal
+from importlib.util import source_hash, resolve_name
+
+from lazi.util import debug, atomic_write, Persistent
+
+__all__ = "Effects", "analyze"
+
+VERSION = 1
+
+Effect = tuple[str, int, str]   # Kind, line, statement.
+Entry = tuple[int, int, bytes, tuple[Effect, ...], tuple[str, ...]]  # mtime, size, hash, effects, side-effect imports.
+
+REGS = re.compile(r"^(_?(un)?register\w*|add_\w+|set_\w+|install\w*|connect|subscribe|receiver|hook\w*"
+                  r"|append|extend|insert|update|setdefault|filterwarnings|simplefilter|patch\w*)$")
+CONF = re.compile(r"^(get_?(option|config|setting)s?|getoption)$")
+CONF_NAMES = frozenset(("settings", "config", "options"))
+
+SKIP_TESTS = ("__name__", "TYPE_CHECKING", "typing.TYPE_CHECKING")
+
+
+def dotted(node: ast.AST) -> str | None:
+    """Dotted name of a Name/Attribute chain, if it is one.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and (base := dotted(node.value)) is not None:
+        return f"{base}.{node.attr}"
+    return None
+
+
+def root(node: ast.AST) -> str | None:
+    """Name at the root of an Attribute/Subscript/Call chain.
+    """
+    while isinstance(node, (ast.Attribute, ast.Subscript, ast.Call)):
+        node = node.func if isinstance(node, ast.Call) else node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+class Analyzer:
+    name: str
+    package: str
+    imported: dict[str, str]        # Bound name -> module or object it was imported from.
+    plain: dict[str, list[str]]     # Bound name -> modules imported with `import a.b` (side-effect candidates).
+    used: set[str]                  # Names loaded anywhere in the module.
+    effects: list[Effect]
+
+    def __init__(self, name: str, is_package: bool):
+        self.name = name
+        self.package = name if is_package else name.rpartition(".")[0]
+        self.imported, self.plain, self.used, self.effects = {}, {}, set(), []
+
+    def run(self, tree: ast.Module) -> tuple[list[Effect], list[str]]:
+        self.used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Store)}
+        self.used.update(  # `__all__` re-exports.
+            elt.value for node in tree.body if isinstance(node, (ast.Assign, ast.AugAssign))
+            and "__all__" in (dotted(_) for _ in getattr(node, "targets", [getattr(node, "target", None)]))
+            and isinstance(node.value, (ast.List, ast.Tuple))
+            for elt in node.value.elts if isinstance(elt, ast.Constant)
+        )
+        self.body(tree.body)
+        return self.effects, [module for name, modules in self.plain.items() if name not in self.used for module in modules]
+
+    def add(self, kind: str, node: ast.AST) -> None:
+        self.effects.append((kind, node.lineno, ast.unparse(node).partition("\n")[0][:120]))
+
+    def body(self, statements: list[ast.stmt]) -> None:
+        for node in statements:
+            self.statement(node)
+
+    def statement(self, node: ast.stmt) -> None:
+        match node:
+            case ast.Import(names=names):
+                for alias in names:
+                    if alias.asname:
+                        self.imported[alias.asname] = alias.name
+                    else:
+                        top = alias.name.partition(".")[0]
+                        self.imported[top] = top
+                        self.plain.setdefault(top, []).append(alias.name)
+
+            case ast.ImportFrom(module=module, names=names, level=level):
+                base = resolve_name("." * level + (module or ""), self.package) if level else module
+                for alias in names:
+                    self.imported[alias.asname or alias.name] = f"{base}.{alias.name}"
+
+            case ast.FunctionDef() | ast.AsyncFunctionDef():
+                self.decorators(node)
+
+            case ast.ClassDef():
+                self.decorators(node)
+                self.expressions(*node.bases, *(_.value for _ in node.keywords))
+                self.body(node.body)
+
+            case ast.If(test=test) if dotted(test) in SKIP_TESTS or (
+                isinstance(test, ast.Compare) and dotted(test.left) == "__name__"
+            ):
+                self.body(node.orelse)
+
+            case ast.If() | ast.For() | ast.AsyncFor() | ast.While() | ast.With() | ast.AsyncWith():
+                self.expressions(*(
+                    [node.test] if isinstance(node, (ast.If, ast.While)) else
+                    [node.iter] if isinstance(node, (ast.For, ast.AsyncFor)) else
+                    [_.context_expr for _ in node.items]
+                ))
+                self.body(node.body)
+                self.body(getattr(node, "orelse", []))
+
+            case ast.Try():
+                self.body(node.body)
+                for handler in node.handlers:
+                    self.body(handler.body)
+                self.body(node.orelse)
+                self.body(node.finalbody)
+
+            case ast.Assign(targets=targets) | ast.Delete(targets=targets):
+                self.targets(node, targets)
+                self.expressions(getattr(node, "value", None))
+
+            case ast.AugAssign(target=target) | ast.AnnAssign(target=target):
+                self.targets(node, [target])
+                self.expressions(node.value)
+
+            case ast.Expr(value=value):
+                self.expressions(value)
+
+    def targets(self, node: ast.stmt, targets: list[ast.expr]) -> None:
+        for target in targets:
+            if isinstance(target, (ast.Tuple, ast.List)):
+                self.targets(node, target.elts)
+            elif isinstance(target, (ast.Attribute, ast.Subscript)) and root(target) in self.imported:
+                return self.add("patch", node)
+
+    def decorators(self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> None:
+        for decorator in node.decorator_list:
+            func = decorator.func if isinstance(decorator, ast.Call) else decorator
+            if (name := dotted(func)) is not None and REGS.match(name.rpartition(".")[2]):
+                return self.add("regs", decorator)
+
+    def expressions(self, *nodes: ast.expr | None) -> None:
+        for node in nodes:
+            if node is None:
+                continue
+
+            for sub in walk(node):
+                if isinstance(sub, ast.Call):
+                    name = dotted(sub.func) or ""
+                    last = name.rpartition(".")[2]
+
+                    if name in ("setattr", "delattr") and sub.args and root(sub.args[0]) in self.imported:
+                        return self.add("patch", sub)
+                    if CONF.match(last) and (root(sub.func) in self.imported):
+                        return self.add("conf", sub)
+                    if "." in name and REGS.match(last) and root(sub.func) in self.imported:
+                        return self.add("regs", sub)
+
+                elif isinstance(sub, ast.Attribute) and isinstance(sub.value, ast.Name) and (
+                    (imported := self.imported.get(sub.value.id)) is not None
+                    and imported.rpartition(".")[2] in CONF_NAMES
+                ):
+                    return self.add("conf", sub)
+
+
+def walk(node: ast.AST):
+    """`ast.walk()`, without the bodies of lambdas (not executed at import time).
+    """
+    todo = [node]
+    while todo:
+        yield (node := todo.pop())
+        if not isinstance(node, ast.Lambda):
+            todo.extend(ast.iter_child_nodes(node))
+
+
+def analyze(source: bytes | str, name: str, is_package: bool = False) -> tuple[list[Effect], list[str]]:
+    """Module-level side effects of a module, and the modules it imports only for their side effects.
+    """
+    return Analyzer(name, is_package).run(ast.parse(source))
+
+
+class Effects(Persistent):
+    path: str | None
+    entries: dict[str, Entry]       # Origin -> analysis.
+    flagged: set[str]               # Modules with side effects or imported for them, for `Finder.get_level()`.
+    found: dict[str, tuple[Effect, ...]]  # Module name -> effects, for the modules analyzed in this run.
+    dirty: bool = False
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self.entries, self.flagged, self.found = {}, set(), {}
+        self.load()
+
+    def load(self) -> None:
+        if self.path is None:
+            return
+
+        try:
+            with open(self.path, "rb") as file:
+                version, entries = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            assert None is debug.traced(1, f"[EFFECTS] MISS {self.path} {type(e).__name__}")
+            return
+
+        if version == VERSION:
+            self.entries = entries
+            assert None is debug.traced(1, f"[EFFECTS] LOAD {self.path} {len(entries)}")
+
+    def save(self) -> None:
+        if not self.dirty or self.path is None:
+            return
+
+        try:
+            atomic_write(self.path, marshal.dumps((VERSION, self.entries)))
+        except OSError as e:
+            assert None is debug.traced(0, f"[EFFECTS] SAVE {self.path} !!!! {type(e).__name__}: {e}")
+        else:
+            self.dirty = False
+
+    def entry(self, name: str, origin: str, is_package: bool) -> Entry | None:
+        try:
+            st = os.stat(origin)
+            if (entry := self.entries.get(origin)) is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                return entry
+
+            with open(origin, "rb") as file:
+                source = file.read()
+        except OSError:
+            return None
+
+        digest = source_hash(source)
+
+        if entry is None or entry[2] != digest:
+            try:
+                effects, imports = analyze(source, name, is_package)
+            except (SyntaxError, ValueError, ImportError):
+                effects, imports = [], []  # Raised again by the import itself.
+
+            entry = (st.st_mtime_ns, st.st_size, digest, tuple(effects), tuple(imports))
+        else:
+            entry = (st.st_mtime_ns, st.st_size, *entry[2:])  # Touched, but unchanged.
+
+        self.entries[origin] = entry
+        self.dirty = True
+        return entry
+
+    def scan(self, name: str, spec) -> None:
+        """Analyze the source of a found spec, and flag it (or the modules it imports) if needed.
+        """
+        if not spec.has_location or not (origin := spec.origin or "").endswith(".py"):
+            return
+
+        if (entry := self.entry(name, origin, spec.submodule_search_locations is not None)) is None:
+            return
+
+        effects, imports = entry[3:]
+
+        if effects:
+            self.found[name] = effects
+            self.flagged.add(name)
+            assert None is debug.traced(1, f"[EFFECTS] FLAG {name} {effects[0][0]}:{effects[0][1]} {effects[0][2]}")
+
+        for module in imports:
+            self.flagged.add(module)
+            assert None is debug.traced(1, f"[EFFECTS] FLAG {module} (imported for side effects by {name})")
+
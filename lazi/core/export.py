@@ -0,0 +1,252 @@
+"""Lazi metrics exporter.
+
+Serves `lazi.core.stat.Stat` counters, plus materialization counts and cumulative exec time,
+in the Prometheus text format over HTTP, on a local TCP port or a Unix socket:
+
+    EXPORT = "9464"                 # 127.0.0.1:9464
+    EXPORT = "0.0.0.0:9464"
+    EXPORT = "unix:/run/app/lazi.sock"  # curl --unix-socket /run/app/lazi.sock http://lazi/metrics
+
+and/or appends a JSON snapshot every `EXPORT_INTERVAL` seconds to a bounded JSONL ring file
+(`EXPORT_JSONL`, at most 2 * `EXPORT_RING` lines).
+
+Collection only reads counters: it never takes the import lock, and the exec hook adds two
+clock reads per materialization.
+"""
+from __future__ import annotations
+
+import os
+import json
+import atexit
+import threading
+from time import time, perf_counter_ns
+from dataclasses import asdict
+from collections import deque
+
+from lazi.conf import conf
+from lazi.util import debug, atomic_write
+
+from .loader import Loader
+from .stat import Stat, FIELDS
+
+__all__ = "Meter", "Exporter", "__exporter__"
+
+
+class Meter(Loader.Hook):
+    """Materialization counters (cheaper than `lazi.core.prof.Profiler`, which keeps records).
+    """
+    exec_lazy: int = 0
+    exec_eagr: int = 0
+    exec_fail: int = 0
+    wall_totl: int = 0  # Wall time of top-level (non-nested) materializations (ns).
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def enter(self, spec, lazy: bool, /) -> tuple[bool, int]:
+        self.local.depth = getattr(self.local, "depth", 0) + 1
+        return lazy, perf_counter_ns()
+
+    def leave(self, spec, token: tuple[bool, int], error: BaseException | None, /) -> None:
+        wall = perf_counter_ns() - token[1]
+        self.local.depth -= 1
+
+        with self.lock:
+            if token[0]:
+                self.exec_lazy += 1
+            else:
+                self.exec_eagr += 1
+            if error is not None:
+                self.exec_fail += 1
+            if not self.local.depth:
+                self.wall_totl += wall
+
+
+class Exporter:
+    address: str | None
+    jsonl: str | None
+    interval: float
+    ring: int
+    meter: Meter
+
+    server = None               # socketserver.BaseServer, once started.
+    bound: tuple | str | None = None  # Bound (host, port) or socket path.
+
+    __threads: list[threading.Thread]
+    __stop: threading.Event
+
+    def __init__(
+            self,
+            address: str | None = conf.EXPORT,
+            jsonl: str | None = conf.EXPORT_JSONL,
+            interval: float = conf.EXPORT_INTERVAL,
+            ring: int = conf.EXPORT_RING,
+    ):
+        self.address = address
+        self.jsonl = jsonl
+        self.interval = interval
+        self.ring = ring
+        self.meter = Meter()
+        self.__threads = []
+        self.__stop = threading.Event()
+
+    def sample(self) -> dict:
+        meter = self.meter
+        return dict(
+            time=time(),
+            pid=os.getpid(),
+            **asdict(Stat()),
+            exec_lazy=meter.exec_lazy,
+            exec_eagr=meter.exec_eagr,
+            exec_fail=meter.exec_fail,
+            wall_totl=meter.wall_totl,
+        )
+
+    def metrics(self) -> str:
+        """Prometheus text exposition of the current counters.
+        """
+        stat, meter = Stat(), self.meter
+        states = {state.name: getattr(stat, field) for field, state in FIELDS.items()}
+        states.update(NONE=stat.load_none, WTAF=stat.load_wtaf)
+
+        lines = [
+            "# HELP lazi_specs Finder specs by loader state.",
+            "# TYPE lazi_specs gauge",
+            *(f'lazi_specs{{state="{state}"}} {count}' for state, count in states.items()),
+            "# HELP lazi_specs_hooked Finder specs with a hooked (lazi) loader.",
+            "# TYPE lazi_specs_hooked gauge",
+            f"lazi_specs_hooked {stat.load_hook}",
+            "# HELP lazi_finders Finder instances.",
+            "# TYPE lazi_finders gauge",
+            f"lazi_finders {stat.find_toti}",
+            "# HELP lazi_modules Modules in sys.modules.",
+            "# TYPE lazi_modules gauge",
+            f"lazi_modules {stat.syst_totl}",
+            "# HELP lazi_materializations_total Hooked module executions, deferred (lazy) or eager.",
+            "# TYPE lazi_materializations_total counter",
+            f'lazi_materializations_total{{mode="lazy"}} {meter.exec_lazy}',
+            f'lazi_materializations_total{{mode="eager"}} {meter.exec_eagr}',
+            "# HELP lazi_failures_total Hooked module executions that raised.",
+            "# TYPE lazi_failures_total counter",
+            f"lazi_failures_total {meter.exec_fail}",
+            "# HELP lazi_exec_seconds_total Wall time spent executing hooked modules.",
+            "# TYPE lazi_exec_seconds_total counter",
+            f"lazi_exec_seconds_total {meter.wall_totl / 1e9:.9f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def start(self) -> Exporter:
+        if self.__threads:
+            return self
+
+        Loader.hook(self.meter)
+
+        if self.address:
+            self.server = self.serve(self.address)
+            self.__threads.append(thread := threading.Thread(
+                target=self.server.serve_forever, args=(0.5,), name="lazi-Exporter-http", daemon=True,
+            ))
+            thread.start()
+
+        if self.jsonl:
+            self.__threads.append(thread := threading.Thread(
+                target=self.run, name="lazi-Exporter-jsonl", daemon=True,
+            ))
+            thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self.__stop.set()
+
+        if (server := self.server) is not None:
+            server.shutdown()
+            server.server_close()
+            if isinstance(self.bound, str) and os.path.exists(self.bound):
+                os.unlink(self.bound)
+            self.server = None
+
+        for thread in self.__threads:
+            if thread is not threading.current_thread():
+                thread.join()
+
+        self.__threads.clear()
+        Loader.unhook(self.meter)
+
+    def serve(self, address: str):
+        import socketserver
+        from http.server import BaseHTTPRequestHandler
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.metrics().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def address_string(self) -> str:
+                return str(self.client_address or "unix")
+
+            def log_message(self, format, *args):
+                assert None is debug.traced(2, f"[EXPORT] {self.address_string()} {format % args}")
+
+        if address.startswith("unix:"):
+            class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+                daemon_threads = True
+
+            if os.path.exists(path := address[5:]):
+                os.unlink(path)  # Stale socket from a previous run.
+
+            server = Server(path, Handler)
+            self.bound = path
+        else:
+            class Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+                daemon_threads = True
+                allow_reuse_address = True
+
+            host, _, port = address.rpartition(":")
+            server = Server((host or "127.0.0.1", int(port)), Handler)
+            self.bound = server.server_address
+
+        return server
+
+    def run(self) -> None:
+        lines = deque(maxlen=self.ring)
+        os.makedirs(os.path.dirname(os.path.abspath(self.jsonl)), exist_ok=True)
+
+        count = 0
+
+        if os.path.exists(self.jsonl):
+            with open(self.jsonl) as file:
+                for count, line in enumerate(file, 1):
+                    lines.append(line)
+
+            if count > len(lines):  # Keep the file within the ring bound from the start.
+                atomic_write(self.jsonl, lines)
+
+        count = len(lines)
+
+        while True:
+            lines.append(line := json.dumps(self.sample()) + "\n")
+
+            if (count := count + 1) > 2 * self.ring:
+                atomic_write(self.jsonl, lines)
+                count = len(lines)
+            else:
+                with open(self.jsonl, "a") as file:
+                    file.write(line)
+
+            if self.__stop.wait(self.interval):
+                break
+
+
+__exporter__: Exporter | None = None
+
+if conf.EXPORT or conf.EXPORT_JSONL:
+    __exporter__ = Exporter().start()
+    atexit.register(__exporter__.stop)
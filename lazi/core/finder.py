@@ -10,11 +10,13 @@ from __future__ import annotations
 
 import sys
 import atexit
+from threading import RLock
 from types import ModuleType
+from typing import Iterable
 from importlib.abc import MetaPathFinder
-from importlib.machinery import ModuleSpec
+from importlib.machinery import ModuleSpec, PathFinder
 from importlib import import_module
-import re
+from importlib.util import resolve_name
 
 from lazi.conf import conf
 from lazi.util import classproperty, debug, oid
@@ -22,8 +24,13 @@ from lazi.util import classproperty, debug, oid
 from .spec import Spec
 from .loader import Loader
 from .module import Module
+from .defer import Deferred, resolve
+from .rules import Rules
+from .index import Index
+from .bundle import Bundle
+from .effects import Effects
 
-__all__ = "Finder", "__finder__"
+__all__ = "Finder", "Stack", "__finder__", "__stack__"
 
 
 class Finder(MetaPathFinder):
@@ -34,14 +41,22 @@ class Finder(MetaPathFinder):
     NO_LAZY: Spec.Level = Spec.Level(conf.NO_LAZY)
     LAZY: dict[str, int | str] = conf.LAZY
     CONTEXT_INVALIDATION: bool = conf.CONTEXT_INVALIDATION
+    SPEC_INDEX: str | None = conf.SPEC_INDEX
+    BUNDLE: str | None = conf.BUNDLE
+    EFFECTS: bool = conf.EFFECTS
+    EFFECTS_LEVEL: int | str = conf.EFFECTS_LEVEL
+    EFFECTS_CACHE: str | None = conf.EFFECTS_CACHE
 
-    meta_path = classproperty(lambda cls: (_ for _ in sys.meta_path if isinstance(_, cls)))
+    meta_path = classproperty(lambda cls: (_ for _ in __stack__.finders if isinstance(_, cls)))
     __finders__: list[Finder] = []
 
     __refs: int = 0
+    __lock: RLock = RLock()  # Serializes entering and exiting finders (refs, the Stack and sys.meta_path).
     refs = property(lambda self: self.__refs)
     specs: dict[str, Spec]
 
+    __rules: Rules | None = None
+
     def __init__(self, **CONF):
         assert None is debug.traced(3, f"[{oid(self)}] INIT {self.__class__.__name__} count:{len(self.__finders__)}")
 
@@ -65,30 +80,32 @@ class Finder(MetaPathFinder):
             )
 
     def __enter__(self) -> Finder:
-        if self.__refs == 0:
-            assert None is debug.traced(
-                2,
-                f"[{oid(self)}] HOOK {self.__class__.__name__} refs:{self.__refs} "
-                f"inst:{len(list(self.meta_path))} sys:{len(sys.meta_path)} "
-            )
-            sys.meta_path.insert(0, self)
-
-        self.__refs += 1
-        return self
+        with Finder.__lock:
+            if self.__refs == 0:
+                assert None is debug.traced(
+                    2,
+                    f"[{oid(self)}] HOOK {self.__class__.__name__} refs:{self.__refs} "
+                    f"inst:{len(list(self.meta_path))} sys:{len(sys.meta_path)} "
+                )
+                __stack__.push(self)
+
+            self.__refs += 1
+            return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.__refs = max(self.__refs - 1, 0)
+        with Finder.__lock:
+            self.__refs = max(self.__refs - 1, 0)
 
-        if self.__refs == 0 and self in sys.meta_path:
-            sys.meta_path.remove(self)
-            if self.CONTEXT_INVALIDATION:
-                self.invalidate_caches()
+            if self.__refs == 0 and self in __stack__.finders:
+                __stack__.pop(self)
+                if self.CONTEXT_INVALIDATION:
+                    self.invalidate_caches()
 
-        assert None is debug.traced(
-            2,
-            f"[{oid(self)}] EXIT {self.__class__.__name__} refs:{self.__refs} "
-            f"inst:{len(list(self.meta_path))} sys:{len(sys.meta_path)} "
-        )
+            assert None is debug.traced(
+                2,
+                f"[{oid(self)}] EXIT {self.__class__.__name__} refs:{self.__refs} "
+                f"inst:{len(list(self.meta_path))} sys:{len(sys.meta_path)} "
+            )
 
     @classmethod
     def lazy(cls, name: str, package: str | None = None, **CONF) -> ModuleType:
@@ -99,47 +116,203 @@ class Finder(MetaPathFinder):
         with __finder__:
             return import_module(name, package)
 
+    @staticmethod
+    def materialize(module: ModuleType) -> ModuleType:
+        """Execute a lazy module (or resolve a deferred `from` import) now, in the calling thread.
+        """
+        if type(module) is Deferred:
+            return resolve(module)
+
+        if (
+                isinstance(loader := getattr(spec := getattr(module, "__spec__", None), "loader", None), Loader)
+                and spec.loader_state is Loader.State.LAZY and loader.module is not None
+        ):
+            loader.exec_module(loader.module, True)
+
+        return module
+
+    async def aimport(self, name: str, package: str | None = None) -> ModuleType:
+        """Import and materialize a module in a worker thread, without blocking the event loop.
+
+        The finder is entered from the worker thread for the duration of the import. As with
+        `with finder:`, the meta path is process-wide: imports made by other threads meanwhile
+        also go through it.
+        """
+        import asyncio
+        return await asyncio.to_thread(self._aimport, name, package)
+
+    def _aimport(self, name: str, package: str | None) -> ModuleType:
+        with self:
+            return self.materialize(import_module(name, package))
+
+    @classmethod
+    async def ensure(cls, module: ModuleType) -> ModuleType:
+        """Materialize an imported lazy module (or deferred import) in a worker thread, see `aimport()`.
+        """
+        import asyncio
+        return await asyncio.to_thread(cls.materialize, module)
+
+    def batch(self, names: Iterable[str], package: str | None = None, workers: int | None = None) -> list[ModuleType]:
+        """Import modules, after resolving them and staging their code in a thread pool, see `lazi.core.batch`.
+        """
+        from .batch import stage
+
+        names = [resolve_name(name, package) for name in names]
+        every = {name[:index] for name in names for index, char in enumerate(f"{name}.") if char == "."}  # + parents.
+        specs: dict[str, Spec] = {}
+
+        with self:
+            for name in sorted(every, key=lambda _: _.count(".")):
+                if name in sys.modules:
+                    continue
+
+                if parent := name.rpartition(".")[0]:
+                    if (module := sys.modules.get(parent)) is not None:
+                        path = getattr(module, "__path__", None)
+                    else:
+                        path = pspec.submodule_search_locations if (pspec := specs.get(parent)) is not None else None
+                    if path is None:
+                        continue
+                else:
+                    path = None
+
+                if (spec := __stack__.find_spec(name, path)) is not None:
+                    specs[name] = spec
+
+            stage(list(specs.values()), workers)
+            return [import_module(name) for name in names]
+
+    def warmup(self, names: Iterable[str] | str, freeze: bool = False) -> list[str]:
+        """Materialize lazy modules (or those of a recording) before forking workers, see `lazi.core.warmup`.
+        """
+        from .warmup import __warmup__
+        return __warmup__.run(self, names, freeze)
+
     def find_spec(self, name: str, path: list[str] | None = None, target: ModuleType | None = None) -> Spec | None:
-        assert None is debug.traced(
-            4 if target is None else 1,
-            f"[{oid(self)}] SPEC FIND {name}"
-        )
+        assert debug.TRACE <= 1 or debug.event(4 if target is None else 1, "SPEC", "[{0!o}] SPEC FIND {1}", self, name)
 
         if (spec := self.specs.get(name)) is not None:
-            assert None is debug.traced(
-                4 if target is None else 1,
-                f"[{oid(self)}] SPEC FOUN {name}"
-            )
+            assert debug.TRACE <= 1 or debug.event(4 if target is None else 1, "SPEC", "[{0!o}] SPEC FOUN {1}", self, name)
             return spec
 
         if (spec := self._find_spec(name, path, target)) is not None:
+            if self.EFFECTS and target is None:
+                self.effects.scan(name, spec)
+
             spec = self.specs[name] = self.Spec(self, spec, path, target)
+            self.Loader.count(spec)
 
-            assert None is debug.traced(
-                1,
-                f"[{oid(self)}] FIND {spec.source_tag.ljust(4)} "
-                f"{spec.f_name} {'?' if spec.loader is None else ''}"
-            )
+            assert debug.TRACE <= 1 or debug.event(1, "FIND", "[{0!o}] FIND {1.source_tag:<4} {1.f_name}", self, spec)
 
         return spec
 
+    @property
+    def index(self) -> Index | None:
+        return Index.open(self.SPEC_INDEX) if self.SPEC_INDEX else None
+
+    @property
+    def effects(self) -> Effects:
+        return Effects.open(self.EFFECTS_CACHE)
+
+    @property
+    def bundle(self) -> Bundle | None:
+        return Bundle.open(self.BUNDLE) if self.BUNDLE else None
+
     def _find_spec(self, name: str, path: list[str] | None, target: ModuleType | None) -> ModuleSpec | None:
-        for finder in (_ for _ in sys.meta_path if not isinstance(_, self.__class__)):
+        if (bundle := self.bundle if target is None else None) is not None and (spec := bundle.find_spec(name, path)):
+            return spec
+
+        if (index := self.index if target is None else None) is not None and (spec := index.get(name, path)):
+            return spec
+
+        for finder in (_ for _ in sys.meta_path if not isinstance(_, (Finder, Stack))):
             if (spec := finder.find_spec(name, path, target)) is not None:
+                if index is not None and finder is PathFinder:
+                    index.add(name, path, spec)
                 return spec
 
+    @property
+    def rules(self) -> Rules:
+        if (
+                (rules := self.__rules) is None or rules.lazy is not self.LAZY
+                or len(rules) != len(self.LAZY) or rules.default != self.NO_LAZY
+        ):
+            rules = self.__rules = Rules(self.LAZY, self.NO_LAZY)
+        return rules
+
     def get_level(self, full_name: str) -> Spec.Level:
-        for name, level in self.LAZY.items():
-            if re.match(name, full_name):
-                return max(Spec.Level.get(level), self.NO_LAZY)
-        return self.NO_LAZY
+        level = self.rules(full_name)
+
+        if self.EFFECTS and full_name in self.effects.flagged:
+            level = max(Spec.Level.get(self.EFFECTS_LEVEL), level)
+
+        if (recovery := self.Loader.recovery) is not None and (learned := recovery.levels.get(full_name)) is not None:
+            level = max(learned, level)
+
+        return level
 
     def invalidate_caches(self) -> None:
         while self.specs:
-            if hasattr(loader := self.specs.popitem()[1].loader, "invalidate_caches"):
+            name, spec = self.specs.popitem()
+            if __stack__.specs.get(name) is spec:
+                del __stack__.specs[name]
+            self.Loader.count(spec, -1)
+            if hasattr(loader := spec.loader, "invalidate_caches"):
                 loader.invalidate_caches()
 
 
+class Stack(MetaPathFinder):
+    """The one sys.meta_path entry for all entered Finders.
+
+    Entered Finders are stacked as overlays: lookups go through one spec cache shared by all
+    layers, and the top layer only decides the level of the specs it creates (or that were
+    found but not created yet, which it finds again if its level differs). Lookup cost doesn't
+    depend on the nesting depth.
+    """
+    finders: list[Finder]       # Entered Finders, innermost last.
+    specs: dict[str, Spec]      # Shared spec cache (the specs are owned by the Finder that found them).
+
+    def __init__(self):
+        self.finders = []
+        self.specs = {}
+
+    def push(self, finder: Finder) -> None:
+        self.finders.append(finder)
+        if not sys.meta_path or sys.meta_path[0] is not self:
+            if self in sys.meta_path:
+                sys.meta_path.remove(self)
+            sys.meta_path.insert(0, self)
+
+    def pop(self, finder: Finder) -> None:
+        self.finders.remove(finder)
+        if not self.finders and self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name: str, path: list[str] | None = None, target: ModuleType | None = None) -> Spec | None:
+        if not (finders := self.finders):
+            return None
+
+        if (spec := self.specs.get(name)) is None or target is not None:
+            if (spec := finders[-1].find_spec(name, path, target)) is not None and target is None:
+                self.specs.setdefault(name, spec)
+            return spec
+
+        if (
+                (top := finders[-1]) is not spec.finder and spec.loader_state is Loader.State.INIT
+                and top.get_level(spec.p_name) != spec.level
+        ):
+            # The hook, loader and counters follow from the level: let the top layer build its own spec.
+            if (spec := top.find_spec(name, path)) is not None:
+                self.specs[name] = spec
+
+        return spec
+
+    def invalidate_caches(self) -> None:
+        for finder in list(self.finders):
+            finder.invalidate_caches()
+
+
+__stack__: Stack = Stack()
 __finder__: Finder = Finder()
 
 atexit.register(lambda: [finder.invalidate_caches() for finder in Finder.__finders__])
@@ -0,0 +1,159 @@
+"""Import graph recorder.
+
+Records, for hooked modules:
+
+- "import" edges: the module whose code ran the import statement that created the spec.
+- "trigger" edges: the module whose code touched a LAZY proxy, and so caused its execution.
+- "nested" edges: the module whose execution was in progress when another one executed.
+
+plus the execution order and exec times (cumulative and self, as `lazi.core.prof` does).
+
+`critical()` is the chain of nested executions with the most self time: the import chain
+that startup waits on the longest. Export with `dump()` (JSON) or `dot()` (Graphviz), or set
+`conf.GRAPH` to a .json or .dot path to write it at exit.
+"""
+from __future__ import annotations
+
+import sys
+import json
+import atexit
+import threading
+from time import perf_counter_ns
+
+from lazi.conf import conf
+from lazi.util import atomic_write
+
+from .loader import SKIP_FRAMES
+from .prof import Nested
+
+__all__ = "Graph", "__graph__"
+
+
+def caller() -> str | None:
+    """Name of the module running the code that called into the import machinery (or lazi).
+    """
+    frame = sys._getframe(2)
+
+    while frame is not None and frame.f_code.co_filename.startswith(SKIP_FRAMES):
+        frame = frame.f_back
+
+    return frame.f_globals.get("__name__") if frame is not None else None
+
+
+class Graph(Nested):
+    nodes: dict[str, dict]                  # Name -> level, created offset, exec stats.
+    edges: dict[tuple[str, str, str], int]  # (source, target, kind) -> count.
+    order: list[str]                        # Execution (materialization) order.
+    records: list[tuple[str, str | None, int, int, int]]  # (name, parent exec, start, wall, wall_self), by completion.
+    ready: int | None = None                # Offset of the end of startup, if marked.
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.nodes, self.edges, self.order = {}, {}, []
+        super().__init__()
+
+    def edge(self, source: str | None, target: str, kind: str) -> None:
+        if source is not None and source != target:
+            with self.lock:
+                self.edges[key] = self.edges.get(key := (source, target, kind), 0) + 1
+
+    def create(self, spec, /) -> None:
+        self.nodes.setdefault(spec.name, dict(
+            level=spec.level.name, created=perf_counter_ns() - self.start, executed=None,
+            lazy=False, wall=0, wall_self=0, error=None,
+        ))
+        self.edge(caller(), spec.name, "import")
+
+    def enter(self, spec, lazy: bool, /) -> list:
+        if lazy:
+            self.edge(caller(), spec.name, "trigger")
+
+        if stack := self.stack:
+            self.edge(stack[-1][0].name, spec.name, "nested")
+
+        self.order.append(spec.name)
+        return super().enter(spec, lazy)
+
+    def measure(self) -> tuple[int]:
+        return perf_counter_ns(),
+
+    def record(self, spec, depth, lazy, parent, start, total, self_, error, /) -> None:
+        self.records.append((spec.name, parent, start := start[0] - self.start, total[0], self_[0]))
+
+        if (node := self.nodes.get(spec.name)) is not None:
+            node.update(
+                executed=start, lazy=lazy, wall=total[0], wall_self=self_[0],
+                error=type(error).__name__ if error is not None else None,
+            )
+
+    def mark(self) -> None:
+        """Mark the end of startup: `critical()` only considers executions that started before.
+        """
+        self.ready = perf_counter_ns() - self.start
+
+    def clear(self) -> None:
+        super().clear()
+        self.nodes, self.edges, self.order = {}, {}, []
+        self.ready = None
+
+    def critical(self) -> list[tuple[str, int, int]]:
+        """Chain of nested executions, from a top-level one, with the most self time: [(name, wall_self, wall)].
+        """
+        below: dict[str, tuple[int, list]] = {}  # Parent exec name -> heaviest chain of its nested execs.
+        best: tuple[int, list] = (0, [])
+
+        for name, parent, start, wall, wall_self in self.records:  # Completion order: nested execs first.
+            if self.ready is not None and start > self.ready:
+                continue
+
+            total, chain = below.pop(name, (0, []))
+            total, chain = total + wall_self, [(name, wall_self, wall), *chain]
+
+            if parent is None:
+                best = max(best, (total, chain), key=lambda _: _[0])
+            elif total > below.get(parent, (-1,))[0]:
+                below[parent] = total, chain
+
+        return best[1]
+
+    def dump(self) -> dict:
+        return dict(
+            argv=sys.argv,
+            ready=self.ready,
+            total=perf_counter_ns() - self.start,
+            nodes=self.nodes,
+            edges=[dict(source=s, target=t, kind=k, count=c) for (s, t, k), c in self.edges.items()],
+            order=self.order,
+            critical=[dict(name=n, wall_self=s, wall=w) for n, s, w in self.critical()],
+        )
+
+    def dot(self) -> str:
+        critical = [name for name, *_ in self.critical()]
+        path = set(zip(critical, critical[1:]))
+        style = {"import": "solid", "trigger": "dashed", "nested": "dotted"}
+        names = {name for edge in self.edges for name in edge[:2]} | set(self.nodes)
+
+        lines = ["digraph lazi {", "  rankdir=LR;", '  node [shape=box, fontname="monospace"];']
+
+        for name in sorted(names):
+            node = self.nodes.get(name)
+            label = f"{name}\\n{node['wall_self'] / 1e6:.2f} ms" if node and node["executed"] is not None else name
+            color = ", color=red" if name in critical else ", style=dashed" if node is None else ""
+            lines.append(f'  "{name}" [label="{label}"{color}];')
+
+        for (source, target, kind), count in sorted(self.edges.items()):
+            color = ", color=red" if kind == "nested" and (source, target) in path else ""
+            lines.append(f'  "{source}" -> "{target}" [style={style[kind]}{color}];')
+
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str) -> None:
+        atomic_write(path, self.dot() if path.endswith(".dot") else json.dumps(self.dump(), indent=1))
+
+
+__graph__: Graph = Graph()
+
+if conf.GRAPH:
+    __graph__.install()
+    atexit.register(__graph__.save, conf.GRAPH)
@@ -0,0 +1,147 @@
+"""Persistent spec index.
+
+Remembers what `PathFinder` resolved (name -> loader type, origin, cached, search locations)
+so that later runs can build specs without scanning `sys.path`.
+
+The index is keyed by `sys.path` and the other meta path finders, and each entry is validated
+against the mtimes of the directories it was resolved from (checked once per directory per run).
+Stale entries are simply ignored and re-resolved by the regular finders.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import marshal
+from importlib.machinery import ModuleSpec, SourceFileLoader, SourcelessFileLoader, ExtensionFileLoader
+
+from lazi.util import debug, atomic_write, Persistent
+
+__all__ = "Index",
+
+VERSION = 1
+
+Entry = tuple[str, str, str | None, tuple[str, ...] | None, tuple[str, ...] | None]  # loader, origin, cached, locs, path
+
+
+class Index(Persistent):
+    LOADERS: dict[str, type] = {
+        cls.__name__: cls for cls in (SourceFileLoader, SourcelessFileLoader, ExtensionFileLoader)
+    }
+
+    path: str
+    key: tuple[tuple[str, ...], tuple[str, ...]]    # sys.path, meta path finder types.
+    sys_path: list[str]
+    entries: dict[str, Entry]
+    mtimes: dict[str, int | None]                   # Directory -> recorded mtime.
+    checked: dict[str, bool]                        # Directory -> mtime still matches (this run).
+    dirty: bool = False
+
+    def __init__(self, path: str):
+        self.path = path
+        self.key = self.keyof()
+        self.sys_path = list(self.key[0])
+        self.entries = {}
+        self.mtimes = {}
+        self.checked = {}
+        self.load()
+
+    @staticmethod
+    def keyof() -> tuple[tuple[str, ...], tuple[str, ...]]:
+        return tuple(sys.path), tuple(
+            f"{cls.__module__}.{cls.__qualname__}"
+            for cls in (_ if isinstance(_, type) else type(_) for _ in sys.meta_path)
+            if not cls.__module__.startswith("lazi.")
+        )
+
+    @staticmethod
+    def mtime(path: str) -> int | None:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "rb") as file:
+                version, key, mtimes, entries = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            assert None is debug.traced(1, f"[INDEX] MISS {self.path} {type(e).__name__}")
+            return
+
+        if version != VERSION or key != self.key:
+            assert None is debug.traced(1, f"[INDEX] STAL {self.path} key")
+            return
+
+        if any(self.mtime(_) != mtimes.get(_, False) for _ in key[0]):  # Shadowing in a sys.path entry.
+            assert None is debug.traced(1, f"[INDEX] STAL {self.path} sys.path")
+            return
+
+        self.mtimes = mtimes
+        self.entries = entries
+        self.checked = {_: True for _ in key[0]}
+
+        assert None is debug.traced(1, f"[INDEX] LOAD {self.path} {len(entries)}")
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+
+        try:
+            atomic_write(self.path, marshal.dumps((VERSION, self.key, self.mtimes, self.entries)))
+        except OSError as e:
+            assert None is debug.traced(0, f"[INDEX] SAVE {self.path} !!!! {type(e).__name__}: {e}")
+        else:
+            self.dirty = False
+            assert None is debug.traced(1, f"[INDEX] SAVE {self.path} {len(self.entries)}")
+
+    def valid(self, directory: str) -> bool:
+        if (valid := self.checked.get(directory)) is None:
+            valid = self.checked[directory] = self.mtime(directory) == self.mtimes.get(directory, False)
+        return valid
+
+    def dirs(self, origin: str, path: list[str] | None) -> list[str]:
+        return [os.path.dirname(origin), *(path if path is not None else self.key[0])]
+
+    def get(self, name: str, path: list[str] | None) -> ModuleSpec | None:
+        if (entry := self.entries.get(name)) is None:
+            return None
+
+        loader, origin, cached, locations, s_path = entry
+
+        if (
+                s_path != (tuple(path) if path is not None else None)
+                or sys.path != self.sys_path
+                or not all(self.valid(_) for _ in self.dirs(origin, path))
+        ):
+            del self.entries[name]
+            self.dirty = True
+            return None
+
+        spec = ModuleSpec(name, self.LOADERS[loader](name, origin), origin=origin, is_package=locations is not None)
+        spec.submodule_search_locations = list(locations) if locations is not None else None
+        spec.has_location = True
+        spec.cached = cached
+        return spec
+
+    def add(self, name: str, path: list[str] | None, spec: ModuleSpec) -> None:
+        if (
+                (loader := type(spec.loader).__name__) not in self.LOADERS
+                or type(spec.loader) is not self.LOADERS[loader]
+                or not spec.has_location or spec.origin is None
+                or sys.path != self.sys_path
+        ):
+            return
+
+        for directory in (*self.dirs(spec.origin, path), *self.sys_path):
+            if directory not in self.mtimes:
+                self.mtimes[directory] = self.mtime(directory)
+                self.checked[directory] = True
+
+        locations = spec.submodule_search_locations
+        self.entries[name] = (
+            loader, spec.origin, spec.cached,
+            tuple(locations) if locations is not None else None,
+            tuple(path) if path is not None else None,
+        )
+        self.dirty = True
+
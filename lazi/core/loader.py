@@ -6,27 +6,69 @@ Various methods have been tried here. During investigation of PEP 302,
 """
 from __future__ import annotations
 
+import os
+import sys
+import importlib
 from sys import modules
 from types import ModuleType
 from typing import ForwardRef
 from enum import IntEnum
 from importlib.abc import Loader as _Loader
+from importlib._bootstrap import _get_module_lock, _DeadlockError  # noqa: Shared with importlib.
+from threading import get_ident, Lock
+from collections import Counter
 
+from lazi.conf import conf
 from lazi.util import debug, oid
 
 __all__ = "Loader",
 
+SKIP_FRAMES = (  # Import machinery frames between an import statement and the loader.
+    "<frozen importlib",
+    os.path.dirname(importlib.__file__) + os.sep,
+    os.path.dirname(os.path.dirname(__file__)) + os.sep,
+)
+
 Spec = ForwardRef("Spec")
 Module = ForwardRef("Module")
+Deferred = ForwardRef("Deferred")
+Recovery = ForwardRef("Recovery")
+
+
+class Loader:
+    """Lazy loader wrapping the loader of a hooked spec.
 
+    Slotted (and registered as an `importlib.abc.Loader`), since there is one per hooked module.
+    """
+    __slots__ = (
+        "spec", "loader", "module", "error", "binders", "rebound", "deferred", "__busy", "__exec", "__forc",
+    )
 
-class Loader(_Loader):
     spec: Spec
     loader: _Loader
-    module: Module | None = None
+    module: Module | None
+
+    hooks: tuple[Loader.Hook, ...] = ()  # Module execution observers, see `Loader.Hook`.
+
+    error: BaseException | None         # Exception that left the module PART or DEAD.
+
+    counts: Counter = Counter()         # Finder specs by loader state, plus "spec" and "hook" totals (see `Stat`).
+    __lock: Lock = Lock()
+
+    REBIND: bool = conf.REBIND
+    binders: list[dict] | None          # Globals of the modules the proxy was bound into (REBIND).
+    rebound: set[str] | None            # Module namespaces already rebound, by `__name__` (REBIND).
+
+    LAZY_FROM: bool = conf.LAZY_FROM
+    deferred: dict[str, Deferred] | None  # Deferred `from` imports of this module, by name (LAZY_FROM).
+
+    RELEASE: bool = conf.RELEASE
+
+    recovery: Recovery | None = None    # Retries failed lazy materializations eagerly, see `lazi.core.recover`.
 
-    __busy: bool = False
-    __forc: bool = False
+    __busy: int | None  # Thread creating the module.
+    __exec: int | None  # Thread executing the module.
+    __forc: bool
 
     class State(IntEnum):
         __str__ = lambda self: self.name
@@ -50,11 +92,70 @@ class Loader(_Loader):
             self.exc = exc
             super().__init__(msg)
 
+    class Hook:
+        """Observer of hooked module creation and `exec_module` materializations.
+
+        `enter()` is called right before the wrapped loader executes the module, and its
+        return value is handed back to `leave()` along with the exception, if any.
+        """
+
+        def create(self, spec: Spec, /) -> None:
+            pass
+
+        def enter(self, spec: Spec, lazy: bool, /) -> object:
+            pass
+
+        def leave(self, spec: Spec, token: object, error: BaseException | None, /) -> None:
+            pass
+
+    @classmethod
+    def hook(cls, hook: Loader.Hook) -> None:
+        if hook not in cls.hooks:
+            cls.hooks += hook,
+
+    @classmethod
+    def unhook(cls, hook: Loader.Hook) -> None:
+        cls.hooks = tuple(_ for _ in cls.hooks if _ is not hook)
+
+    @classmethod
+    def count(cls, spec: Spec, sign: int = 1, /) -> None:
+        """Add (or remove, with -1) a Finder spec to the counters.
+        """
+        with Loader.__lock:
+            (counts := Loader.counts)["spec"] += sign
+            counts["hook"] += sign if isinstance(spec.loader, Loader) else 0
+            counts[Loader.key(spec.loader_state)] += sign
+
+    @staticmethod
+    def key(state) -> Loader.State | str | None:
+        return state if state is None or isinstance(state, Loader.State) else "wtaf"
+
+    def state(self, state: Loader.State | None, /, unhook: bool = False) -> None:
+        """Set the spec's loader state, and update the counters.
+        """
+        spec = self.spec
+
+        with Loader.__lock:
+            (counts := Loader.counts)[spec.loader_state] -= 1
+            counts[state] += 1
+            counts["hook"] -= 1 if unhook else 0
+
+        spec.loader_state = state
+
     def __init__(self, spec: Spec):
         self.spec = spec
         self.loader = spec.loader
+        self.module = self.error = None
+        self.binders = self.rebound = self.deferred = None  # Allocated on first use.
+        self.__busy = self.__exec = None
+        self.__forc = False
         spec.loader_state = Loader.State.INIT
 
+    # InspectLoader methods of the wrapped loader, for runpy (`python -m lazi -m pkg.mod`), linecache and pkgutil.
+    get_code = lambda self, fullname: self.loader.get_code(fullname)
+    get_source = lambda self, fullname: self.loader.get_source(fullname)
+    is_package = lambda self, fullname: self.loader.is_package(fullname)
+
     def _create_module(self) -> ModuleType | None:
         return self.loader.create_module(self.spec)
 
@@ -62,10 +163,10 @@ class Loader(_Loader):
         spec: Spec = spec if spec is not None else self.spec
         assert spec.loader is self, (spec.loader, self)
 
-        if self.__busy:
+        if self.__busy == get_ident():
             return None
 
-        self.__busy = True
+        self.__busy = get_ident()
 
         try:
             module = spec.target if spec.target is not None else self._create_module()
@@ -73,7 +174,10 @@ class Loader(_Loader):
             module = ModuleType(spec.name) if module is None else module
             module = spec.finder.Module(spec, module) if not isinstance(module, spec.finder.Module) else module
 
-            spec.loader_state = Loader.State.CREA
+            self.state(Loader.State.CREA)
+
+            for hook in self.hooks:
+                hook.create(spec)
 
             if spec.level > spec.Level.LAZY:
                 self.__forc = spec.level > spec.level.SWAP
@@ -82,7 +186,7 @@ class Loader(_Loader):
                     module = spec.target
 
                 if spec.level >= spec.Level.UNLO:
-                    spec.loader_state = None
+                    self.state(None, unhook=True)
                     module.__loader__ = self.loader
                     spec.loader = self.loader
                     spec.target = None
@@ -91,9 +195,51 @@ class Loader(_Loader):
             return module
 
         finally:
-            self.__busy = False
+            self.__busy = None
 
     def exec_module(self, module: Module, force: bool | None = None, /):
+        if force and (state := self.spec.loader_state) in (Loader.State.LAZY, Loader.State.EXEC):
+            # Materialization can race with other threads: serialize it on the same per-module lock that
+            #  importlib uses, so that one thread executes the module while the others wait for it to finish.
+
+            if state is Loader.State.EXEC and self.__exec == get_ident():
+                return  # Circular access: the module is partially initialized, as with a regular circular import.
+
+            lock = _get_module_lock(self.spec.name)
+
+            try:
+                lock.acquire()
+            except _DeadlockError:
+                return  # Cyclic materialization across threads: same as importlib's `_lock_unlock_module()`.
+
+            retry = None
+
+            try:
+                if (state := self.spec.loader_state) is Loader.State.LAZY:
+                    if (recovery := Loader.recovery) is None:
+                        return self._exec_module(module, force)
+
+                    mark = recovery.mark()
+
+                    try:
+                        return self._exec_module(module, force)
+                    except Loader.Exception as e:
+                        if (retry := recovery.prepare(self, mark, e)) is None:
+                            raise
+            finally:
+                lock.release()
+
+            if retry is not None:
+                return recovery.recover(self, *retry)  # Without the module lock, see `Recovery.recover()`.
+
+            if state in (Loader.State.PART, Loader.State.DEAD) and (error := self.error) is not None:
+                raise Loader.Error(self, error, f"Error loading {self.spec.f_name} (in another thread)") from error
+
+            return
+
+        self._exec_module(module, force)
+
+    def _exec_module(self, module: Module, force: bool | None = None, /):
         spec = self.spec
         lazy = not ((force or self.__forc) if force is not None else self.__forc)
 
@@ -123,32 +269,47 @@ class Loader(_Loader):
             if mod is not None and mod is not target:
                 spec.target = target = mod
 
-        assert None is debug.traced(
-            1,  # if nexts is Loader.State.EXEC else 2,
-            f"[{oid(module)}] {state} {nexts} [{oid(target) if target is not None else '*'*15}] {name_} "
-            f"{'>>>> ' if nexts is Loader.State.EXEC else '.... '}"
+        assert debug.TRACE <= 1 or debug.event(
+            1, "EXEC", "[{0!o}] {1} {2} [{3!o}] {4} {5}",
+            module, state, nexts, target, name_, ">>>> " if nexts is Loader.State.EXEC else ".... ",
         )
 
-        spec.loader_state = nexts
+        self.state(nexts)
 
         if nexts <= Loader.State.LAZY:
+            if self.REBIND:
+                self.bind()
             return
 
+        if hooks := self.hooks:
+            tokens = [hook.enter(spec, state is Loader.State.LAZY) for hook in hooks]
+
+        self.__exec = get_ident()
+        error = None
+
         try:
-            self.loader.exec_module(target if target is not None else module)
+            try:
+                self.loader.exec_module(target if target is not None else module)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self.__exec = None
+                if hooks:
+                    for hook, token in zip(reversed(hooks), reversed(tokens)):
+                        hook.leave(spec, token, error)
 
             state = nexts
-            spec.loader_state = nexts = Loader.State.LOAD
+            self.state(nexts := Loader.State.LOAD)
             target = spec.target
 
-            assert None is debug.traced(
-                1,  # if nexts is Loader.State.LOAD else 2,
-                f"[{oid(module)}] {state} {nexts} [{oid(target) if target is not None else '*'*15}] {name_} "
-                f"++++ "
+            assert debug.TRACE <= 1 or debug.event(
+                1, "LOAD", "[{0!o}] {1} {2} [{3!o}] {4} ++++ ", module, state, nexts, target, name_
             )
 
         except Exception as e:
-            spec.loader_state = nexts = Loader.State.DEAD if not isinstance(e, Loader.Exception) else Loader.State.PART
+            self.error = e
+            self.state(nexts := Loader.State.DEAD if not isinstance(e, Loader.Exception) else Loader.State.PART)
 
             assert None is debug.traced(
                 0 if not isinstance(e, ImportError) else 1,
@@ -176,11 +337,93 @@ class Loader(_Loader):
             if mod is not None and mod is not spec.target:
                 spec.target = mod
 
+        if self.REBIND:
+            self.rebind()
+
+        if self.RELEASE and spec.level >= spec.Level.UNMO:
+            self.release()
+
+    def release(self) -> None:
+        """Drop the lazi state of a loaded module (RELEASE).
+
+        Unwrapped (UNMO) modules get their own loader back, as UNLO modules do at creation, and this
+        loader is no longer referenced. Proxies that other threads may still be accessing (SWAP) only
+        drop their REBIND and LAZY_FROM state.
+        """
+        spec = self.spec
+        self.binders = self.rebound = self.deferred = None
+
+        if spec.level < spec.Level.UNMO or spec.loader_state is not Loader.State.LOAD:
+            return
+
+        if (module := spec.target) is not None and getattr(module, "__loader__", None) is self:
+            module.__loader__ = self.loader
+
+        self.state(None, unhook=True)
+        spec.loader = self.loader
+        spec.target = None
+        self.module = None
+
+        assert None is debug.traced(2, f"[{oid(self)}] FREE {spec.f_name}")
+
+    def bind(self) -> None:
+        """Remember the globals of the module importing this one (REBIND).
+        """
+        frame = sys._getframe(1)
+
+        while frame is not None and frame.f_code.co_filename.startswith(SKIP_FRAMES):
+            frame = frame.f_back
+
+        if frame is not None:
+            if self.binders is None:
+                self.binders = []
+            self.binders.append(frame.f_globals)
+
+    def rebind(self, *namespaces: dict) -> None:
+        """Replace references to the proxy with the loaded module (REBIND).
+
+        Covers `sys.modules`, the parent package, the globals recorded by `bind()` and any given namespaces.
+        Each module namespace is only scanned once (by name: ids of freed dicts get reused).
+        """
+        spec, proxy = self.spec, self.module
+
+        if (target := spec.target) is None or proxy is None or proxy is target:
+            return
+
+        if modules.get(spec.name) is proxy:
+            modules[spec.name] = target
+
+        if (parent := modules.get(spec.parent)) is not None and spec.parent != spec.name:
+            parent = getattr(object.__getattribute__(parent, "__spec__"), "target", None) or parent
+            namespaces += object.__getattribute__(parent, "__dict__"),
+
+        if self.binders:
+            namespaces += tuple(self.binders)
+            self.binders.clear()
+
+        if (rebound := self.rebound) is None:
+            rebound = self.rebound = set()
+
+        for namespace in namespaces:
+            if (key := namespace.get("__name__")) is not None:
+                if key in rebound:
+                    continue
+                rebound.add(key)
+
+            for name in [name for name, value in list(namespace.items()) if value is proxy]:  # Live globals.
+                namespace[name] = target
+                assert None is debug.traced(
+                    2, f"[{oid(proxy)}] BIND [{oid(target)}] {spec.f_name} -> {namespace.get('__name__', '?')}.{name}"
+                )
+
     def invalidate_caches(self, keep: bool = False) -> None:
         spec = self.spec
         mod = self.module
         state = "KEEP" if keep else "None"
 
+        if (recovery := Loader.recovery) is not None:
+            recovery.drop(spec)
+
         if (mod_sys := modules.get(spec.name, none := object())) is mod or mod_sys is spec.target:
             modules.pop(spec.name)
             if keep:
@@ -202,7 +445,11 @@ class Loader(_Loader):
         spec.loader = self.loader
         spec.loader_state = None  # type: ignore
         spec.target = None
+        self.binders = self.rebound = self.deferred = None
         self.__forc = False
         self.module = None
         self.spec = None  # type: ignore
         self.loader = None  # type: ignore
+
+
+_Loader.register(Loader)
@@ -0,0 +1,99 @@
+"""Lazi memory accounting.
+
+Records the net memory allocated by every hooked module execution, split into self and
+cumulative size for nested materializations (like `lazi.core.prof` does for time):
+
+- 1: tracemalloc traced memory (Python allocations; starts tracemalloc, which slows allocations down).
+- 2: Resident set size (whole process, page granularity; cheap, but includes allocator slack).
+     Read from /proc/self/statm, so Linux only: elsewhere, use 1.
+
+Both are process-wide: allocations of other threads during an execution are attributed to it.
+
+Enable with `conf.MEMORY`, read the results with `lazi.core.stat.Mem`.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import tracemalloc
+from dataclasses import dataclass
+
+from lazi.conf import conf
+
+from .prof import Nested
+
+__all__ = "MemRecord", "Memory", "rss", "__memory__"
+
+PAGE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+STATM = "/proc/self/statm"
+
+
+def rss() -> int:
+    """Current resident set size (bytes).
+
+    Not `ru_maxrss`, where there is no /proc: that's the peak, and deltas of it are meaningless.
+    """
+    with open(STATM, "rb") as file:
+        return int(file.read().split()[1]) * PAGE
+
+
+def traced() -> int:
+    return tracemalloc.get_traced_memory()[0]
+
+
+@dataclass(slots=True, frozen=True)
+class MemRecord:
+    name: str
+    depth: int                  # Materialization nesting depth (per thread).
+    lazy: bool                  # Deferred (LAZY -> EXEC) or eager (CREA -> EXEC).
+    size: int                   # Cumulative net allocation (bytes).
+    size_self: int              # Net allocation minus nested materializations (bytes).
+    error: str | None = None    # Exception type name, if the execution failed.
+    thread: int = 0
+
+
+class Memory(Nested):
+    mode: int
+    records: list[MemRecord]
+
+    __trace: bool = False   # Started tracemalloc.
+
+    def __init__(self, mode: int = 1):
+        super().__init__()
+        self.mode = mode
+
+    def measure(self) -> tuple[int]:
+        return (traced() if self.mode == 1 else rss()),
+
+    def record(self, spec, depth, lazy, parent, start, total, self_, error, /) -> None:
+        self.records.append(MemRecord(
+            spec.name, depth, lazy, total[0], self_[0],
+            type(error).__name__ if error is not None else None, threading.get_ident(),
+        ))
+
+    def install(self) -> Memory:
+        if self.mode not in (1, 2):
+            raise ValueError(f"Invalid memory accounting mode: {self.mode}")
+
+        if self.mode == 2 and not os.path.exists(STATM):
+            raise ValueError(f"Memory accounting mode 2 (RSS) needs {STATM}, use mode 1 (tracemalloc)")
+
+        if self.mode == 1 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__trace = True
+        return super().install()
+
+    def uninstall(self) -> Memory:
+        super().uninstall()
+        if self.__trace:
+            tracemalloc.stop()
+            self.__trace = False
+        return self
+
+
+__memory__: Memory = Memory(conf.MEMORY or 1)
+
+if conf.MEMORY:
+    __memory__.install()
@@ -1,12 +1,17 @@
+import sys
 from types import ModuleType
-from typing import ForwardRef
 
-from lazi.util import debug, oid
+from lazi.util import debug
+
+from .spec import Spec
+from .loader import Loader
+from .defer import Deferred
 
 __all__ = "Module",
 
-Spec = ForwardRef("Spec")
-Loader = ForwardRef("Loader")
+# Enum member lookups are slow on the proxy hot path, so bind them once.
+LAZY, EXEC, LOAD = Loader.State.LAZY, Loader.State.EXEC, Loader.State.LOAD
+SWAP = Spec.Level.SWAP
 
 # See https://peps.python.org/pep-0451/#attributes
 MODULE_SPEC_ATTR_MAP = dict(
@@ -56,9 +61,8 @@ class Module(ModuleType):
                 return spec
             return super().__getattribute__(attr)
 
-        assert None is debug.traced(
-            3, f"[{oid(self)}] {spec.loader_state} .... [{oid(target) if target is not None else '*' * 15}] "
-               f"{spec.f_name} {attr}"
+        assert debug.TRACE <= 3 or debug.event(
+            3, "GETA", "[{0!o}] {1.loader_state} .... [{2!o}] {1.f_name} {3}", self, spec, target, attr
         )
 
         if attr in GETATTR_PASS and (index := GETATTR_PASS.index(attr)) >= 0:
@@ -67,24 +71,31 @@ class Module(ModuleType):
         if attr in MODULE_SPEC_ATTR_MAP:
             return target.__getattribute__(attr)
 
-        swap = False
+        if (state := spec.loader_state) <= LAZY or state is EXEC:
+            if state is LAZY and spec.loader.LAZY_FROM and (
+                deferred := Deferred.imported(self, spec, attr, sys._getframe(1))
+            ) is not None:
+                return deferred
 
-        if spec.loader_state <= spec.loader.State.LAZY:
-            assert None is debug.trace(
-                f"[{oid(self)}] {spec.loader_state} >>>> [{oid(target) if target is not None else '*' * 15}] "
-                f"{spec.f_name} {attr}"
+            assert debug.TRACE <= 0 or debug.event(
+                0, "GETX", "[{0!o}] {1.loader_state} >>>> [{2!o}] {1.f_name} {3}", self, spec, target, attr
             )
             spec.loader.exec_module(self, True)
-            swap = spec.level >= spec.Level.SWAP
 
         valu = spec.target.__getattribute__(attr)  # NB: Don't use `target` here, as it may have changed.
 
-        if swap:
+        if spec.loader_state is LOAD and spec.loader.REBIND:
+            spec.loader.rebind(sys._getframe(1).f_globals)  # The accessing module still references the proxy.
+
+        if spec.level is SWAP and spec.loader_state is LOAD:  # Also swaps after materialization by other threads.
             self_dict = super().__getattribute__("__dict__")
             target_dict = spec.target.__getattribute__("__dict__")
             self_dict.update(target_dict)
             super().__setattr__("__class__", ModuleType)
 
+            if spec.loader.RELEASE:
+                spec.loader.release()
+
         return valu
 
     def __setattr__(self, attr, valu):
@@ -95,30 +106,28 @@ class Module(ModuleType):
 
         spec = super().__getattribute__("__spec__")
 
-        assert None is debug.traced(
-            3, f"[{oid(self)}] {spec.loader_state} .... [{oid(spec.target) if spec.target is not None else '*' * 15}] "
-               f"{spec.f_name} {attr} = [{oid(valu)}]"
+        assert debug.TRACE <= 3 or debug.event(
+            3, "SETA", "[{0!o}] {1.loader_state} .... [{1.target!o}] {1.f_name} {2} = [{3!o}]", self, spec, attr, valu
         )
 
         if (target := getattr(spec, "target", None)) is None:
             return super().__setattr__(attr, valu)
 
-        swap = False
-
-        if attr not in SETATTR_PASS and spec.loader_state <= spec.loader.State.LAZY:
-            assert None is debug.trace(
-                f"[{oid(self)}] {spec.loader_state} >>>> [{oid(target) if target is not None else '*' * 15}] "
-                f"{spec.f_name} {attr} = [{oid(valu)}]"
+        if attr not in SETATTR_PASS and ((state := spec.loader_state) <= LAZY or state is EXEC):
+            assert debug.TRACE <= 0 or debug.event(
+                0, "SETX", "[{0!o}] {1.loader_state} >>>> [{2!o}] {1.f_name} {3} = [{4!o}]", self, spec, target, attr, valu
             )
 
             target.__setattr__(attr, valu)  # Preload the variable? Yes: Fixes stdlib (asyncio.coroutines) errors in README.md.
             spec.loader.exec_module(self, True)
-            swap = spec.level >= spec.Level.SWAP
 
         spec.target.__setattr__(attr, valu)  # NB: Don't use `target` here, as it may have changed.
 
-        if swap:
+        if spec.level is SWAP and spec.loader_state is LOAD:
             self_dict = super().__getattribute__("__dict__")
             target_dict = spec.target.__getattribute__("__dict__")
             self_dict.update(target_dict)
             super().__setattr__("__class__", ModuleType)
+
+            if spec.loader.RELEASE:
+                spec.loader.release()
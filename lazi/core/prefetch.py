@@ -0,0 +1,155 @@
+"""Background idle-time prefetch of lazy modules.
+
+Materializes modules that are still `Loader.State.LAZY`, in a given order (typically the
+first-access order of a `lazi.core.record` recording), on a daemon thread, whenever the
+other threads have not created or executed a hooked module for `idle` seconds, and are not
+executing one right now.
+
+Materialization is serialized per module with importlib's module locks (see `Loader.exec_module`),
+so a module that the main thread touches at the same time is only executed once.
+
+The prefetcher only yields between modules: it checks before each execution, but an execution
+that has started runs to completion. If the main thread needs that same module meanwhile, it
+waits on the module lock for the rest of the execution (it would have executed the module
+itself otherwise). Other modules are not blocked, apart from sharing the GIL.
+"""
+from __future__ import annotations
+
+import json
+import atexit
+import threading
+from time import monotonic
+from typing import Iterable
+
+from lazi.conf import conf
+from lazi.util import debug
+
+from .loader import Loader
+
+__all__ = "Prefetcher", "order", "__prefetcher__"
+
+
+def order(path: str) -> list[str]:
+    """First-access order of the modules materialized in a recording.
+    """
+    with open(path) as file:
+        specs = json.load(file)["specs"]
+
+    return sorted(
+        (name for name, spec in specs.items() if spec["executed"] is not None and not spec["error"]),
+        key=lambda name: specs[name]["executed"],
+    )
+
+
+class Prefetcher(Loader.Hook):
+    names: list[str]
+    idle: float
+    done: list[str]
+
+    __thread: threading.Thread | None = None
+    __stop: threading.Event
+    __poke: threading.Event     # Set on module creation, to retry modules that weren't imported yet.
+    __last: float = 0.0
+    __busy: int = 0             # Hooked module executions in progress in the other threads.
+    __lock: threading.Lock
+
+    def __init__(self, names: Iterable[str], idle: float = conf.PREFETCH_IDLE):
+        self.names = list(names)
+        self.idle = idle
+        self.done = []
+        self.__stop = threading.Event()
+        self.__poke = threading.Event()
+        self.__last = monotonic()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def recorded(cls, path: str, idle: float = conf.PREFETCH_IDLE) -> Prefetcher:
+        return cls(order(path), idle)
+
+    def create(self, spec, /) -> None:
+        if threading.current_thread() is not self.__thread:
+            self.__last = monotonic()
+        self.__poke.set()
+
+    def enter(self, spec, lazy: bool, /) -> bool:
+        if threading.current_thread() is self.__thread:
+            return False
+
+        with self.__lock:
+            self.__busy += 1
+        self.__last = monotonic()
+        return True
+
+    def leave(self, spec, token: bool, error: BaseException | None, /) -> None:
+        if token:
+            with self.__lock:
+                self.__busy -= 1
+            self.__last = monotonic()
+
+    def start(self) -> Prefetcher:
+        if self.__thread is None:
+            Loader.hook(self)
+            self.__thread = threading.Thread(target=self.run, name=f"lazi-{type(self).__name__}", daemon=True)
+            self.__thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        self.__stop.set()
+        self.__poke.set()
+        if (thread := self.__thread) is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        Loader.unhook(self)
+
+    def wait(self) -> bool:
+        """Wait until the other threads have been idle for `self.idle` seconds. False if stopped.
+        """
+        while (delay := self.__last + self.idle - monotonic()) > 0 or self.__busy:
+            if self.__stop.wait(delay if delay > 0 else self.idle):
+                return False
+        return not self.__stop.is_set()
+
+    @staticmethod
+    def find(name: str):
+        from .finder import Finder
+
+        for finder in Finder.__finders__:
+            if (spec := finder.specs.get(name)) is not None and isinstance(spec.loader, Loader):
+                return spec
+
+    def run(self) -> None:
+        pending = list(self.names)
+
+        while pending and self.wait():
+            self.__poke.clear()
+
+            for name in list(pending):
+                if not self.wait():
+                    break
+
+                if (spec := self.find(name)) is None:
+                    continue  # Not imported (yet), retry after the next module creation.
+
+                pending.remove(name)
+
+                if spec.loader_state is not Loader.State.LAZY or spec.loader.module is None:
+                    continue
+
+                try:
+                    spec.loader.exec_module(spec.loader.module, True)
+                except Exception as e:
+                    assert None is debug.traced(1, f"[PREFETCH] {name} !!!! {type(e).__name__}: {e}")
+                    continue
+
+                self.done.append(name)
+
+            if pending:
+                self.__poke.wait()
+
+        Loader.unhook(self)
+
+
+__prefetcher__: Prefetcher | None = None
+
+if conf.PREFETCH:
+    __prefetcher__ = Prefetcher.recorded(conf.PREFETCH).start()
+    atexit.register(__prefetcher__.stop, 0)
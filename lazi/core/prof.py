@@ -0,0 +1,135 @@
+"""Lazi import profiler.
+
+Records the wall and CPU time of every hooked module execution, split into self and
+cumulative time for nested materializations, and whether the execution was deferred
+(LAZY -> EXEC) or eager (CREA -> EXEC).
+
+Enable with `conf.PROFILE`, read the results with `lazi.core.stat.Prof`.
+"""
+from __future__ import annotations
+
+import sys
+import atexit
+import threading
+from time import perf_counter_ns, thread_time_ns
+from dataclasses import dataclass
+from typing import TextIO, Iterable
+
+from lazi.conf import conf
+
+from .loader import Loader
+
+__all__ = "Record", "Nested", "Profiler", "importtime", "__profiler__"
+
+
+@dataclass(slots=True, frozen=True)
+class Record:
+    name: str
+    depth: int                  # Materialization nesting depth (per thread).
+    lazy: bool                  # Deferred (LAZY -> EXEC) or eager (CREA -> EXEC).
+    start: int                  # Start offset from profiler start (ns).
+    wall: int                   # Cumulative wall time (ns).
+    wall_self: int              # Wall time minus nested materializations (ns).
+    cpu: int                    # Cumulative thread CPU time (ns).
+    cpu_self: int               # Thread CPU time minus nested materializations (ns).
+    error: str | None = None    # Exception type name, if the execution failed.
+    thread: int = 0
+
+
+class Nested(Loader.Hook):
+    """Base of the hooks that measure hooked module executions, with nested ones subtracted.
+
+    `measure()` returns the counters to take the difference of, at enter and leave. `record()`
+    gets the cumulative and self differences (minus nested executions, per thread) of each one.
+    Both are no-ops here, like the `Loader.Hook` methods: a bare `Nested` only tracks nesting.
+    """
+    records: list
+    start: int
+
+    def __init__(self):
+        self.records = []
+        self.start = perf_counter_ns()
+        self.local = threading.local()
+
+    @property
+    def stack(self) -> list[list]:
+        if (stack := getattr(self.local, "stack", None)) is None:
+            stack = self.local.stack = []
+        return stack
+
+    def measure(self) -> tuple[int, ...]:
+        return ()
+
+    def record(
+            self, spec, depth: int, lazy: bool, parent: str | None, start: tuple[int, ...],
+            total: tuple[int, ...], self_: tuple[int, ...], error: BaseException | None, /,
+    ) -> None:
+        pass
+
+    def enter(self, spec, lazy: bool, /) -> list:
+        (stack := self.stack).append(frame := [spec, len(stack), lazy, None, self.measure()])
+        return frame
+
+    def leave(self, spec, frame: list, error: BaseException | None, /) -> None:
+        end = self.measure()
+        _, depth, lazy, kids, start = frame
+        total = tuple(e - s for e, s in zip(end, start))
+
+        if (stack := self.stack) and stack[-1] is frame:
+            stack.pop()
+            if stack:
+                parent = stack[-1]
+                parent[3] = total if parent[3] is None else tuple(k + t for k, t in zip(parent[3], total))
+
+        self_ = total if kids is None else tuple(t - k for t, k in zip(total, kids))
+        self.record(spec, depth, lazy, stack[-1][0].name if stack else None, start, total, self_, error)
+
+    def install(self):
+        Loader.hook(self)
+        return self
+
+    def uninstall(self):
+        Loader.unhook(self)
+        return self
+
+    def clear(self) -> None:
+        self.records.clear()
+        self.start = perf_counter_ns()
+
+
+class Profiler(Nested):
+    records: list[Record]
+
+    def measure(self) -> tuple[int, int]:
+        return perf_counter_ns(), thread_time_ns()
+
+    def record(self, spec, depth, lazy, parent, start, total, self_, error, /) -> None:
+        self.records.append(Record(
+            spec.name, depth, lazy, start[0] - self.start, total[0], self_[0], total[1], self_[1],
+            type(error).__name__ if error is not None else None, threading.get_ident(),
+        ))
+
+    def importtime(self, file: TextIO | None = None) -> None:
+        importtime(self.records, file)
+
+
+def importtime(records: Iterable[Record], file: TextIO | None = None) -> None:
+    """Write records in the `python -X importtime` format.
+    """
+    file = file if file is not None else sys.stderr
+    file.write("import time: self [us] | cumulative | imported package\n")
+
+    for record in records:
+        file.write(
+            f"import time: {record.wall_self // 1000:>9} | {record.wall // 1000:>10} | "
+            f"{'  ' * record.depth}{record.name}\n"
+        )
+
+
+__profiler__: Profiler = Profiler()
+
+if conf.PROFILE:
+    __profiler__.install()
+
+    if conf.PROFILE > 1:
+        atexit.register(__profiler__.importtime)
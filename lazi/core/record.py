@@ -0,0 +1,77 @@
+"""Workload recorder.
+
+Records, for every hooked spec, its level, when it was created, whether and when it was
+materialized, its exec cost, and whether the materialization failed. Recordings are JSON,
+and are the input of `lazi.core.tune`.
+
+Enable with `conf.RECORD`, or use `__recorder__` directly.
+"""
+from __future__ import annotations
+
+import sys
+import json
+import atexit
+from time import perf_counter_ns
+
+from lazi.conf import conf
+from lazi.util import atomic_write
+
+from .prof import Profiler
+
+__all__ = "Recorder", "__recorder__"
+
+VERSION = 1
+
+
+class Recorder(Profiler):
+    created: dict[str, tuple[str, int]]     # Name -> (level, offset).
+    ready: int | None = None                # Offset of the end of startup, if marked.
+
+    def __init__(self):
+        super().__init__()
+        self.created = {}
+
+    def create(self, spec, /) -> None:
+        self.created.setdefault(spec.name, (spec.level.name, perf_counter_ns() - self.start))
+
+    def mark(self) -> None:
+        """Mark the end of startup (otherwise `lazi.core.tune` uses a fixed window).
+        """
+        self.ready = perf_counter_ns() - self.start
+
+    def clear(self) -> None:
+        super().clear()
+        self.created.clear()
+        self.ready = None
+
+    def dump(self) -> dict:
+        from .finder import Finder
+
+        specs = {
+            name: dict(level=level, created=created, executed=None, lazy=False, wall=0, wall_self=0, error=None)
+            for name, (level, created) in self.created.items()
+        }
+
+        for rec in self.records:
+            if (spec := specs.get(rec.name)) is None or spec["executed"] is not None:
+                continue
+            spec.update(executed=rec.start, lazy=rec.lazy, wall=rec.wall, wall_self=rec.wall_self, error=rec.error)
+
+        return dict(
+            version=VERSION,
+            argv=sys.argv,
+            no_lazy=Finder.NO_LAZY.name,
+            ready=self.ready,
+            total=perf_counter_ns() - self.start,
+            specs=specs,
+        )
+
+    def save(self, path: str) -> None:
+        atomic_write(path, json.dumps(self.dump(), indent=1))
+
+
+__recorder__: Recorder = Recorder()
+
+if conf.RECORD:
+    __recorder__.install()
+    atexit.register(__recorder__.save, conf.RECORD)
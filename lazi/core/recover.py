@@ -0,0 +1,227 @@
+"""Recovery from failed lazy module materializations.
+
+A lazy module can fail when it finally executes because it relies on global state that, with
+eager imports, an earlier module would have set up already (see "Expected global state is not
+there" in the readme). With `conf.RECOVER`, such a failure is caught in `Loader.exec_module()`:
+
+1. The failed module, and the modules created during its execution that failed too (PART or
+   DEAD), are rolled back: their namespaces are cleared, and their proxies go back to LAZY (or
+   their specs to INIT, for forced levels), so that references to them stay valid.
+2. The lazy modules of the same top-level package that were imported before the failed one,
+   and are still pending, are loaded in import order, as eager imports would have.
+3. The failed module is executed again, once.
+
+If that succeeds, the failed module and the modules loaded in step 2 get at least
+`conf.RECOVER_LEVEL` from `Finder.get_level()`, in this run and, with `conf.RECOVER_RULES`,
+in later runs: they are then loaded at import time, in the right order, without a failure.
+"""
+from __future__ import annotations
+
+import sys
+import json
+import threading
+
+from lazi.conf import conf
+from lazi.util import debug, atomic_write, Persistent
+
+from .spec import Spec
+from .loader import Loader
+
+__all__ = "Recovery", "__recovery__"
+
+VERSION = 1
+
+KEEP = "__name__", "__doc__", "__package__", "__loader__", "__spec__", "__file__", "__cached__", "__path__"
+
+
+class Recovery(Loader.Hook, Persistent):
+    LEVEL: Spec.Level = Spec.Level.get(conf.RECOVER_LEVEL)
+
+    path: str | None
+    levels: dict[str, Spec.Level]           # Learned levels, by module name (for `Finder.get_level()`).
+    pending: dict[str, dict[int, Spec]]     # Top-level package -> lazy specs not executed yet, in creation order.
+    attempted: set[str]                     # Modules already retried in this run.
+    events: list[dict]                      # Recoveries in this run: name, error, reset and loaded modules, result.
+    dirty: bool = False
+
+    def __init__(self, path: str | None = None, level: Spec.Level | int | str = LEVEL):
+        self.path = path
+        self.LEVEL = Spec.Level.get(level)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.levels, self.pending, self.attempted, self.events = {}, {}, set(), []
+        self.load()
+
+    @property
+    def failed(self) -> list[Spec]:
+        """Specs whose execution failed, since the start of the current (or last) top-level execution of this thread.
+        """
+        if (failed := getattr(self.local, "failed", None)) is None:
+            failed = self.local.failed = []
+        return failed
+
+    def create(self, spec, /) -> None:
+        if spec.level <= Spec.Level.SWAP:  # Others execute right away (or are unhooked).
+            with self.lock:
+                self.pending.setdefault(spec.name.partition(".")[0], {})[id(spec)] = spec
+
+    def enter(self, spec, lazy: bool, /) -> None:
+        if not (depth := getattr(self.local, "depth", 0)):
+            self.failed.clear()
+        self.local.depth = depth + 1
+
+    def leave(self, spec, token: None, error: BaseException | None, /) -> None:
+        self.local.depth = max(getattr(self.local, "depth", 0) - 1, 0)  # Installed mid-execution: no enter().
+
+        if error is None:
+            self.drop(spec)
+        else:
+            self.failed.append(spec)  # Pending until recovered (or invalidated).
+
+    def drop(self, spec) -> None:
+        with self.lock:
+            if (pending := self.pending.get(top := spec.name.partition(".")[0])) is not None:
+                if pending.pop(id(spec), None) is not None and not pending:
+                    del self.pending[top]
+
+    def mark(self) -> int:
+        return len(self.failed) if getattr(self.local, "depth", 0) else 0
+
+    def install(self) -> Recovery:
+        Loader.hook(self)
+        Loader.recovery = self
+        return self
+
+    def uninstall(self) -> Recovery:
+        Loader.unhook(self)
+        if Loader.recovery is self:
+            Loader.recovery = None
+        return self
+
+    @staticmethod
+    def reset(loader: Loader) -> None:
+        """Roll a failed module back, so that it executes again on next access (or import).
+        """
+        spec, module = loader.spec, loader.module
+
+        if (target := spec.target) is not None:
+            namespace = target.__dict__
+            keep = {key: namespace[key] for key in KEEP if key in namespace}
+            namespace.clear()
+            namespace.update(keep)
+
+        loader.error = None
+
+        if isinstance(module, spec.finder.Module) and spec.level <= Spec.Level.SWAP:
+            loader.state(Loader.State.LAZY)
+            sys.modules[spec.name] = module
+        else:
+            loader.state(Loader.State.INIT)
+            loader.module = None
+            sys.modules.pop(spec.name, None)
+
+        assert None is debug.traced(1, f"[RECOVER] RSET {spec.f_name}")
+
+    def prepare(
+            self, loader: Loader, mark: int, error: BaseException,
+    ) -> tuple[dict, list[Spec], BaseException] | None:
+        """Roll a failed lazy materialization back, for `recover()`. Returns None if not attempted.
+
+        Called from the `except` clause of `Loader.exec_module()`, with the module lock held.
+        """
+        spec = loader.spec
+
+        with self.lock:
+            if spec.name in self.attempted or loader.module is None:
+                return None
+            self.attempted.add(spec.name)
+
+        assert None is debug.traced(0, f"[RECOVER] FAIL {spec.f_name} !!!! {type(error).__name__}: {error}")
+
+        failed = [
+            _ for _ in {id(_): _ for _ in self.failed[mark:]}.values()  # Specs compare by value: dedupe by identity.
+            if _ is not spec and isinstance(_.loader, Loader) and _.loader_state in (Loader.State.PART, Loader.State.DEAD)
+        ]
+
+        for _ in (spec, *failed):
+            self.reset(_.loader)
+
+        with self.lock:
+            before = list(self.pending.get(spec.name.partition(".")[0], {}).values())
+
+        event = dict(name=spec.name, error=repr(error), reset=[_.name for _ in failed], loaded=[], recovered=False)
+        self.events.append(event)
+
+        return event, before[:next((i for i, _ in enumerate(before) if _ is spec), len(before))], error
+
+    def recover(self, loader: Loader, event: dict, before: list[Spec], error: BaseException) -> None:
+        """Load the pending modules from `prepare()`, then retry the failed one (see the module docstring).
+
+        Called from `Loader.exec_module()` after releasing the module lock: the pending modules take
+        their own locks, and another thread may hold one of them while waiting for the failed module.
+        """
+        spec = loader.spec
+        loaded = event["loaded"]
+
+        for pending in before:
+            if (  # EXEC: wait for the other thread executing it.
+                    pending.loader_state in (Loader.State.LAZY, Loader.State.EXEC)
+                    and isinstance(ldr := pending.loader, Loader) and ldr.module is not None
+            ):
+                try:
+                    ldr.exec_module(ldr.module, True)
+                except Exception as e:
+                    assert None is debug.traced(1, f"[RECOVER] LOAD {pending.f_name} !!!! {type(e).__name__}: {e}")
+                else:
+                    if pending.loader_state is Loader.State.LOAD:  # Not skipped by a cross-thread cycle.
+                        loaded.append(pending.name)
+
+        if spec.loader_state in (Loader.State.LAZY, Loader.State.EXEC):  # Else done in another thread meanwhile.
+            loader.exec_module(loader.module, True)  # Raises if it fails again.
+
+        if spec.loader_state is not Loader.State.LOAD:
+            raise error  # Failed in another thread, or skipped by a cross-thread cycle.
+
+        event["recovered"] = True
+
+        with self.lock:
+            for name in (*loaded, spec.name):
+                if self.levels.get(name, Spec.Level.NONE) < self.LEVEL:
+                    self.levels[name] = self.LEVEL
+                    self.dirty = True
+
+        assert None is debug.traced(0, f"[RECOVER] OKAY {spec.f_name} {self.LEVEL} after {len(loaded)} pending")
+
+    def load(self) -> None:
+        if self.path is None:
+            return
+
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            assert None is debug.traced(1, f"[RECOVER] MISS {self.path} {type(e).__name__}")
+            return
+
+        if data.get("version") == VERSION:
+            self.levels = {name: Spec.Level[level] for name, level in data["levels"].items()}
+            assert None is debug.traced(1, f"[RECOVER] LOAD {self.path} {len(self.levels)}")
+
+    def save(self) -> None:
+        if not self.dirty or self.path is None:
+            return
+
+        try:
+            atomic_write(self.path, json.dumps(
+                dict(version=VERSION, levels={k: v.name for k, v in sorted(self.levels.items())}), indent=1,
+            ))
+        except OSError as e:
+            assert None is debug.traced(0, f"[RECOVER] SAVE {self.path} !!!! {type(e).__name__}: {e}")
+        else:
+            self.dirty = False
+
+
+__recovery__: Recovery = Recovery.open(conf.RECOVER_RULES)
+
+if conf.RECOVER:
+    __recovery__.install()
@@ -0,0 +1,123 @@
+"""Compiled `conf.LAZY` rules.
+
+The LAZY map is compiled once into a prefix table (for literal `^pkg\\.mod` style patterns)
+and a single alternation regex (for everything else), with results memoized per name.
+First-match-wins ordering of the map is preserved across both.
+"""
+from __future__ import annotations
+
+import re
+
+from .spec import Spec
+
+__all__ = "Rules",
+
+LITERAL = re.compile(r"\^?((?:\\[^0-9A-Za-z]|[^\\.^$*+?{}\[\]|()])+)(?:\.\*)?")
+UNSAFE = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux-]+\)")  # Backrefs & global flags don't survive alternation.
+
+
+def split(pattern: str) -> list[str]:
+    """Split a pattern on its top-level `|` alternatives.
+    """
+    alts, depth, start, i, klass = [], 0, 0, 0, False
+
+    while i < len(pattern):
+        match pattern[i]:
+            case "\\":
+                i += 1
+            case "[" if not klass:
+                klass = True
+            case "]" if klass:
+                klass = False
+            case "(" if not klass:
+                depth += 1
+            case ")" if not klass:
+                depth -= 1
+            case "|" if not klass and not depth:
+                alts.append(pattern[start:i])
+                start = i + 1
+        i += 1
+
+    alts.append(pattern[start:])
+    return alts
+
+
+class Rules:
+    lazy: dict[str, int | str]
+    default: Spec.Level
+    levels: tuple[Spec.Level, ...]
+
+    prefixes: dict[str, int]                        # Literal prefix -> rule index.
+    lengths: tuple[int, ...]                        # Distinct prefix lengths, ascending.
+    regex: re.Pattern | None                        # Combined alternation of the non-literal rules.
+    groups: dict[str, int]                          # Alternation group name -> rule index.
+    fallback: tuple[tuple[re.Pattern, int], ...]    # Rules that can't be combined.
+    cache: dict[str, Spec.Level]
+
+    def __init__(self, lazy: dict[str, int | str], default: Spec.Level | int):
+        self.lazy = lazy
+        self.default = default = Spec.Level.get(default)
+        self.levels = tuple(max(Spec.Level.get(level), default) for level in lazy.values())
+        self.prefixes = {}
+        self.groups = {}
+        self.cache = {}
+
+        combine, fallback = [], []
+
+        for index, pattern in enumerate(lazy):
+            if UNSAFE.search(pattern):
+                fallback.append((re.compile(pattern), index))
+                continue
+
+            for alt in split(pattern):
+                if (literal := LITERAL.fullmatch(alt)) is not None:
+                    self.prefixes.setdefault(re.sub(r"\\(.)", r"\1", literal.group(1)), index)
+                else:
+                    self.groups[group := f"_{len(self.groups)}"] = index
+                    combine.append(f"(?P<{group}>{alt})")
+
+        self.lengths = tuple(sorted({len(prefix) for prefix in self.prefixes}))
+
+        try:
+            self.regex = re.compile("|".join(combine)) if combine else None
+        except re.error:
+            self.regex = None
+            self.groups.clear()
+            fallback.extend(
+                (re.compile(pattern), index) for index, pattern in enumerate(lazy)
+                if not UNSAFE.search(pattern) and not all(LITERAL.fullmatch(_) for _ in split(pattern))
+            )
+
+        self.fallback = tuple(sorted(fallback, key=lambda _: _[1]))
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def __call__(self, name: str) -> Spec.Level:
+        if (level := self.cache.get(name)) is None:
+            level = self.cache[name] = self.levels[index] if (index := self.index(name)) is not None else self.default
+        return level
+
+    def index(self, name: str) -> int | None:
+        """Index of the first rule matching `name`, or None.
+        """
+        index = None
+
+        for length in self.lengths:
+            if length > len(name):
+                break
+            if (found := self.prefixes.get(name[:length])) is not None and (index is None or found < index):
+                index = found
+
+        if self.regex is not None and (match := self.regex.match(name)) is not None:
+            if index is None or (found := self.groups[match.lastgroup]) < index:
+                index = self.groups[match.lastgroup]
+
+        for regex, found in self.fallback:
+            if index is not None and found >= index:
+                break
+            if regex.match(name):
+                index = found
+                break
+
+        return index
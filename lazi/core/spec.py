@@ -4,16 +4,15 @@ https://peps.python.org/pep-0451/
 """
 from __future__ import annotations
 
+import os
+import sys
 from types import ModuleType
 from typing import ForwardRef
 from importlib.machinery import ModuleSpec
-from importlib import import_module
 from pathlib import Path
-from functools import cached_property, cache
 from enum import IntEnum
 
 from lazi.conf import conf
-from lazi.util.functional import classproperty
 
 __all__ = "Spec",
 
@@ -22,7 +21,9 @@ Loader = ForwardRef("Loader")
 
 
 class Spec(ModuleSpec):
-    STDLIB_PATH = classproperty(cache(lambda _: Path(import_module("sysconfig").get_path("stdlib"))))
+    STDLIB_DIR: str = os.path.dirname(os.__file__) + os.sep  # Same as sysconfig's "stdlib" path, without sysconfig.
+    STDLIB_NAMES: frozenset[str] = sys.stdlib_module_names
+    BUILTIN_NAMES: frozenset[str] = frozenset(sys.builtin_module_names)
 
     NO_HOOK: bool = conf.NO_HOOK
     NO_HOOK_BI: bool = conf.NO_HOOK_BI
@@ -34,19 +35,29 @@ class Spec(ModuleSpec):
     s_path: list[str] | None
     target: ModuleType | None
 
-    stdlib: bool = cached_property(lambda self: self.origin and self.STDLIB_PATH in Path(self.origin).parents)
-    builtin: bool = cached_property(lambda self: self.origin == "built-in")
+    # Display names and classification are computed on demand: cached properties would add
+    #  their values to the `__dict__` of every spec, for the life of the process.
+
+    # Top-level name in the stdlib, and not shadowed by a module outside of the stdlib dir (e.g. site-packages).
+    stdlib: bool = property(lambda self: self.name.partition(".")[0] in self.STDLIB_NAMES and (
+        not self.has_location or self.origin.startswith(self.STDLIB_DIR) and "-packages" + os.sep not in self.origin
+    ))
+    builtin: bool = property(  # Built-in or frozen: nothing to gain from deferring them.
+        lambda self: self.origin in ("built-in", "frozen") or self.name in self.BUILTIN_NAMES
+    )
 
     _f_name = lambda self, wrap=lambda _, __: f"{_}|{__.replace(f'{_}.', '', 1)}": (
         wrap(parent, name) if (name := self.name) != (parent := self.parent) and parent else name
     )
 
-    f_name: str | None = cached_property(lambda self: self._f_name())  # Formatted name.
-    p_name: str | None = cached_property(lambda self: self._f_name(lambda _, __: f"{_}.{__}"))  # Path (full) name.
+    f_name: str | None = property(lambda self: self._f_name())  # Formatted name.
+    p_name: str | None = property(  # Path (full) name.
+        lambda self: self._f_name(lambda _, __: f"{_}.{__.replace(f'{_}.', '', 1)}")
+    )
 
-    is_package: bool = cached_property(lambda self: self.submodule_search_locations is not None)
+    is_package: bool = property(lambda self: self.submodule_search_locations is not None)
 
-    @cached_property
+    @property
     def source_tag(self) -> str:
         return (
                 (
@@ -86,27 +97,20 @@ class Spec(ModuleSpec):
     ):
         assert spec.loader is not None, "ModuleSpec.loader is None"
 
+        self.__dict__.update(spec.__dict__)  # All of the ModuleSpec state, without `ModuleSpec.__init__()`.
+
         self.finder = finder
         self.s_path = path
         self.target = target
 
-        super().__init__(
-            name=spec.name,
-            loader=spec.loader,
-            origin=spec.origin,
-            loader_state=spec.loader_state,
-            is_package=spec.submodule_search_locations is not None or path is None,
-        )
-
-        self.__dict__.update(spec.__dict__)
-
         self.level = finder.get_level(self.p_name)
         self.loader = finder.Loader(self) if self.hook else self.loader
 
-    @cached_property
+    @property
     def hook(self) -> bool:
-        return not self.NO_HOOK and (
-            ((self.level > Spec.Level.NONE) or self.NO_CHECK_STD_BI) or
-            ((not self.builtin or not self.NO_HOOK_BI) and
-                (not self.stdlib or not self.NO_HOOK_STD))
+        return not self.NO_HOOK and self.level > Spec.Level.NONE and (
+            self.NO_CHECK_STD_BI or (
+                (not self.builtin or not self.NO_HOOK_BI) and
+                (not self.stdlib or not self.NO_HOOK_STD)
+            )
         )
@@ -1,91 +1,181 @@
 """Lazi statistics & tracing.
 """
+from __future__ import annotations
+
 import sys
 from dataclasses import dataclass, field
+from typing import TextIO, ClassVar
 
 from .finder import Finder, __finder__
+from .prof import Record, importtime, __profiler__
+from .mem import MemRecord, __memory__
+
+
+State = Finder.Loader.State
+counts = Finder.Loader.counts  # Maintained by `Loader.count()` and `Loader.state()`.
 
 
 @dataclass(slots=True, frozen=True)
 class Stat:
+    """Lazi statistics snapshot.
+
+    O(1): the counters are updated on spec creation, loader state changes and cache invalidation.
+    `Stat.scan()` computes the same fields with a full scan of the finders and sys.modules.
+    """
 
     # Number Finder specs that have hooked loaders.
-    find_hook: int = field(default_factory=lambda: sum(
-            sum(1 for spec in finder.specs.values() if not isinstance(spec.loader, finder.Loader))
-            for finder in __finder__.__finders__
-        ))
+    find_hook: int = field(default_factory=lambda: counts["spec"] - counts["hook"])
 
     # Total number of Finder specs.
-    find_spec: int = field(default_factory=lambda: sum(
-            len(finder.specs)
-            for finder in __finder__.__finders__
-        ))
+    find_spec: int = field(default_factory=lambda: counts["spec"])
 
     # Total number of Finder instances.
-    find_toti: int = field(default_factory=lambda: sum(1 for finder in __finder__.__finders__))
+    find_toti: int = field(default_factory=lambda: len(__finder__.__finders__))
 
     # Number of modules in the init state.
-    load_init: int = field(default_factory=lambda: sum(
-            sum(1 for spec in finder.specs.values() if spec.loader_state is finder.Loader.State.INIT)
-            for finder in __finder__.__finders__
-        ))
+    load_init: int = field(default_factory=lambda: counts[State.INIT])
 
     # Number of modules in the created state.
-    load_crea: int = field(default_factory=lambda: sum(
-        sum(1 for spec in finder.specs.values() if spec.loader_state is finder.Loader.State.CREA)
-        for finder in __finder__.__finders__
-    ))
+    load_crea: int = field(default_factory=lambda: counts[State.CREA])
 
     # Number of modules loaded lazily.
-    load_lazy: int = field(default_factory=lambda: sum(
-            sum(1 for spec in finder.specs.values() if spec.loader_state is finder.Loader.State.LAZY)
-            for finder in __finder__.__finders__
-        ))
+    load_lazy: int = field(default_factory=lambda: counts[State.LAZY])
+
+    # Number of modules partially loaded (failed with a nested lazi error).
+    load_part: int = field(default_factory=lambda: counts[State.PART])
 
     # Number of modules executing.
-    load_exec: int = field(default_factory=lambda: sum(
-            sum(1 for spec in finder.specs.values() if spec.loader_state is finder.Loader.State.EXEC)
-            for finder in __finder__.__finders__
-        ))
+    load_exec: int = field(default_factory=lambda: counts[State.EXEC])
 
     # Number of modules loaded fully.
-    load_full: int = field(default_factory=lambda: sum(
-            sum(1 for spec in finder.specs.values() if spec.loader_state is finder.Loader.State.LOAD)
-            for finder in __finder__.__finders__
-        ))
+    load_full: int = field(default_factory=lambda: counts[State.LOAD])
 
     # Number of modules with loader in dead state.
-    load_dead: int = field(default_factory=lambda: sum(
-            sum(1 for spec in finder.specs.values() if spec.loader_state is finder.Loader.State.DEAD)
-            for finder in __finder__.__finders__
-        ))
+    load_dead: int = field(default_factory=lambda: counts[State.DEAD])
 
     # Number of specs with unknown loader state.
-    load_wtaf: int = field(default_factory=lambda: sum(
-            sum(
-                1 for spec in finder.specs.values()
-                if spec.loader_state is not None
-                and not isinstance(spec.loader_state, finder.Loader.State)
-            )
-            for finder in __finder__.__finders__
-        ))
+    load_wtaf: int = field(default_factory=lambda: counts["wtaf"])
 
     # Number of modules with no loader state.
-    load_none: int = field(default_factory=lambda: sum(
-            sum(1 for spec in finder.specs.values() if spec.loader_state is None)
-            for finder in __finder__.__finders__
-        ))
+    load_none: int = field(default_factory=lambda: counts[None])
 
     # Number of specs with a hooked loader. Should be the sum of all the load_* stats above.
-    load_hook: int = field(default_factory=lambda: sum(
-            sum(1 for spec in finder.specs.values() if isinstance(spec.loader, finder.Loader))
-            for finder in __finder__.__finders__
-        ))
+    load_hook: int = field(default_factory=lambda: counts["hook"])
 
     # Total number of specs found in sys.modules with a hooked loader.
-    load_syst: int = field(default_factory=lambda: sum(
-            1 for mod in sys.modules.values()
-            if isinstance(getattr(mod, "__loader__", None), Finder.Loader)
-        ))
+    # - Approximated by the hooked modules that were created and didn't fail, see `Stat.scan()`.
+    load_syst: int = field(default_factory=lambda: sum(counts[_] for _ in SYST))
 
     syst_totl: int = field(default_factory=lambda: len(sys.modules))
+
+    @classmethod
+    def scan(cls) -> Stat:
+        """Full-scan snapshot (slow, for cross-checking the counters).
+        """
+        specs = [spec for finder in __finder__.__finders__ for spec in finder.specs.values()]
+        states = [spec.loader_state for spec in specs]
+
+        return cls(
+            find_hook=sum(1 for spec in specs if not isinstance(spec.loader, Finder.Loader)),
+            find_spec=len(specs),
+            find_toti=len(__finder__.__finders__),
+            **{field: states.count(state) for field, state in FIELDS.items()},
+            load_wtaf=sum(1 for state in states if state is not None and not isinstance(state, State)),
+            load_none=states.count(None),
+            load_hook=sum(1 for spec in specs if isinstance(spec.loader, Finder.Loader)),
+            load_syst=sum(
+                1 for mod in list(sys.modules.values())
+                if isinstance(getattr(mod, "__loader__", None), Finder.Loader)
+            ),
+            syst_totl=len(sys.modules),
+        )
+
+    @classmethod
+    def check(cls) -> Stat:
+        """Counter snapshot, cross-checked against `Stat.scan()` in debug mode (not with `python -O`).
+        """
+        stat = cls()
+
+        if __debug__:
+            scan = cls.scan()
+            diff = {
+                name: (getattr(stat, name), getattr(scan, name)) for name in cls.__slots__
+                if name not in ("load_syst", "syst_totl") and getattr(stat, name) != getattr(scan, name)
+            }
+            assert not diff, f"Stat counters != scan: {diff}"
+
+        return stat
+
+
+FIELDS = dict(
+    load_init=State.INIT, load_crea=State.CREA, load_lazy=State.LAZY, load_part=State.PART,
+    load_exec=State.EXEC, load_full=State.LOAD, load_dead=State.DEAD,
+)
+
+SYST = State.CREA, State.LAZY, State.EXEC, State.LOAD
+
+
+class Records:
+    """Exec records view, shared by the `lazi.core.prof.Nested` hook reports.
+    """
+    __slots__ = ()
+
+    KEY: ClassVar[str]  # Default `top()` key.
+    records: tuple
+
+    def top(self, count: int = 10, key: str | None = None) -> list:
+        key = key or self.KEY
+        return sorted(self.records, key=lambda rec: getattr(rec, key), reverse=True)[:count]
+
+
+@dataclass(slots=True, frozen=True)
+class Prof(Records):
+    """Import profile report (requires `conf.PROFILE` or `__profiler__.install()`).
+    """
+    KEY: ClassVar[str] = "wall_self"
+
+    # Exec records, in completion order.
+    records: tuple[Record, ...] = field(default_factory=lambda: tuple(__profiler__.records))
+
+    # Number of deferred (LAZY -> EXEC) materializations.
+    exec_lazy: int = field(default_factory=lambda: sum(1 for rec in __profiler__.records if rec.lazy))
+
+    # Number of eager (CREA -> EXEC) executions.
+    exec_eagr: int = field(default_factory=lambda: sum(1 for rec in __profiler__.records if not rec.lazy))
+
+    # Number of failed executions.
+    exec_fail: int = field(default_factory=lambda: sum(1 for rec in __profiler__.records if rec.error))
+
+    # Total self wall time (ns), i.e. the wall time spent executing hooked modules.
+    wall_totl: int = field(default_factory=lambda: sum(rec.wall_self for rec in __profiler__.records))
+
+    # Total self CPU time (ns).
+    cpu_totl: int = field(default_factory=lambda: sum(rec.cpu_self for rec in __profiler__.records))
+
+    def importtime(self, file: TextIO | None = None) -> None:
+        importtime(self.records, file)
+
+
+@dataclass(slots=True, frozen=True)
+class Mem(Records):
+    """Memory accounting report (requires `conf.MEMORY` or `__memory__.install()`).
+    """
+    KEY: ClassVar[str] = "size_self"
+
+    # Exec records, in completion order.
+    records: tuple[MemRecord, ...] = field(default_factory=lambda: tuple(__memory__.records))
+
+    # Total self size (bytes), i.e. the net memory allocated by executing hooked modules.
+    size_totl: int = field(default_factory=lambda: sum(rec.size_self for rec in __memory__.records))
+
+    # Total self size of the deferred (LAZY -> EXEC) materializations (bytes).
+    size_lazy: int = field(default_factory=lambda: sum(rec.size_self for rec in __memory__.records if rec.lazy))
+
+    def table(self, count: int = 20, key: str | None = None, file: TextIO | None = None) -> None:
+        """Write the top records as a table, sizes in KiB.
+        """
+        file = file if file is not None else sys.stderr
+        file.write(f"{'self [KiB]':>10} | {'cumulative':>10} | {'lazy':<4} | module\n")
+
+        for rec in self.top(count, key):
+            file.write(f"{rec.size_self / 1024:>10.1f} | {rec.size / 1024:>10.1f} | {'yes' if rec.lazy else 'no':<4} | {rec.name}\n")
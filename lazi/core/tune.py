@@ -0,0 +1,135 @@
+"""Generate a LAZY conf module from workload recordings (see `lazi.core.record`).
+
+    python -m lazi.core.tune [--startup SECONDS] RECORDING.json [...] > <project>/lazi/conf/tuned.py
+
+Per module, across all recordings:
+
+- UNLO: materialization failed in any run, or the module was always executed during startup.
+- LAZY: never executed.
+- SWAP: executed after startup or only in some runs (hot proxies get swapped out once loaded).
+
+Levels are then folded into per-package prefix rules, most specific first.
+"""
+from __future__ import annotations
+
+import re
+import sys
+import json
+import argparse
+from collections import Counter
+
+from .spec import Spec
+
+__all__ = "load", "executed", "levels", "rules", "render", "main"
+
+Level = Spec.Level
+
+
+def load(paths: list[str]) -> list[dict]:
+    runs = []
+    for path in paths:
+        with open(path) as file:
+            runs.append(json.load(file))
+    return runs
+
+
+def executed(spec: dict) -> int | None:
+    """Offset of the first execution. UNLO modules are unhooked at creation and run right away.
+    """
+    if spec["executed"] is None and spec["level"] == Level.UNLO.name and not spec["error"]:
+        return spec["created"]
+    return spec["executed"]
+
+
+def levels(runs: list[dict], startup: float = 1.0) -> dict[str, Level]:
+    """Fastest safe level per recorded module name.
+    """
+    window = int(startup * 1e9)
+    names = {name for run in runs for name in run["specs"]}
+    result = {}
+
+    for name in sorted(names):
+        seen = [run["specs"].get(name) for run in runs]
+        ready = [run["ready"] if run.get("ready") is not None else window for run in runs]
+        execs = [executed(spec) if spec is not None else None for spec in seen]
+
+        if any(spec is not None and spec["error"] for spec in seen):
+            result[name] = Level.UNLO
+        elif all(exe is not None and exe <= end for exe, end in zip(execs, ready)):
+            result[name] = Level.UNLO
+        elif all(exe is None for exe in execs):
+            result[name] = Level.LAZY
+        else:
+            result[name] = Level.SWAP
+
+    return result
+
+
+def rules(names: dict[str, Level]) -> list[tuple[str, Level, int]]:
+    """Fold per-module levels into (pattern, level, module count) rules, first match wins.
+    """
+    tree: dict[str, set[str]] = {}
+
+    for name in names:
+        parts = name.split(".")
+        for index in range(1, len(parts) + 1):
+            tree.setdefault(".".join(parts[:index - 1]), set()).add(".".join(parts[:index]))
+
+    def subtree(node: str) -> list[Level]:
+        return ([names[node]] if node in names else []) + [
+            level for child in sorted(tree.get(node, ())) for level in subtree(child)
+        ]
+
+    def fold(node: str) -> list[tuple[str, Level, int]]:
+        counts = Counter(subtree(node))
+        major = counts.most_common(1)[0][0]
+        out = []
+
+        for child in sorted(tree.get(node, ())):
+            if any(level is not major for level in subtree(child)):
+                out.extend(fold(child))
+
+        if node in names and names[node] is not major:
+            out.append((rf"^{re.escape(node)}$", names[node], 1))
+
+        out.append((rf"^{re.escape(node)}(\.|$)", major, counts[major]))
+        return out
+
+    return [rule for top in sorted(tree.get("", ())) for rule in fold(top)]
+
+
+def render(runs: list[dict], startup: float = 1.0) -> str:
+    default = Level[runs[0]["no_lazy"]] if runs else Level.SWAP
+    lines = [
+        f'"""Generated by `python -m lazi.core.tune` from {len(runs)} recording(s).',
+        "",
+        *(f"- {' '.join(run['argv'])}" for run in runs),
+        '"""',
+        "",
+        "NO_LAZY: int = 0",
+        "",
+        "LAZY: dict[str, int | str] = {",
+        *(
+            f"    {pattern!r}: {level.name!r},  # {count} module{'s' if count != 1 else ''}"
+            for pattern, level, count in rules(levels(runs, startup))
+        ),
+        f"    '.*': {default.name!r},  # Modules that were not recorded.",
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m lazi.core.tune", description=__doc__.splitlines()[0])
+    parser.add_argument("recordings", nargs="+", help="Recording JSON files (see conf.RECORD).")
+    parser.add_argument(
+        "--startup", type=float, default=1.0,
+        help="Startup window in seconds, for recordings without a `__recorder__.mark()` (default: 1.0).",
+    )
+    args = parser.parse_args(argv)
+    sys.stdout.write(render(load(args.recordings), args.startup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Pre-fork warmup for worker servers (gunicorn, uwsgi...).
+
+Modules that are still lazy when the master process forks get executed again in every worker,
+each with its own private copy. `Finder.warmup()` materializes a chosen (or recorded, see
+`lazi.core.record`) set of lazy modules in the master, and leaves the others lazy:
+
+    lazi.warmup("/var/lib/app/lazi.json", freeze=True)  # e.g. in gunicorn's `on_starting`.
+
+With `freeze`, `gc.freeze()` moves everything allocated so far to the permanent generation, so
+that the collector doesn't touch (and copy) those pages in the workers.
+
+After a fork, every process notes the hooked modules that it materializes itself. With
+`conf.WARMUP_REPORT`, each worker writes them to a JSON report at exit, to tune the warm set.
+"""
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import json
+import atexit
+from typing import Iterable
+from importlib import import_module
+
+from lazi.conf import conf
+from lazi.util import debug, atomic_write
+
+from .loader import Loader
+from .prefetch import Prefetcher, order
+
+__all__ = "Warmup", "__warmup__"
+
+
+class Warmup(Loader.Hook):
+    report: str | None
+    names: list[str]            # Modules materialized by `run()`.
+    after: list[str]            # Modules materialized in this process after a fork, in order.
+    parent: int | None = None   # Pid of the process that forked this one, if any.
+
+    __forks: bool = False
+    __pid: int | None = None
+
+    def __init__(self, report: str | None = conf.WARMUP_REPORT):
+        self.report = report
+        self.names = []
+        self.after = []
+
+    def enter(self, spec, lazy: bool, /) -> None:
+        if self.parent is not None:
+            self.after.append(spec.name)
+
+    def run(self, finder, names: Iterable[str] | str, freeze: bool = False) -> list[str]:
+        """Materialize the lazy modules among `names` (or a recording path), importing the missing ones.
+        """
+        done = []
+
+        for name in order(names) if isinstance(names, str) else names:
+            if (spec := Prefetcher.find(name)) is None and name not in sys.modules:
+                try:
+                    with finder:
+                        import_module(name)
+                except Exception as e:
+                    assert None is debug.traced(1, f"[WARMUP] {name} !!!! {type(e).__name__}: {e}")
+                    continue
+
+                spec = Prefetcher.find(name)
+
+            if spec is None or spec.loader_state is not Loader.State.LAZY or spec.loader.module is None:
+                continue
+
+            try:
+                spec.loader.exec_module(spec.loader.module, True)
+            except Exception as e:
+                assert None is debug.traced(1, f"[WARMUP] {name} !!!! {type(e).__name__}: {e}")
+                continue
+
+            done.append(name)
+
+        self.names.extend(done)
+        assert None is debug.traced(1, f"[WARMUP] {len(done)} modules")
+
+        if freeze:
+            gc.freeze()
+
+        if not self.__forks:
+            self.__forks = True
+            Loader.hook(self)
+            os.register_at_fork(before=self.before, after_in_child=self.forked)
+
+        return done
+
+    def before(self) -> None:
+        self.__pid = os.getpid()
+
+    def forked(self) -> None:
+        self.parent = self.__pid
+        self.after = []
+        if self.report:
+            atexit.register(self.save, self.report)
+
+    def dump(self) -> dict:
+        return dict(pid=os.getpid(), parent=self.parent, warm=self.names, after=self.after)
+
+    def save(self, path: str) -> None:
+        """Write the report, to `path` formatted with the `pid`.
+        """
+        atomic_write(path.format(pid=os.getpid()), json.dumps(self.dump(), indent=1))
+
+
+__warmup__: Warmup = Warmup()
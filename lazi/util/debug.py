@@ -1,14 +1,44 @@
 from contextlib import contextmanager
+from string import Formatter
 import logging
 
 from lazi.conf import conf
 
-__all__ = "trace", "traced", "info", "track"
+from .util import oid
+
+__all__ = "trace", "traced", "info", "track", "event", "Event"
 
 exception = logging.exception
 
 TRACE = conf.TRACE
 
+
+class Event:
+    """Structured trace event, only formatted when a handler emits it (see `event()`).
+
+    `fmt` is a `str.format` template over `args`, where the `!o` conversion formats object ids.
+    """
+    __slots__ = "code", "fmt", "args"
+
+    class Format(Formatter):
+        def convert_field(self, value, conversion):
+            if conversion == "o":
+                return oid(value) if value is not None else "*" * 15
+            return super().convert_field(value, conversion)
+
+    format = Format().vformat
+
+    def __init__(self, code: str, fmt: str, args: tuple):
+        self.code = code
+        self.fmt = fmt
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.format(self.fmt, self.args, {})
+
+    def __repr__(self) -> str:
+        return f"Event({self.code!r}, {str(self)!r})"
+
 if __debug__:
 
     logging.basicConfig(
@@ -20,10 +50,20 @@ if __debug__:
     trace = lambda *args, **kwds: traced(0, *args, **kwds)
     info = lambda *_, **__: traced(-1, *_, **__)
 
+    def event(at: int, code: str, fmt: str, /, *args) -> bool:
+        """Log an `Event` if TRACE > at. Always true, so hot paths can check the level first:
+
+            assert debug.TRACE <= 3 or debug.event(3, "GETA", "[{0!o}] {1}", obj, name)
+        """
+        if TRACE > at:
+            logging.debug(Event(code, fmt, args))
+        return True
+
 else:
     traced = lambda at, /, *args, **kwds: None
     trace = lambda *args, **kwds: None
     info = lambda *_, **__: None
+    event = lambda at, code, fmt, /, *args: True
 
 
 @contextmanager
@@ -1,6 +1,58 @@
+from __future__ import annotations
 
-__all__ = "oid",
+import os
+import atexit
+from collections.abc import Iterable
+
+__all__ = "oid", "atomic_write", "Persistent"
 
 
 def oid(obj, /):
     return hex(id(obj))[2:].upper()
+
+
+def atomic_write(path: str, data: bytes | str | Iterable[bytes] | Iterable[str]) -> None:
+    """Write a file through a temporary file next to it, renamed into place (creating the directory).
+
+    `data` can also be an iterable of chunks, either all bytes or all str.
+    """
+    chunks = (data,) if isinstance(data, (bytes, str)) else tuple(data)
+    temp = f"{path}.{os.getpid()}"
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    try:
+        with open(temp, "w" if chunks and isinstance(chunks[0], str) else "wb") as file:
+            file.writelines(chunks)
+        os.replace(temp, path)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+
+
+class Persistent:
+    """Base of the file-backed caches: one instance per path from `open()`, and `save()` at exit.
+    """
+    __classes__: list[type[Persistent]] = []
+    __instances__: dict[str | None, Persistent]
+
+    def __init_subclass__(cls, **kwds):
+        super().__init_subclass__(**kwds)
+        cls.__instances__ = {}
+        Persistent.__classes__.append(cls)
+
+    def __init__(self, path: str | None):
+        self.path = path
+
+    @classmethod
+    def open(cls, path: str | None):
+        if (instance := cls.__instances__.get(path)) is None:
+            instance = cls.__instances__[path] = cls(path)
+        return instance
+
+    def save(self) -> None:
+        pass
+
+
+atexit.register(lambda: [_.save() for cls in Persistent.__classes__ for _ in list(cls.__instances__.values())])
@@ -0,0 +1,53 @@
+"""Benchmark: sequential imports vs `Finder.batch()` (parallel code staging).
+
+    python -m tests.bench.bench_batch [modules] [latency_us] [runs]
+
+Each run is a fresh interpreter importing every module of a tree eagerly. With a latency,
+`SourceFileLoader.get_data()` sleeps that long per read, as on a network filesystem.
+"""
+import sys
+import tempfile
+import subprocess
+from pathlib import Path
+from statistics import median
+
+from tests.bench.tree import make, env
+
+CODE = """
+import sys, time
+from time import perf_counter
+from importlib import import_module
+from importlib.machinery import SourceFileLoader
+from lazi.core.finder import Finder
+sys.path.insert(0, {tmp!r})
+if {latency}:
+    get_data = SourceFileLoader.get_data
+    SourceFileLoader.get_data = lambda self, path: (time.sleep({latency} / 1e6), get_data(self, path))[1]
+finder = Finder(NO_LAZY=4)
+start = perf_counter()
+if {batch}:
+    finder.batch({names!r})
+else:
+    with finder:
+        [import_module(name) for name in {names!r}]
+print(perf_counter() - start)
+"""
+
+
+def main(modules: int = 1000, latency: int = 200, runs: int = 5):
+    with tempfile.TemporaryDirectory() as tmp:
+        names = make(Path(tmp), name="bench_bt", modules=modules, style="none")
+
+        def run(batch: bool, latency: int) -> float:
+            code = CODE.format(tmp=tmp, names=names, batch=batch, latency=latency)
+            return float(subprocess.run([sys.executable, "-"], input=code, text=True, env=env(), check=True, capture_output=True).stdout)
+
+        run(False, 0)  # Writes the .pyc files.
+
+        for lat in sorted({0, latency}):
+            seq, bat = (median(run(batch, lat) for _ in range(runs)) * 1e3 for batch in (False, True))
+            print(f"{modules} modules, {lat:>4} us/read: sequential {seq:7.1f} ms, batch {bat:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,51 @@
+"""Benchmark: importing a synthetic tree from .pyc files vs from a code bundle.
+
+    python -m tests.bench.bench_bundle [modules] [runs]
+
+Each run is a fresh interpreter importing every module of the tree eagerly through a Finder,
+after a first run has written the .pyc files (both variants run with a warm page cache).
+"""
+import os
+import sys
+import tempfile
+import subprocess
+from pathlib import Path
+from statistics import median
+
+from tests.bench.tree import make, env
+
+from lazi.core.bundle import build
+
+CODE = """
+import sys
+from time import perf_counter
+from lazi.core.finder import Finder
+from lazi.core.bundle import Bundle
+Bundle.CHECK = {check}
+sys.path.insert(0, {tmp!r})
+start = perf_counter()
+with Finder(NO_LAZY=4, BUNDLE={bundle!r}):
+    for name in {names!r}:
+        __import__(name)
+print(perf_counter() - start)
+"""
+
+
+def main(modules: int = 500, runs: int = 10):
+    with tempfile.TemporaryDirectory() as tmp:
+        names = make(Path(tmp), name="bench_bd", modules=modules, style="none")
+        sys.path.insert(0, tmp)
+        build(bundle := os.path.join(tmp, "app.bundle"), names)
+
+        def run(bundle: str | None, check: int = 2) -> float:
+            code = CODE.format(tmp=tmp, bundle=bundle, check=check, names=names)
+            return float(subprocess.run([sys.executable, "-c", code], env=env(), check=True, capture_output=True).stdout)
+
+        run(None)  # Writes the .pyc files.
+
+        for label, args in (("pyc", (None,)), ("bundle hash", (bundle, 2)), ("bundle stat", (bundle, 1)), ("bundle trust", (bundle, 0))):
+            print(f"{label:>12}: {median(run(*args) for _ in range(runs)) * 1e3:7.2f} ms for {modules} modules")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,37 @@
+"""Benchmark: loading the merged configuration, with and without CONF_CACHE.
+
+    python -m tests.bench.bench_conf [runs]
+
+Each run is a fresh interpreter timing `from lazi.conf import conf; conf.get()`.
+"""
+import os
+import sys
+import tempfile
+import subprocess
+from statistics import median
+
+from tests.bench.tree import env
+
+CODE = """
+from time import perf_counter
+start = perf_counter()
+from lazi.conf import conf
+conf.get()
+print(perf_counter() - start)
+"""
+
+
+def main(runs: int = 20):
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, extra in (("modules", {}), ("cache", dict(CONF_CACHE=os.path.join(tmp, "conf.cache")))):
+            environ = env(**extra)
+            subprocess.run([sys.executable, "-c", CODE], env=environ, check=True, capture_output=True)  # Warm up.
+            times = [
+                float(subprocess.run([sys.executable, "-c", CODE], env=environ, check=True, capture_output=True).stdout)
+                for _ in range(runs)
+            ]
+            print(f"{label:>8}: {median(times) * 1e3:6.2f} ms (median of {runs})")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,92 @@
+"""Benchmark: cold import of a large package tree with and without the persistent spec index.
+
+    python -m tests.bench.bench_index [modules] [extra sys.path entries]
+
+Each run is a fresh interpreter. Filesystem calls made by the import system are counted
+by patching `importlib._bootstrap_external._path_stat` and auditing `os.listdir`/`open`;
+if `strace` is available, total stat/open/getdents syscalls are reported as well.
+"""
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+
+from tests.bench.tree import make, env as bench_env
+
+CHILD = r"""
+import sys, json, time, os
+import importlib._bootstrap_external as be
+
+counts = dict(stat=0, listdir=0, open=0)
+path_stat = be._path_stat
+
+def _path_stat(path):
+    counts["stat"] += 1
+    return path_stat(path)
+
+be._path_stat = _path_stat
+sys.addaudithook(lambda event, _: event in ("os.listdir", "open") and counts.__setitem__(
+    event.rpartition(".")[2], counts[event.rpartition(".")[2]] + 1
+))
+
+sys.path[:0] = json.loads(os.environ["BENCH_PATH"])
+
+from lazi.core import lazi
+
+start = time.perf_counter()
+with lazi:
+    import synth
+wall = time.perf_counter() - start
+
+print(json.dumps(dict(wall=wall, modules=len(sys.modules), **counts)))
+"""
+
+
+def strace(env: dict) -> dict | None:
+    if not shutil.which("strace"):
+        return None
+
+    with tempfile.NamedTemporaryFile("r", suffix=".strace") as out:
+        subprocess.run(
+            ["strace", "-f", "-c", "-o", out.name, sys.executable, "-c", CHILD],
+            env=env, check=True, capture_output=True,
+        )
+        calls = {}
+        for line in out.read().splitlines():
+            if len(parts := line.split()) >= 5 and parts[-1] in ("newfstatat", "stat", "openat", "getdents64"):
+                calls[parts[-1]] = int(parts[3])
+        return calls
+
+
+def run(env: dict) -> dict:
+    out = subprocess.run([sys.executable, "-c", CHILD], env=env, check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+def main(modules: int = 2000, extra: int = 30):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make(root / "tree", modules=modules, depth=4, fanout=8)
+        paths = [str(root / f"extra{_}") for _ in range(extra)] + [str(root / "tree")]
+        [Path(_).mkdir(exist_ok=True) for _ in paths]
+
+        env = bench_env(BENCH_PATH=json.dumps(paths), NO_LAZY="2", PYTHONDONTWRITEBYTECODE="")
+        run(env)  # Write bytecode caches.
+
+        index = dict(env, SPEC_INDEX=str(root / "index.marshal"))
+
+        print(f"{modules} modules, {len(paths)} extra sys.path entries")
+        print(f"{'run':<12} {'wall ms':>9} {'stat':>7} {'listdir':>8} {'open':>6}  strace")
+
+        for label, run_env in (("no index", env), ("index cold", index), ("index warm", index), ("no index", env)):
+            result = run(run_env)
+            print(
+                f"{label:<12} {result['wall'] * 1e3:>9.1f} {result['stat']:>7} {result['listdir']:>8} "
+                f"{result['open']:>6}  {strace(run_env) or '-'}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
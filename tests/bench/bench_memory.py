@@ -0,0 +1,68 @@
+"""Benchmark: memory per module of lazi's specs, loaders and proxies.
+
+    python -m tests.bench.bench_memory [modules]
+
+Each variant imports a synthetic tree (empty modules) in a fresh interpreter and reports the
+tracemalloc-traced memory per module. The overhead is relative to plain imports without lazi.
+"""
+import sys
+import tempfile
+import subprocess
+from pathlib import Path
+
+from tests.bench.tree import make, env
+
+CODE = """
+import gc, sys, tracemalloc
+from importlib import import_module
+from lazi.core.finder import Finder
+from lazi.core.loader import Loader
+sys.path.insert(0, {tmp!r})
+names = {names!r}
+Loader.RELEASE = {release!r}
+finder = Finder(NO_LAZY=Finder.Spec.Level[{level!r}])
+gc.collect()
+tracemalloc.start()
+start = tracemalloc.get_traced_memory()[0]
+if {hook!r}:
+    finder.__enter__()
+modules = [import_module(name) for name in names]
+if {load!r}:
+    [module.func for module in modules]
+del modules
+gc.collect()
+print(tracemalloc.get_traced_memory()[0] - start)
+"""
+
+VARIANTS = (
+    # label, hooked, level, accessed, release
+    ("plain", False, "LAZY", True, False),
+    ("LAZY (unused)", True, "LAZY", False, False),
+    ("LAZY (accessed)", True, "LAZY", True, False),
+    ("SWAP (accessed)", True, "SWAP", True, False),
+    ("SWAP + RELEASE", True, "SWAP", True, True),
+    ("UNMO", True, "UNMO", True, False),
+    ("UNMO + RELEASE", True, "UNMO", True, True),
+)
+
+
+def main(modules: int = 10000):
+    with tempfile.TemporaryDirectory() as tmp:
+        names = make(Path(tmp), name="bench_mm", modules=modules, depth=4, fanout=24, style="none")
+
+        def run(hook: bool, level: str, load: bool, release: bool) -> int:
+            code = CODE.format(tmp=tmp, names=names, hook=hook, level=level, load=load, release=release)
+            return int(subprocess.run([sys.executable, "-"], input=code, text=True, env=env(), check=True, capture_output=True).stdout)
+
+        run(False, "LAZY", True, False)  # Writes the .pyc files.
+        plain = None
+
+        for label, *args in VARIANTS:
+            size = run(*args) / len(names)
+            plain = size if plain is None else plain
+            extra = f"  +{size - plain:5.0f} B, {(size - plain) * 1e4 / 2**20:4.1f} MiB per 10k" if args[2] else ""
+            print(f"{label:>16}: {size:6.0f} B/module{extra}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
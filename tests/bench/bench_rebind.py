@@ -0,0 +1,60 @@
+"""Benchmark: attribute access through a loaded proxy vs a rebound reference.
+
+    python -m tests.bench.bench_rebind [loops]
+
+Each variant runs a module-global function that reads `mod.VALUE` in a loop, where `mod` is
+an importer's global: a plain module, a materialized proxy (REBIND off), or the same proxy
+after `Loader.rebind` replaced it with the real module (REBIND on).
+"""
+import sys
+import tempfile
+from time import perf_counter
+from pathlib import Path
+
+from tests.bench.tree import make
+
+from lazi.core.finder import Finder
+from lazi.core.loader import Loader
+
+USER = """\
+import {name} as mod
+
+def loop(count):
+    for _ in range(count):
+        mod.VALUE
+"""
+
+
+def timed(loop, loops: int) -> float:
+    loop(loops // 10)
+    start = perf_counter()
+    loop(loops)
+    return (perf_counter() - start) / loops * 1e9
+
+
+def main(loops: int = 1_000_000):
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+
+        for label, level, rebind in (("plain", "UNLO", False), ("proxy", "LAZY", False), ("rebound", "LAZY", True)):
+            Loader.REBIND = rebind
+            name = make(Path(tmp), name=f"bench_rb_{label}", modules=1, style="none")[-1]
+            (Path(tmp) / f"bench_rb_{label}_user.py").write_text(USER.format(name=name))
+
+            with Finder(NO_LAZY=0, LAZY={rf"^bench_rb_{label}": level, r"_user$": "UNLO"}) as finder:
+                user = __import__(f"bench_rb_{label}_user")
+                user.mod.VALUE  # Materialize.
+                results[label] = timed(user.loop, loops), type(user.mod) is finder.Module
+
+            finder.invalidate_caches()
+
+        Loader.REBIND = False
+
+    for label, (ns, proxied) in results.items():
+        print(f"{label:>8}: {ns:6.1f} ns/access{' (proxy)' if proxied else ''}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Microbenchmark: `Finder.get_level` cost as the number of LAZY rules grows.
+
+    python -m tests.bench.bench_rules
+"""
+import re
+import random
+from timeit import timeit
+
+from lazi.core.spec import Spec
+from lazi.core.rules import Rules
+
+random.seed(0)
+
+NAMES = [f"pkg{i}.mod{j}.sub{k}" for i in range(50) for j in range(20) for k in range(5)]  # 5000 names.
+
+
+def lazy_map(count: int) -> dict[str, str]:
+    levels = list(Spec.Level.__members__)[1:]
+    return {
+        (rf"^pkg{i}\.mod{i % 20}" if i % 4 else rf"^pkg{i}\.(mod1.*|mod2)"): random.choice(levels)
+        for i in range(count)
+    }
+
+
+def baseline(lazy: dict[str, str], name: str) -> Spec.Level:
+    for pattern, level in lazy.items():
+        if re.match(pattern, name):
+            return max(Spec.Level.get(level), Spec.Level.LAZY)
+    return Spec.Level.LAZY
+
+
+def main():
+    print(f"{'rules':>6} {'re.match us':>12} {'cold us':>9} {'memo us':>9}  (per lookup, {len(NAMES)} names)")
+
+    for count in (10, 50, 100, 250, 500):
+        lazy = lazy_map(count)
+        per = 1e6 / len(NAMES)
+
+        base = timeit(lambda: [baseline(lazy, name) for name in NAMES], number=1) * per
+        rules = Rules(lazy, Spec.Level.LAZY)
+        cold = timeit(lambda: [rules.index(name) for name in NAMES], number=1) * per
+        [rules(name) for name in NAMES]
+        memo = timeit(lambda: [rules(name) for name in NAMES], number=10) * per / 10
+
+        print(f"{count:>6} {base:>12.2f} {cold:>9.2f} {memo:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
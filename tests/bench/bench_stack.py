@@ -0,0 +1,65 @@
+"""Benchmark: import lookup cost vs Finder nesting depth.
+
+    python -m tests.bench.bench_stack [depth ...]
+
+Times `importlib.util.find_spec()` for modules that don't exist (every meta_path entry is
+consulted) and for fresh modules (first lookups), with nested entered Finders
+(one shared `Stack` entry) vs the same Finders inserted into sys.meta_path one by one.
+"""
+import sys
+import tempfile
+from time import perf_counter
+from pathlib import Path
+from importlib.util import find_spec
+
+from lazi.core.finder import Finder
+
+
+def lookups(tmp: str, label: str, loops: int = 2000) -> tuple[float, float]:
+    start = perf_counter()
+    for index in range(loops):
+        find_spec(f"bench_sk_missing_{index}")
+    miss = (perf_counter() - start) / loops * 1e6
+
+    names = [f"bench_sk_{label}_{_}" for _ in range(200)]
+    for name in names:
+        (Path(tmp) / f"{name}.py").write_text("")
+
+    start = perf_counter()
+    for name in names:
+        find_spec(name)
+    first = (perf_counter() - start) / len(names) * 1e6
+    return miss, first
+
+
+def main(*depths: int):
+    depths = depths or (1, 4, 16)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+
+        for depth in depths:
+            finders = [Finder(NO_LAZY=0) for _ in range(depth)]
+
+            for finder in finders:
+                finder.__enter__()
+            stacked = lookups(tmp, f"s{depth}")
+            for finder in reversed(finders):
+                finder.__exit__(None, None, None)
+                finder.invalidate_caches()
+
+            for finder in finders:
+                sys.meta_path.insert(0, finder)  # The previous layout: one meta_path entry per Finder.
+            flat = lookups(tmp, f"f{depth}")
+            for finder in finders:
+                sys.meta_path.remove(finder)
+                finder.invalidate_caches()
+
+            print(
+                f"depth {depth:>2}: miss {stacked[0]:6.1f} us stacked / {flat[0]:6.1f} us per-finder, "
+                f"first lookup {stacked[1]:6.1f} us / {flat[1]:6.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
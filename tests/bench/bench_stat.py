@@ -0,0 +1,45 @@
+"""Benchmark: `Stat()` snapshot cost as the number of hooked modules grows.
+
+    python -m tests.bench.bench_stat [modules ...]
+
+`Stat()` reads the event-driven counters, `Stat.scan()` is the full scan it replaced.
+"""
+import sys
+import tempfile
+from time import perf_counter
+from pathlib import Path
+
+from tests.bench.tree import make
+
+from lazi.core.finder import Finder
+from lazi.core.stat import Stat
+
+
+def timed(func, loops: int) -> float:
+    start = perf_counter()
+    for _ in range(loops):
+        func()
+    return (perf_counter() - start) / loops * 1e6
+
+
+def main(*counts: int):
+    counts = counts or (100, 1000, 10000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+
+        for count in counts:
+            with Finder(NO_LAZY=0) as finder:
+                for name in make(Path(tmp), name=f"bench_st{count}", modules=count, fanout=32, style="none"):
+                    __import__(name)
+
+                assert Stat.check().find_spec >= count
+                fast = timed(Stat, 1000)
+                slow = timed(Stat.scan, max(10, 10000 // count))
+
+            finder.invalidate_caches()
+            print(f"{count:>6} modules: Stat() {fast:8.1f} us, Stat.scan() {slow:10.1f} us")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,145 @@
+"""Benchmark suite: plain imports vs every `Spec.Level`, over a synthetic package tree.
+
+    python -m tests.bench.bench_suite [--modules N] [--depth N] [--fanout N] [--cost N] [--style S]
+                                      [--runs N] [--json OUT] [--baseline JSON] [--tolerance F]
+
+Per variant, each run is a fresh interpreter that measures:
+
+- startup_ms: importing the root package (which imports the whole tree, unless --style none).
+- touch_us:   mean first attribute access of each leaf module (materialization of lazy ones).
+- access_ns:  attribute access through the leaf reference the importer holds (proxy or module).
+- rss_kib:    peak RSS at the end of the run.
+
+Metrics are the median over the runs. With --baseline (a previous --json output), exits with
+status 1 if any metric regressed by more than --tolerance (relative; plus a small absolute slack).
+"""
+import sys
+import json
+import argparse
+import platform
+import tempfile
+import subprocess
+from pathlib import Path
+from statistics import median
+
+from tests.bench.tree import make, env, STYLES
+
+VARIANTS = "plain", "LAZY", "SWAP", "LOAD", "UNMO", "UNLO"
+METRICS = "startup_ms", "touch_us", "access_ns", "rss_kib"
+SLACK = dict(startup_ms=1.0, touch_us=1.0, access_ns=10.0, rss_kib=1024)  # Absolute noise floor per metric.
+
+
+def child(root: str, variant: str, loops: int = 100000) -> dict:
+    import resource
+    from time import perf_counter
+    from importlib import import_module
+
+    sys.path.insert(0, root)
+    names = json.loads(Path(root, "names.json").read_text())
+    leaves = [name for name in names if not any(_.startswith(f"{name}.") for _ in names)]
+
+    if variant != "plain":
+        from lazi.core.finder import Finder
+        finder = Finder(NO_LAZY=Finder.Spec.Level[variant])
+
+    start = perf_counter()
+
+    if variant != "plain":
+        finder.__enter__()
+
+    import_module(names[0])
+    startup = perf_counter() - start
+
+    modules = [sys.modules.get(name) or import_module(name) for name in leaves]
+
+    start = perf_counter()
+    for module in modules:
+        module.VALUE
+    touch = (perf_counter() - start) / len(modules)
+
+    module = modules[0]
+    start = perf_counter()
+    for _ in range(loops):
+        module.VALUE
+    access = (perf_counter() - start) / loops
+
+    return dict(
+        startup_ms=startup * 1e3,
+        touch_us=touch * 1e6,
+        access_ns=access * 1e9,
+        rss_kib=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    )
+
+
+def run(root: str, variant: str) -> dict:
+    code = f"import json; from tests.bench.bench_suite import child; print(json.dumps(child({root!r}, {variant!r})))"
+    return json.loads(subprocess.run([sys.executable, "-c", code], env=env(), check=True, capture_output=True).stdout)
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    out = []
+    for variant, metrics in results.items():
+        for metric, value in metrics.items():
+            if (base := baseline.get(variant, {}).get(metric)) is not None and value > base * (1 + tolerance) + SLACK[metric]:
+                out.append(f"{variant} {metric}: {base:.1f} -> {value:.1f} (+{(value / base - 1) * 100 if base else 0:.0f}%)")
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_suite", description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=int, default=500)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--cost", type=int, default=1000, help="Busy-loop iterations per module body.")
+    parser.add_argument("--style", choices=STYLES, default="import")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", help="Write the results to this file.")
+    parser.add_argument("--baseline", help="Results file to check for regressions against.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    params = dict(modules=args.modules, depth=args.depth, fanout=args.fanout, cost=args.cost, style=args.style)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        names = make(Path(tmp), name="bench_st", **params)
+        Path(tmp, "names.json").write_text(json.dumps(names))
+        run(tmp, "plain")  # Writes the .pyc files.
+
+        results = {}
+
+        for variant in VARIANTS:
+            samples = [run(tmp, variant) for _ in range(args.runs)]
+            results[variant] = {metric: median(_[metric] for _ in samples) for metric in METRICS}
+            print(
+                f"{variant:>6}: " + "  ".join(f"{metric} {results[variant][metric]:9.1f}" for metric in METRICS),
+                file=sys.stderr,
+            )
+
+    output = dict(
+        python=platform.python_version(),
+        platform=platform.platform(),
+        params=params,
+        runs=args.runs,
+        results=results,
+    )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(output, indent=1) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+
+        if baseline.get("params") != params:
+            print(f"warning: baseline params differ: {baseline.get('params')}", file=sys.stderr)
+
+        if found := regressions(results, baseline["results"], args.tolerance):
+            print("regressions:\n  " + "\n  ".join(found), file=sys.stderr)
+            return 1
+
+        print("no regressions", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Benchmark: proxy overhead of the materialization lock.
+
+    python -m tests.bench.bench_threads [threads]
+
+- Attribute access on materialized (LOAD) proxies never takes a lock, so the per-access cost
+  should be the same for one thread and many threads (modulo the GIL).
+- Racing materializations: N threads touching the same cold proxies vs one thread.
+"""
+import sys
+import tempfile
+import threading
+from time import perf_counter
+from pathlib import Path
+
+from tests.bench.tree import make
+
+from lazi.core.finder import Finder
+
+
+def threaded(count: int, func) -> float:
+    barrier = threading.Barrier(count + 1)
+
+    def run():
+        barrier.wait()
+        func()
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    [_.start() for _ in threads]
+    barrier.wait()
+    start = perf_counter()
+    [_.join() for _ in threads]
+    return perf_counter() - start
+
+
+def main(count: int = 8, loops: int = 200_000, modules: int = 200):
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+
+        import tests.bench.tree as eager  # Reference (plain module).
+
+        with Finder(NO_LAZY=0) as finder:
+            names = make(Path(tmp), name="bench_thr", modules=modules, style="none")
+            proxies = [__import__(_, fromlist=["*"]) for _ in names]
+
+            start = perf_counter()
+            threaded(count, lambda: [mod.VALUE for mod in proxies])
+            race = perf_counter() - start
+
+            names = make(Path(tmp), name="bench_one", modules=modules, style="none")
+            single = [__import__(_, fromlist=["*"]) for _ in names]
+            start = perf_counter()
+            [mod.VALUE for mod in single]
+            solo = perf_counter() - start
+
+            proxy = proxies[-1]
+            assert type(proxy) is finder.Module
+
+            def access(mod=proxy):
+                for _ in range(loops):
+                    mod.VALUE
+
+            def plain(mod=eager):
+                for _ in range(loops):
+                    mod.make
+
+            one = threaded(1, access) / loops * 1e9
+            many = threaded(count, access) / (loops * count) * 1e9
+            base = threaded(1, plain) / loops * 1e9
+
+        finder.invalidate_caches()
+
+    print(f"materialize {modules} modules: 1 thread {solo * 1e3:.1f} ms, {count} racing threads {race * 1e3:.1f} ms")
+    print(f"loaded proxy getattr: 1 thread {one:.0f} ns, {count} threads {many:.0f} ns/op (plain module {base:.0f} ns)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,65 @@
+"""Benchmark: tracing overhead of proxied attribute access with TRACE off.
+
+    python -m tests.bench.bench_trace [loops]
+
+Runs the same loop in a `python` and a `python -O` subprocess: `-O` strips the trace asserts,
+so the difference is what tracing costs when it's disabled.
+"""
+import sys
+import subprocess
+
+from tests.bench.tree import env
+
+CODE = """
+import sys, tempfile
+from time import perf_counter
+from pathlib import Path
+from tests.bench.tree import make
+from lazi.core.finder import Finder
+
+loops = {loops}
+
+with tempfile.TemporaryDirectory() as tmp:
+    sys.path.insert(0, tmp)
+    with Finder(NO_LAZY=0) as finder:
+        name = make(Path(tmp), name="bench_trace", modules=1, style="none")[-1]
+        mod = __import__(name)
+        mod.VALUE
+        assert type(mod) is finder.Module
+
+        def get(mod=mod):
+            for _ in range(loops):
+                mod.VALUE
+
+        def put(mod=mod):
+            for _ in range(loops):
+                mod.VALUE = 1
+
+        for func in (get, put):
+            func()
+            start = perf_counter()
+            func()
+            print(f"{{(perf_counter() - start) / loops * 1e9:.0f}}", end=" ")
+    finder.invalidate_caches()
+"""
+
+
+def main(loops: int = 200_000):
+    results = {}
+
+    for label, flags in (("python", []), ("python -O", ["-O"])):
+        out = subprocess.run(
+            [sys.executable, *flags, "-c", CODE.format(loops=loops)],
+            capture_output=True, text=True, check=True, env=env(),
+        ).stdout.split()
+        results[label] = tuple(map(int, out))
+
+    for label, (get, put) in results.items():
+        print(f"{label:>10}: getattr {get:5d} ns, setattr {put:5d} ns (loaded proxy, TRACE=0)")
+
+    (get, put), (get_o, put_o) = results.values()
+    print(f"  overhead: getattr {get - get_o:+d} ns, setattr {put - put_o:+d} ns")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
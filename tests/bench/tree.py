@@ -0,0 +1,77 @@
+"""Synthetic package trees for the benchmarks.
+
+The benchmarks run as modules of the repo, from its root (`python -m tests.bench.<name>`),
+which puts it on sys.path. Their subprocesses get it from `env()`, wherever they run.
+"""
+import os
+from pathlib import Path
+
+__all__ = "make", "env", "ROOT", "STYLES"
+
+ROOT = str(Path(__file__).resolve().parents[2])
+
+STYLES = "import", "from", "none"
+
+
+def env(**extra: str) -> dict[str, str]:
+    """Environment for benchmark subprocesses: the repo root on PYTHONPATH, plus `extra`.
+    """
+    path = os.pathsep.join(_ for _ in (ROOT, os.environ.get("PYTHONPATH", "")) if _)
+    return dict(os.environ, PYTHONPATH=path, **extra)
+
+
+def make(
+        root: Path,
+        name: str = "synth",
+        modules: int = 200,     # Total number of modules (packages included).
+        depth: int = 3,         # Maximum package nesting depth.
+        fanout: int = 8,        # Children per package.
+        cost: int = 0,          # Busy-loop iterations executed by each module body.
+        style: str = "import",  # How packages import their children (see STYLES).
+) -> list[str]:
+    """Write a package tree under `root` and return its module names in creation order.
+    """
+    assert style in STYLES, style
+
+    names, queue = [name], [(name, 0)]
+
+    while queue and len(names) < modules:
+        parent, level = queue.pop(0)
+
+        for index in range(fanout):
+            if len(names) >= modules:
+                break
+            names.append(child := f"{parent}.m{index}")
+            if level + 1 < depth:
+                queue.append((child, level + 1))
+
+    tree: dict[str, list[str]] = {}  # Package -> children, in creation order.
+
+    for mod in names[1:]:
+        tree.setdefault(mod.rpartition(".")[0], []).append(mod)
+
+    for mod in names:
+        children = tree.get(mod, ())
+        path = root.joinpath(*mod.split("."))
+
+        if mod in tree or mod == name:
+            path.mkdir(parents=True, exist_ok=True)
+            path = path / "__init__.py"
+        else:
+            path = path.with_suffix(".py")
+
+        body = [
+            *(
+                f"import {_}" if style == "import" else
+                f"from . import {_.rpartition('.')[2]}" if style == "from" else
+                ""
+                for _ in children
+            ),
+            f"VALUE = {len(mod)}",
+            f"_ = sum(range({cost}))" if cost else "",
+            "def func(): return VALUE",
+        ]
+
+        path.write_text("\n".join(_ for _ in body if _) + "\n")
+
+    return names
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+class Tree:
+    """Modules written for a test, on sys.path, see the `tree` fixture.
+    """
+    root: Path
+    tops: set[str]      # Top-level module names written.
+    finders: set[int]   # Finders that existed before the test.
+
+    def __init__(self, root: Path):
+        from lazi.core.finder import Finder
+
+        self.root = root
+        self.tops = set()
+        self.finders = {id(_) for _ in Finder.__finders__}
+
+    def __call__(self, files: dict[str, str]) -> Path:
+        """Write `{"pkg/mod.py": source, ...}` under the root, and return the root.
+        """
+        for name, source in files.items():
+            (path := self.root / name).parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source)
+            self.tops.add(name.partition("/")[0].removesuffix(".py"))
+        return self.root
+
+    def clear(self) -> None:
+        """Invalidate the Finders created by the test, and drop the written modules from sys.modules.
+        """
+        from lazi.core.finder import Finder
+
+        for finder in [_ for _ in Finder.__finders__ if id(_) not in self.finders]:
+            finder.invalidate_caches()
+
+        for name in [_ for _ in sys.modules if _.partition(".")[0] in self.tops]:
+            del sys.modules[name]
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """Module tree under `tmp_path`, cleaned up after the test with the `Persistent` instances it opened.
+    """
+    from lazi.util import Persistent
+
+    instances = {cls: dict(cls.__instances__) for cls in Persistent.__classes__}
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    yield (tree := Tree(tmp_path))
+
+    tree.clear()
+
+    for cls in Persistent.__classes__:
+        cls.__instances__.clear()
+        cls.__instances__.update(instances.get(cls, {}))
@@ -13,3 +13,55 @@ def test_asyncio():
         debug.trace("^- coroutines = asyncio.coroutines -^")
 
     lazi.invalidate_caches()
+
+
+def test_aimport(tree):
+    import asyncio
+    import threading
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+
+    tree({f"{_}.py": "import time, threading\ntime.sleep(0.1)\nTHREAD = threading.get_ident()\n" for _ in ("aio_slow", "aio_lazy")})
+
+    finder = Finder(NO_LAZY=0)
+
+    with finder:
+        import aio_lazy
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        module = await finder.aimport("aio_slow")
+        assert await Finder.ensure(aio_lazy) is aio_lazy
+        task.cancel()
+        return module, ticks
+
+    module, ticks = asyncio.run(main())
+
+    assert ticks >= 10  # The loop kept running while both modules executed.
+    assert module.THREAD != threading.get_ident() and aio_lazy.THREAD != threading.get_ident()
+    assert finder.specs["aio_slow"].loader_state is finder.specs["aio_lazy"].loader_state is Loader.State.LOAD
+
+
+def test_aimport_concurrent(tree):
+    import asyncio
+    from lazi.core.finder import Finder, __stack__
+
+    names = [f"aio_many{_}" for _ in range(16)]
+    tree({f"{_}.py": "import time\ntime.sleep(0.01)\nVALUE = 1\n" for _ in names})
+
+    finder = Finder(NO_LAZY=0)
+    finders = list(__stack__.finders)
+
+    async def main():
+        return await asyncio.gather(*(finder.aimport(name) for name in names))
+
+    assert [module.VALUE for module in asyncio.run(main())] == [1] * len(names)
+    assert finder.refs == 0 and __stack__.finders == finders  # Entered and exited from concurrent workers.
@@ -0,0 +1,29 @@
+import pytest
+
+
+def test_batch(tree):
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+    from lazi.core.batch import StagedLoader
+
+    tree({
+        "bt_pkg/__init__.py": "",
+        "bt_pkg/sub/__init__.py": "",
+        **{f"bt_pkg/sub/{_}.py": f"VALUE = {_!r}\n" for _ in ("a", "b")},
+        "bt_top.py": "VALUE = 'top'\n",
+        "bt_bad.py": "VALUE = (\n",
+    })
+
+    finder = Finder(NO_LAZY=0)
+    a, b, top = finder.batch([".a", ".b", "bt_top"], "bt_pkg.sub")[:2] + finder.batch(["bt_top"])
+
+    spec = finder.specs["bt_pkg.sub.a"]
+    assert spec.loader_state is Loader.State.LAZY and type(spec.loader.loader) is StagedLoader
+    assert spec.loader.loader.code is not None
+
+    assert (a.VALUE, b.VALUE, top.VALUE) == ("a", "b", "top")
+    assert spec.loader_state is Loader.State.LOAD and spec.loader.loader.code is None
+
+    with pytest.raises(ImportError) as error:
+        finder.batch(["bt_bad"])[0].VALUE
+    assert isinstance(error.value.__cause__, SyntaxError)  # Not staged, raised by the regular get_code().
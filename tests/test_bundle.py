@@ -0,0 +1,29 @@
+def test_bundle(tree, tmp_path, monkeypatch):
+    from lazi.core.finder import Finder
+    from lazi.core.bundle import Bundle, BundleLoader, build
+
+    src = tree({"bd_pkg/__init__.py": "from . import mod\n", "bd_pkg/mod.py": "VALUE = 1\n", "bd_top.py": "VALUE = 2\n"})
+
+    path = str(tmp_path / "cache" / "app.bundle")
+    assert build(path, ["bd_pkg", "bd_pkg.mod", "bd_top", "bd_missing", "sys"]) == 3
+
+    (src / "bd_top.py").write_text("VALUE = 3\n")  # Stale: served by the regular loader.
+
+    with Finder(NO_LAZY=2, BUNDLE=path) as finder:
+        import bd_pkg, bd_top
+        assert bd_pkg.mod.VALUE == 1 and bd_top.VALUE == 3
+
+    bundle = Bundle.open(path)
+    assert type(finder.specs["bd_pkg.mod"].loader.loader) is BundleLoader
+    assert (bundle.hits, bundle.miss) == (2, 1)
+
+    (src / "bd_pkg" / "mod.py").unlink()  # Deleted source: left to the regular finders.
+    assert bundle.find_spec("bd_pkg.mod", [str(src / "bd_pkg")]) is None
+
+    (over := tmp_path / "over").mkdir()
+    (over / "bd_pkg").mkdir()
+    (over / "bd_pkg" / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(over))  # Earlier entry with the same name: not served from the bundle.
+    assert bundle.find_spec("bd_pkg", None) is None
+
+    bundle.close()
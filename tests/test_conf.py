@@ -0,0 +1,50 @@
+import os
+import sys
+import subprocess
+
+CODE = """
+import sys
+from lazi.conf import conf
+print(conf.TRACE, sorted(conf.LAZY) == sorted(__import__("lazi.conf.lazy").conf.lazy.LAZY), "lazi.conf.lazy" in sys.modules)
+"""
+
+PROBE = """
+import sys
+from lazi.conf import conf
+conf.get()
+print("lazi.conf.lazy" in sys.modules)
+"""
+
+
+def test_conf_cache(tmp_path):
+    cache = tmp_path / "conf.cache"
+    env = dict(os.environ, CONF_CACHE=str(cache), PYTHONPATH=os.getcwd())
+    env.pop("TRACE", None)
+
+    def run(code: str = PROBE, **kwds) -> str:
+        return subprocess.run(
+            [sys.executable, "-c", code], env=dict(env, **kwds), capture_output=True, text=True, check=True,
+        ).stdout.strip()
+
+    assert run() == "True" and cache.exists()  # Built, and imported the conf modules.
+    assert run() == "False"                     # Read from the cache.
+    assert run(CODE) == "0 True True"           # Same values as the modules.
+    assert run(TRACE="1") == "True"             # Conf env vars are part of the cache key.
+    assert run(TRACE="1") == "False"
+
+
+def test_conf_cache_new_dir(tmp_path):
+    cache = tmp_path / "conf.cache"
+    (extra := tmp_path / "extra" / "lazi" / "conf").mkdir(parents=True)
+    (extra / "project.py").write_text("CONTEXT_INVALIDATION = True\n")
+
+    def run(*path: str) -> str:
+        env = dict(os.environ, CONF_CACHE=str(cache), PYTHONPATH=os.pathsep.join((os.getcwd(), *path)))
+        env.pop("TRACE", None)
+        code = "from lazi.conf import conf; print(conf.CONTEXT_INVALIDATION)"
+        return subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+
+    assert run() == "False" and cache.exists()
+    assert run(str(tmp_path / "extra")) == "True"  # Conf dir added after the cache was written.
@@ -0,0 +1,54 @@
+import sys
+
+
+def test_lazy_from(tree, monkeypatch):
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+    from lazi.core.defer import Deferred
+
+    tree({
+        "df_pkg/__init__.py": (
+            "EXECUTED = []\n"
+            "EXECUTED.append(__name__)\n"
+            "class Base:\n"
+            "    pass\n"
+            "def func(value):\n"
+            "    return value * 2\n"
+            "SIZE = 3\n"
+        ),
+        "df_pkg/sub.py": "VALUE = 42\n",
+        "df_user.py": (
+            "from df_pkg import Base, func, SIZE, sub, missing\n"
+            "def get(name):\n"
+            "    return globals()[name]\n"
+        ),
+    })
+    monkeypatch.setattr(Loader, "LAZY_FROM", True)
+
+    with Finder(NO_LAZY=0, LAZY={r"^df_user$": "UNLO"}) as finder:
+        import df_user
+        pkg = sys.modules["df_pkg"]
+        assert type(pkg) is finder.Module
+        assert pkg.__spec__.loader_state is Loader.State.LAZY  # Not materialized by the `from` import.
+        assert all(type(df_user.get(_)) is Deferred for _ in ("Base", "func", "SIZE", "sub"))
+
+        assert df_user.func(2) == 4  # Materializes df_pkg, then rebinds.
+        assert pkg.EXECUTED == ["df_pkg"]
+        assert df_user.get("func") is pkg.func
+
+        assert df_user.SIZE + 1 == 4 and 1 + df_user.SIZE == 4
+        assert isinstance(df_user.get("Base")(), df_user.get("Base"))
+
+        class Derived(df_user.get("Base")):
+            pass
+
+        assert issubclass(Derived, pkg.Base)
+        assert df_user.get("sub").VALUE == 42  # Submodule fallback.
+        assert df_user.get("sub") is sys.modules["df_pkg.sub"]
+
+        try:
+            df_user.missing()
+        except ImportError as e:
+            assert "missing" in str(e)
+        else:
+            assert False
@@ -0,0 +1,53 @@
+def test_analyze():
+    from lazi.core.effects import analyze
+
+    effects, imports = analyze(
+        "import os, json\n"
+        "import a.b\n"
+        "import c.d\n"
+        "from .conf import settings\n"
+        "from other import REGISTRY\n"
+        "__all__ = ['c']\n"
+        "os.environ['X'] = '1'\n"
+        "REGISTRY.append(1)\n"
+        "DEBUG = settings.DEBUG\n"
+        "HANDLER = lambda: json.register(1)\n"
+        "def f():\n"
+        "    os.sep = '/'\n"
+        "if __name__ == '__main__':\n"
+        "    json.dumps = None\n",
+        "pkg.mod",
+    )
+    assert [kind for kind, *_ in effects] == ["patch", "regs", "conf"]
+    assert effects[0][1:] == (7, "os.environ['X'] = '1'")
+    assert imports == ["a.b"]
+
+    assert analyze("import json\nVALUE = json.dumps(1)\n", "mod") == ([], [])
+
+
+def test_effects(tree, tmp_path):
+    from lazi.core.finder import Finder
+    from lazi.core.effects import Effects
+
+    tree({
+        "ef_reg.py": "REGISTRY = []\n",
+        "ef_a.py": "import ef_reg\nef_reg.REGISTRY.append(1)\n",
+        "ef_b.py": "import ef_reg\nVALUE = 1\n",
+    })
+    cache = str(tmp_path / "effects.marshal")
+
+    with Finder(NO_LAZY=0, EFFECTS=True, EFFECTS_CACHE=cache) as finder:
+        import ef_a, ef_b
+        assert finder.specs["ef_a"].level == Finder.Spec.Level.UNLO
+        assert finder.specs["ef_b"].level == Finder.Spec.Level.LAZY
+        assert finder.effects.found["ef_a"][0][0] == "regs"
+
+    other = Finder(NO_LAZY=0, EFFECTS=True, EFFECTS_CACHE=cache, EFFECTS_LEVEL="LOAD")
+    assert other.effects is finder.effects and other.get_level("ef_a") == Finder.Spec.Level.LOAD
+    assert finder.get_level("ef_a") == Finder.Spec.Level.UNLO
+
+    finder.effects.save()
+
+    effects = Effects(cache)  # Reloaded from the file.
+    assert str(tmp_path / "ef_a.py") in effects.entries and not effects.dirty
+    assert effects.entry("ef_a", str(tmp_path / "ef_a.py"), False) is effects.entries[str(tmp_path / "ef_a.py")]
@@ -0,0 +1,57 @@
+import json
+import socket
+
+
+def test_export(tree, tmp_path):
+    from lazi.core.finder import Finder
+    from lazi.core.export import Exporter
+
+    tree({"ex_mod.py": "VALUE = 1\n"})
+
+    exporter = Exporter(address="127.0.0.1:0", jsonl=str(tmp_path / "out" / "lazi.jsonl"), interval=0.01, ring=2)
+    exporter.start()
+
+    try:
+        with Finder(NO_LAZY=0):
+            import ex_mod
+            assert ex_mod.VALUE == 1
+
+        with socket.create_connection(exporter.bound) as sock:
+            sock.sendall(b"GET /metrics HTTP/1.0\r\n\r\n")
+            response = b"".join(iter(lambda: sock.recv(4096), b"")).decode()
+
+        assert response.startswith("HTTP/1.0 200")
+        assert 'lazi_specs{state="LOAD"}' in response
+        assert 'lazi_materializations_total{mode="lazy"} 1' in response
+        assert exporter.meter.wall_totl > 0
+
+        exporter.stop()
+        lines = (tmp_path / "out" / "lazi.jsonl").read_text().splitlines()
+        assert 1 <= len(lines) <= 4
+        assert {"time", "pid", "find_spec", "load_full", "exec_lazy"} <= set(json.loads(lines[-1]))
+
+    finally:
+        exporter.stop()
+
+    (tmp_path / "out" / "lazi.jsonl").write_text("{}\n" * 10)  # Restart on a longer file: trimmed to the ring.
+    exporter = Exporter(address=None, jsonl=str(tmp_path / "out" / "lazi.jsonl"), interval=10, ring=2).start()
+    exporter.stop()
+    assert (tmp_path / "out" / "lazi.jsonl").read_text().splitlines()[:2] == ["{}", "{}"]
+    assert len((tmp_path / "out" / "lazi.jsonl").read_text().splitlines()) == 3
+
+
+def test_export_unix(tmp_path):
+    from lazi.core.export import Exporter
+
+    exporter = Exporter(address=f"unix:{tmp_path / 'lazi.sock'}", jsonl=None).start()
+
+    try:
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(exporter.bound)
+            sock.sendall(b"GET /metrics HTTP/1.0\r\n\r\n")
+            response = b"".join(iter(lambda: sock.recv(4096), b"")).decode()
+    finally:
+        exporter.stop()
+
+    assert "# TYPE lazi_specs gauge" in response
+    assert not (tmp_path / "lazi.sock").exists()
@@ -0,0 +1,31 @@
+def test_graph(tree):
+    from lazi.core.finder import Finder
+    from lazi.core.graph import __graph__
+
+    tree({
+        "gr_a.py": "import gr_b, gr_c\nVALUE = gr_b.VALUE + sum(range(200000))\n",
+        "gr_b.py": "import gr_d\nVALUE = gr_d.VALUE\n",
+        "gr_c.py": "VALUE = 3\n",
+        "gr_d.py": "VALUE = sum(range(100000))\n",
+    })
+
+    __graph__.install().clear()
+
+    try:
+        with Finder(NO_LAZY=0):
+            import gr_a
+            assert gr_a.VALUE
+    finally:
+        __graph__.uninstall()
+
+    edges = set(__graph__.edges)
+    assert {(__name__, "gr_a", "import"), ("gr_a", "gr_b", "import"), ("gr_a", "gr_c", "import")} <= edges
+    assert {(__name__, "gr_a", "trigger"), ("gr_a", "gr_b", "trigger"), ("gr_b", "gr_d", "trigger")} <= edges
+    assert {("gr_a", "gr_b", "nested"), ("gr_b", "gr_d", "nested")} <= edges
+    assert __graph__.order == ["gr_a", "gr_b", "gr_d"] and __graph__.nodes["gr_c"]["executed"] is None
+
+    assert [name for name, *_ in __graph__.critical()] == ["gr_a", "gr_b", "gr_d"]
+    assert __graph__.dump()["critical"][0]["name"] == "gr_a"
+    assert '"gr_b" -> "gr_d" [style=dotted, color=red];' in __graph__.dot()
+
+    __graph__.clear()
@@ -0,0 +1,27 @@
+def test_index_roundtrip(tree, tmp_path):
+    from lazi.core.index import Index
+    from lazi.core.finder import Finder
+
+    tree({"idx_pkg/__init__.py": "from . import sub\n", "idx_pkg/sub.py": "VALUE = 1\n"})
+    (tmp_path / "cache").mkdir()
+
+    path = str(tmp_path / "cache" / "index.marshal")  # Not on sys.path, or saving it would invalidate it.
+
+    with Finder(SPEC_INDEX=path, NO_LAZY=2):
+        import idx_pkg
+        assert idx_pkg.sub.VALUE == 1
+
+    index = Index.open(path)
+    assert {"idx_pkg", "idx_pkg.sub"} <= set(index.entries)
+    index.save()
+
+    fresh = Index(path)
+    spec = fresh.get("idx_pkg", None)
+    assert spec is not None and spec.origin == str(tmp_path / "idx_pkg" / "__init__.py")
+    assert spec.submodule_search_locations == [str(tmp_path / "idx_pkg")]
+    assert fresh.get("idx_pkg.sub", spec.submodule_search_locations).origin.endswith("sub.py")
+
+    (tmp_path / "idx_pkg" / "other.py").write_text("")  # Package directory changed.
+    stale = Index(path)
+    assert stale.get("idx_pkg.sub", spec.submodule_search_locations) is None
+    assert stale.dirty
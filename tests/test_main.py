@@ -0,0 +1,30 @@
+import os
+import sys
+import json
+import subprocess
+
+SCRIPT = """
+import sys, colorsys
+from lazi.core.stat import Stat
+print(sys.argv[1:], __name__, type(colorsys).__name__, Stat().load_lazy)
+"""
+
+
+def test_main(tmp_path):
+    (script := tmp_path / "mn_script.py").write_text(SCRIPT)
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    env.pop("TRACE", None)
+
+    def run(*args: str) -> subprocess.CompletedProcess:
+        return subprocess.run([sys.executable, "-m", "lazi", *args], env=env, capture_output=True, text=True, check=True)
+
+    out = run("--level", "lazy", str(script), "a", "-b").stdout.split()
+    assert out[:4] == ["['a',", "'-b']", "__main__", "Module"] and int(out[4]) >= 1
+    assert run("--lazy", "^colorsys$=UNLO", str(script)).stdout.split()[2] == "module"
+
+    run("--report", str(report := tmp_path / "report.json"), "-m", "json.tool", "--help")
+    data = json.loads(report.read_text())
+    assert data["modules"] and data["rss_kib"] and data["stat"]["find_spec"]
+
+    lines = run("--ab", "1", "-l", "LAZY", str(script)).stderr.splitlines()
+    assert lines[1].split() == ["eager", "lazy", "diff"] and lines[-1].strip().startswith("hooked modules:")
@@ -0,0 +1,53 @@
+import io
+
+
+def test_mem_nested(tree):
+    from lazi.core.finder import Finder
+    from lazi.core.mem import __memory__
+    from lazi.core.stat import Mem
+
+    tree({
+        "mem_pkg/__init__.py": "DATA = bytearray(4 << 20)\nfrom . import inner\nSIZE = len(inner.DATA)\n",
+        "mem_pkg/inner.py": "DATA = bytearray(1 << 20)\n",
+    })
+
+    __memory__.install().clear()
+
+    try:
+        with Finder(NO_LAZY=0):
+            import mem_pkg
+            assert not Mem().records
+            assert len(mem_pkg.DATA) == 4 << 20
+    finally:
+        __memory__.uninstall()
+
+    mem = Mem()
+    inner, outer = mem.records
+
+    assert (outer.name, outer.depth, outer.lazy) == ("mem_pkg", 0, True)
+    assert (inner.name, inner.depth) == ("mem_pkg.inner", 1)
+    assert 1 << 20 <= inner.size_self < 2 << 20
+    assert 4 << 20 <= outer.size_self < 5 << 20 and outer.size_self == outer.size - inner.size
+    assert mem.top(1)[0] is outer and mem.size_lazy == mem.size_totl
+
+    mem.table(file=(out := io.StringIO()))
+    assert out.getvalue().splitlines()[1].endswith("| yes  | mem_pkg")
+
+    __memory__.clear()
+
+
+def test_mem_mode():
+    import pytest
+    from lazi.core.loader import Loader
+    from lazi.core.mem import Memory
+
+    memory = Memory(7)  # Validated when installed, not when created (as `__memory__` is at import).
+
+    with pytest.raises(ValueError):
+        memory.install()
+
+    assert memory not in Loader.hooks
+
+    memory = Memory(2).install()  # Current RSS, from /proc.
+    assert memory.measure()[0] > 0
+    memory.uninstall()
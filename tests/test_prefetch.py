@@ -0,0 +1,37 @@
+import time
+import builtins
+
+
+def test_prefetch(tree, monkeypatch):
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+    from lazi.core.prefetch import Prefetcher
+
+    names = [f"pf_mod{_}" for _ in range(4)]
+    tree({
+        f"{_}.py": (
+            "import time, builtins\n"
+            "builtins._lazi_prefetch.append(__name__)\n"
+            "time.sleep(0.05)\n"
+            "VALUE = 1\n"
+        )
+        for _ in names
+    })
+    monkeypatch.setattr(builtins, "_lazi_prefetch", [], raising=False)
+
+    with Finder(NO_LAZY=0) as finder:
+        modules = [__import__(name) for name in names]
+        assert not builtins._lazi_prefetch
+
+        prefetcher = Prefetcher(names + ["pf_missing"], idle=0.01).start()
+        time.sleep(0.08)
+        assert modules[2].VALUE == 1  # Races with the prefetcher.
+
+        deadline = time.monotonic() + 5
+        while len(set(prefetcher.done) | {names[2]}) < len(names) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        prefetcher.stop(1)
+
+    assert sorted(builtins._lazi_prefetch) == names  # Each module executed exactly once.
+    assert all(finder.specs[name].loader_state is Loader.State.LOAD for name in names)
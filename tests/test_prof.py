@@ -0,0 +1,64 @@
+import io
+
+
+def test_prof_nested(tree):
+    from lazi.core.finder import Finder
+    from lazi.core.prof import __profiler__
+    from lazi.core.stat import Prof
+
+    tree({
+        "prof_pkg/__init__.py": "from . import inner\nVALUE = inner.VALUE\n",
+        "prof_pkg/inner.py": "VALUE = sum(range(100000))\n",
+    })
+
+    __profiler__.install().clear()
+
+    try:
+        with Finder(NO_LAZY=0):
+            import prof_pkg
+            assert not Prof().records
+            assert prof_pkg.VALUE
+    finally:
+        __profiler__.uninstall()
+
+    prof = Prof()
+    inner, outer = prof.records
+
+    assert (outer.name, outer.depth, outer.lazy) == ("prof_pkg", 0, True)
+    assert (inner.name, inner.depth) == ("prof_pkg.inner", 1)
+    assert outer.wall >= inner.wall and outer.wall_self == outer.wall - inner.wall
+    assert prof.exec_lazy == 2 and prof.exec_fail == 0
+    assert prof.top(1, "wall")[0] is outer
+
+    prof.importtime(out := io.StringIO())
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "import time: self [us] | cumulative | imported package"
+    assert lines[1].endswith("|   prof_pkg.inner") and lines[2].endswith("| prof_pkg")
+
+    __profiler__.clear()
+
+
+def test_prof_in_except(tree):
+    from lazi.core.finder import Finder
+    from lazi.core.prof import __profiler__
+    from lazi.core.stat import Prof
+
+    tree({"prof_exc.py": "VALUE = 1\n"})
+
+    __profiler__.install().clear()
+
+    try:
+        with Finder(NO_LAZY=0):
+            import prof_exc
+            try:
+                {}["missing"]
+            except KeyError:
+                assert prof_exc.VALUE == 1  # Materialized while a handled exception is current.
+    finally:
+        __profiler__.uninstall()
+
+    prof = Prof()
+    assert [(rec.name, rec.error) for rec in prof.records] == [("prof_exc", None)]
+    assert prof.exec_fail == 0
+
+    __profiler__.clear()
@@ -0,0 +1,31 @@
+import sys
+import types
+
+
+def test_rebind(tree, monkeypatch):
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+
+    user = (
+        "import rb_pkg.heavy as heavy\n"
+        "def get():\n"
+        "    return heavy.VALUE\n"
+    )
+    tree({"rb_pkg/__init__.py": "", "rb_pkg/heavy.py": "VALUE = 42\n", "rb_user.py": user, "rb_late.py": user})
+    monkeypatch.setattr(Loader, "REBIND", True)
+
+    with Finder(NO_LAZY=0, LAZY={r"^rb_(user|late)$": "UNLO"}) as finder:
+        import rb_user
+        proxy = rb_user.heavy
+        assert type(proxy) is finder.Module
+
+        assert rb_user.get() == 42  # Materializes, then rebinds the importer.
+        target = sys.modules["rb_pkg.heavy"]
+        assert type(target) is types.ModuleType and target is not proxy
+        assert rb_user.heavy is target
+
+        import rb_late  # Imported after the swap in sys.modules.
+        assert rb_late.heavy is target
+
+        holder = types.SimpleNamespace(mod=proxy)
+        assert holder.mod.VALUE == 42  # Stale references keep working through the proxy.
@@ -0,0 +1,112 @@
+import pytest
+
+
+def test_recover(tree, tmp_path):
+    from lazi.core.finder import Finder
+    from lazi.core.recover import Recovery
+
+    tree({
+        "rc_pkg/__init__.py": "from . import setup, user\n",
+        "rc_pkg/reg.py": "REGISTRY = {}\n",
+        "rc_pkg/setup.py": "from . import reg\nreg.REGISTRY['x'] = 1\n",
+        "rc_pkg/user.py": "from . import reg\nVALUE = reg.REGISTRY['x']\n",
+        "rc_pkg/extra.py": "",
+    })
+
+    with Finder(NO_LAZY=0) as finder:
+        import rc_pkg
+        with pytest.raises(ImportError):
+            rc_pkg.user.VALUE
+
+    tree.clear()
+
+    recovery = Recovery(path := str(tmp_path / "rules.json")).install()
+
+    try:
+        with Finder(NO_LAZY=0) as finder:
+            import rc_pkg
+            assert rc_pkg.user.VALUE == 1
+            assert finder.specs["rc_pkg.reg"].loader_state is finder.Loader.State.LOAD
+            assert not recovery.pending  # Only lazy specs that didn't execute yet are kept.
+    finally:
+        recovery.uninstall()
+
+    assert recovery.events == [dict(
+        name="rc_pkg.user", error=recovery.events[0]["error"], reset=[], loaded=["rc_pkg.setup"], recovered=True,
+    )]
+    assert recovery.levels == {"rc_pkg.setup": Finder.Spec.Level.UNLO, "rc_pkg.user": Finder.Spec.Level.UNLO}
+
+    recovery.save()
+    tree.clear()
+
+    recovery = Recovery(path).install()
+
+    try:
+        with Finder(NO_LAZY=0) as finder:
+            import rc_pkg
+            assert finder.get_level("rc_pkg.setup") == Finder.Spec.Level.UNLO
+            assert rc_pkg.user.VALUE == 1 and not recovery.events
+
+            import rc_pkg.extra
+            assert [_.name for _ in recovery.pending["rc_pkg"].values()] == ["rc_pkg.extra"]
+            Recovery().leave(finder.specs["rc_pkg.extra"], None, None)  # Installed mid-execution: no enter().
+
+        tree.clear()
+        assert not recovery.pending  # Invalidated specs are dropped.
+    finally:
+        recovery.uninstall()
+
+
+def test_recover_threads(tree, monkeypatch):
+    import builtins
+    import threading
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+    from lazi.core.recover import Recovery
+
+    tree({
+        "rt_pkg/__init__.py": "from . import setup, user\n",
+        "rt_pkg/reg.py": "REGISTRY = {}\n",
+        "rt_pkg/setup.py": (
+            "import builtins\nbuiltins._rt_sync()\n"
+            "from . import reg\nreg.REGISTRY['x'] = 1\nfrom . import user\nUSER = user.VALUE\n"
+        ),
+        "rt_pkg/user.py": "from . import reg\nVALUE = reg.REGISTRY['x']\n",
+    })
+
+    started, failed = threading.Event(), threading.Event()
+
+    def sync() -> None:  # In the setup thread: let the main thread fail on `user` first.
+        started.set()
+        failed.wait(5)
+
+    class Failed(Loader.Hook):
+        def leave(self, spec, token, error, /) -> None:
+            if spec.name == "rt_pkg.user" and error is not None:
+                failed.set()
+
+    monkeypatch.setattr(builtins, "_rt_sync", sync, raising=False)
+    Loader.hook(hook := Failed())
+    recovery = Recovery().install()
+
+    try:
+        with Finder(NO_LAZY=0) as finder:
+            import rt_pkg
+
+            # The setup thread holds the `setup` module lock and then needs `user`, while the main
+            #  thread's recovery of `user` loads `setup` first: `user` is not locked meanwhile.
+            thread = threading.Thread(target=lambda: rt_pkg.setup.USER)
+            thread.start()
+            assert started.wait(5)
+            assert rt_pkg.user.VALUE == 1
+            thread.join(5)
+
+            assert not thread.is_alive() and rt_pkg.setup.USER == 1
+            assert finder.specs["rt_pkg.user"].loader_state is Loader.State.LOAD
+    finally:
+        recovery.uninstall()
+        Loader.unhook(hook)
+
+    assert [(_["name"], _["loaded"], _["recovered"]) for _ in recovery.events] == [
+        ("rt_pkg.user", ["rt_pkg.setup"], True),
+    ]
@@ -0,0 +1,29 @@
+import importlib.abc
+from types import ModuleType
+
+
+def test_release(tree, monkeypatch):
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+    from lazi.core.stat import Stat
+
+    tree({"rl_unmo.py": "VALUE = 1\n", "rl_swap.py": "VALUE = 2\n"})
+    monkeypatch.setattr(Loader, "RELEASE", True)
+
+    finder = Finder(LAZY={"^rl_unmo$": "UNMO", "^rl_swap$": "SWAP"})
+
+    with finder:
+        import rl_unmo, rl_swap
+
+    loader = finder.specs["rl_swap"].loader
+    assert isinstance(loader, importlib.abc.Loader) and not hasattr(loader, "__dict__")
+
+    assert type(rl_unmo) is ModuleType and rl_unmo.VALUE == 1
+    spec = finder.specs["rl_unmo"]
+    assert spec.loader_state is None and not isinstance(spec.loader, Loader)
+    assert rl_unmo.__loader__ is spec.loader and spec.target is None
+
+    assert rl_swap.VALUE == 2 and type(rl_swap) is ModuleType
+    assert loader.spec.loader_state is Loader.State.LOAD and loader.binders is loader.deferred is None
+
+    Stat.check()
@@ -0,0 +1,66 @@
+import re
+
+import pytest
+
+
+def reference(lazy, no_lazy, name):
+    from lazi.core.spec import Spec
+
+    for pattern, level in lazy.items():
+        if re.match(pattern, name):
+            return max(Spec.Level.get(level), no_lazy)
+    return no_lazy
+
+
+LAZY = {
+    r"^pandas\.core\.|^pandas\._config": "UNLO",
+    r"^requests\.utils|^certifi": "UNLO",
+    r"^django\.(db\.models.*|conf.*|utils.*)": "UNLO",
+    r"^django\.utils\.version$": "LAZY",
+    r"^pandas": "LOAD",
+    r"^(\w+)\.\1": "UNMO",
+    r"(?i)^TOOLZ": 1,
+    r"^rich.*": "SWAP",
+}
+
+NAMES = [
+    "pandas", "pandas.core", "pandas.core.nanops", "pandas._config.config", "pandas.io",
+    "requests", "requests.utils", "certifi", "certifi.core",
+    "django", "django.utils", "django.utils.version", "django.db.models.base", "django.test",
+    "foo.foo", "foo.bar", "toolz", "rich.console", "richer", "os", "os.path",
+]
+
+
+@pytest.mark.parametrize("no_lazy", [0, 1, 2, 4])
+def test_rules_reference(no_lazy):
+    from lazi.core.spec import Spec
+    from lazi.core.rules import Rules
+
+    rules = Rules(LAZY, Spec.Level(no_lazy))
+
+    for name in NAMES:
+        assert rules(name) == reference(LAZY, Spec.Level(no_lazy), name), name
+        assert rules(name) == reference(LAZY, Spec.Level(no_lazy), name), name  # Memoized.
+
+
+def test_rules_first_match_wins():
+    from lazi.core.spec import Spec
+    from lazi.core.rules import Rules
+
+    rules = Rules({r"^a\.b.*": "LAZY", r"^a\.b\.c": "UNLO", r"^a": "LOAD"}, Spec.Level.LAZY)
+
+    assert rules("a.b.c") is Spec.Level.LAZY
+    assert rules("a.x") is Spec.Level.LOAD
+    assert rules("b") is Spec.Level.LAZY
+
+
+def test_rules_finder_get_level():
+    from lazi.core.spec import Spec
+    from lazi.core.finder import Finder
+
+    finder = Finder(LAZY={r"^x\.y": "UNLO"}, NO_LAZY=Spec.Level.SWAP)
+    assert finder.get_level("x.y.z") is Spec.Level.UNLO
+    assert finder.get_level("x") is Spec.Level.SWAP
+
+    finder.LAZY = {r"^x": "LOAD"}
+    assert finder.get_level("x.y.z") is Spec.Level.LOAD
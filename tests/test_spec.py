@@ -0,0 +1,35 @@
+import sys
+
+
+def test_spec_stdlib_builtin(tree, monkeypatch):
+    from lazi.core.finder import Finder
+    from lazi.core.spec import Spec
+
+    tree({"colorsys.py": "SHADOW = True\n", "sp_mod.py": ""})  # colorsys shadows a stdlib module name.
+    monkeypatch.setattr(Spec, "NO_HOOK_STD", True)
+
+    finder = Finder()
+    spec = lambda name: finder.find_spec(name)
+
+    assert spec("json").stdlib and not spec("json").builtin and not spec("json").hook
+    assert finder.find_spec("json.decoder", spec("json").submodule_search_locations).stdlib
+    assert spec("_json").stdlib  # Extension module (or built-in, depending on the build).
+    assert spec("sys").builtin and not spec("sys").hook  # NO_HOOK_BI.
+    assert not spec("colorsys").stdlib and spec("colorsys").hook
+    assert not spec("sp_mod").stdlib and not spec("sp_mod").builtin and spec("sp_mod").hook
+
+    finder.invalidate_caches()
+    assert "colorsys" not in sys.modules or not getattr(sys.modules["colorsys"], "SHADOW", False)
+
+
+def test_spec_p_name_rules(tree):
+    from lazi.core.finder import Finder
+
+    tree({"sp_pkg/__init__.py": "", "sp_pkg/sub.py": ""})
+
+    finder = Finder(NO_LAZY=0, LAZY={r"^sp_pkg\.sub$": "UNLO", r"^sp_pkg$": "LOAD"})
+    pkg = finder.find_spec("sp_pkg")
+    sub = finder.find_spec("sp_pkg.sub", pkg.submodule_search_locations)
+
+    assert (pkg.p_name, sub.p_name, sub.f_name) == ("sp_pkg", "sp_pkg.sub", "sp_pkg|sub")
+    assert pkg.level == Finder.Spec.Level.LOAD and sub.level == Finder.Spec.Level.UNLO
@@ -0,0 +1,42 @@
+import sys
+
+
+def test_stack_nested(tree):
+    from lazi.core.finder import Finder, Stack, __stack__
+    from lazi.core.spec import Spec
+
+    tree({f"{_}.py": "VALUE = 1\n" for _ in ("sk_a", "sk_b", "sk_c", "sk_d")})
+
+    outer = Finder(NO_LAZY=0)
+    inner = Finder(NO_LAZY=0, LAZY={r"^sk_b$": "UNLO"})
+
+    with outer, inner, Finder():
+        assert sum(isinstance(_, (Finder, Stack)) for _ in sys.meta_path) == 1
+        assert __stack__.finders[-3:-1] == [outer, inner]
+
+    with outer:
+        with inner:
+            import sk_a, sk_b
+            assert inner.specs["sk_a"] is __stack__.specs["sk_a"]
+            assert inner.specs["sk_a"].level is Spec.Level.LAZY
+            assert inner.specs["sk_b"].level is Spec.Level.UNLO
+
+        import sk_c
+        assert "sk_c" in outer.specs and "sk_c" not in inner.specs
+
+    assert __stack__ not in sys.meta_path and not __stack__.finders
+
+    with outer:
+        found = __stack__.find_spec("sk_d")
+        assert found.level is Spec.Level.LAZY and isinstance(found.loader, Finder.Loader)
+        with inner:
+            assert __stack__.find_spec("sk_d") is found  # Same level: the cached spec is shared.
+        with Finder(NO_LAZY=-1) as other:
+            spec = __stack__.find_spec("sk_d")
+            assert spec is other.specs["sk_d"] is not found and spec.level is Spec.Level.NONE
+            assert not isinstance(spec.loader, Finder.Loader)
+            other.invalidate_caches()
+
+    inner.invalidate_caches()
+    outer.invalidate_caches()
+    assert not {"sk_a", "sk_b", "sk_c", "sk_d"} & set(__stack__.specs)
@@ -55,3 +55,40 @@ def test_stat_nolazi_presto():
     with track("p = Presto('https://httpbin.org')"):
         p = Presto("https://httpbin.org")
         info(Stat())
+
+
+def test_stat_counters(tree):
+    from lazi.core.finder import Finder
+    from lazi.core.stat import Stat
+
+    tree({
+        "st_pkg/__init__.py": "",
+        "st_pkg/lazy.py": "VALUE = 1\n",
+        "st_pkg/eager.py": "VALUE = 2\n",
+        "st_pkg/dead.py": "raise RuntimeError('dead')\n",
+    })
+
+    before = Stat.check()
+
+    with Finder(NO_LAZY=0, LAZY={r"^st_pkg\..*eager$": "UNLO"}):
+        import st_pkg.lazy
+        import st_pkg.eager
+
+        stat = Stat.check()
+        assert stat.find_spec - before.find_spec == 3
+        assert stat.load_lazy - before.load_lazy == 1  # The parent is loaded by the submodule imports.
+        assert stat.load_none - before.load_none == 1  # Unhooked (UNLO).
+
+        assert st_pkg.lazy.VALUE == 1
+        assert Stat.check().load_full - before.load_full == 2
+
+        try:
+            import st_pkg.dead
+            st_pkg.dead.VALUE
+        except Exception:
+            pass
+
+        assert Stat.check().load_dead - before.load_dead == 1
+
+    tree.clear()
+    assert Stat.check().find_spec == before.find_spec
@@ -0,0 +1,58 @@
+import builtins
+import threading
+
+
+def test_concurrent_materialization(tree, monkeypatch):
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+
+    tree({
+        "thr_a.py": (
+            "import time, builtins, thr_b\n"
+            "builtins._lazi_threads.append(__name__)\n"
+            "A = 1\n"
+            "time.sleep(0.02)\n"
+            "B = thr_b.B\n"
+            "DONE = True\n"
+        ),
+        "thr_b.py": (
+            "import time, builtins, thr_a\n"
+            "builtins._lazi_threads.append(__name__)\n"
+            "B = 2\n"
+            "time.sleep(0.02)\n"
+            "A = thr_a.A\n"
+            "DONE = True\n"
+        ),
+        "thr_bad.py": "import time\ntime.sleep(0.02)\nraise RuntimeError('bad')\n",
+    })
+    monkeypatch.setattr(builtins, "_lazi_threads", [], raising=False)
+
+    errors, results = [], []
+    barrier = threading.Barrier(16)
+
+    def worker(index):
+        try:
+            barrier.wait()
+            mod = thr_a if index % 2 else thr_b
+            results.append((mod.DONE, mod.A, mod.B))
+        except Exception as e:
+            errors.append(e)
+
+        try:
+            thr_bad.VALUE
+        except ImportError as e:
+            results.append(type(e))
+
+    with Finder(NO_LAZY=0) as finder:
+        import thr_a, thr_b, thr_bad
+
+        threads = [threading.Thread(target=worker, args=(_,)) for _ in range(16)]
+        [_.start() for _ in threads]
+        [_.join(10) for _ in threads]
+
+    assert not any(_.is_alive() for _ in threads), "deadlock"
+    assert not errors, errors
+    assert sorted(builtins._lazi_threads) == ["thr_a", "thr_b"]  # Each executed exactly once.
+    assert results.count((True, 1, 2)) == 16
+    assert results.count(Loader.Error) == 16
+    assert finder.specs["thr_a"].loader_state is finder.specs["thr_b"].loader_state is Loader.State.LOAD
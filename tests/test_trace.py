@@ -0,0 +1,23 @@
+import sys
+import logging
+
+
+def test_trace_events(tree, monkeypatch, caplog):
+    from lazi.core.finder import Finder
+    from lazi.util import debug
+
+    tree({"tr_mod.py": "VALUE = 1\n"})
+
+    with Finder(NO_LAZY=0):
+        with caplog.at_level(logging.DEBUG):
+            import tr_mod
+            assert tr_mod.VALUE == 1
+            assert not [_ for _ in caplog.records if isinstance(_.msg, debug.Event)]  # TRACE=0: nothing is created.
+
+            monkeypatch.setattr(debug, "TRACE", 5)
+            tr_mod.VALUE = 2
+
+    events = [_.msg for _ in caplog.records if isinstance(_.msg, debug.Event)]
+    assert [_.code for _ in events] == ["SETA"]
+    proxy, target = sys.modules["tr_mod"], tr_mod.__spec__.target
+    assert str(events[0]) == f"[{debug.oid(proxy)}] LOAD .... [{debug.oid(target)}] tr_mod VALUE = [{debug.oid(2)}]"
@@ -0,0 +1,50 @@
+import re
+
+
+def test_record_tune(tree, tmp_path):
+    from lazi.core.spec import Spec
+    from lazi.core.finder import Finder
+    from lazi.core.record import Recorder
+    from lazi.core import tune
+
+    tree({
+        "tune_pkg/__init__.py": "from . import early, late, never\nearly.VALUE\n",
+        "tune_pkg/early.py": "VALUE = 1\n",
+        "tune_pkg/late.py": "VALUE = 2\n",
+        "tune_pkg/never.py": "VALUE = 3\n",
+        "tune_pkg/broken.py": "raise RuntimeError('global state')\n",
+    })
+
+    recorder = Recorder().install()
+
+    try:
+        with Finder(NO_LAZY=0):
+            import tune_pkg
+            tune_pkg.VALUE = 0
+            recorder.mark()
+            tune_pkg.late.VALUE
+            try:
+                import tune_pkg.broken
+                tune_pkg.broken.VALUE
+            except ImportError:
+                pass
+    finally:
+        recorder.uninstall()
+
+    recorder.save(path := str(tmp_path / "run.json"))
+    runs = tune.load([path])
+    levels = tune.levels(runs)
+
+    assert levels["tune_pkg"] is levels["tune_pkg.early"] is Spec.Level.UNLO
+    assert levels["tune_pkg.late"] is Spec.Level.SWAP
+    assert levels["tune_pkg.never"] is Spec.Level.LAZY
+    assert levels["tune_pkg.broken"] is Spec.Level.UNLO
+
+    source = tune.render(runs)
+    namespace = {}
+    exec(source, namespace)
+    lazy = namespace["LAZY"]
+    assert namespace["NO_LAZY"] == 0 and list(lazy)[-1] == ".*"
+
+    for name, level in levels.items():
+        assert Spec.Level[next(v for k, v in lazy.items() if re.match(k, name))] is level, name
@@ -0,0 +1,39 @@
+import os
+import json
+
+
+def test_warmup(tree, tmp_path):
+    from lazi.core.finder import Finder
+    from lazi.core.loader import Loader
+    from lazi.core.warmup import __warmup__
+
+    tree({"wu_pkg/__init__.py": "", **{f"wu_pkg/{_}.py": f"VALUE = {_!r}\n" for _ in "abc"}})
+
+    finder = Finder(NO_LAZY=1)
+
+    with finder:
+        import wu_pkg.a, wu_pkg.b  # noqa
+
+    assert finder.warmup(["wu_pkg.a", "wu_pkg.c", "wu_pkg.missing"]) == ["wu_pkg.a", "wu_pkg.c"]
+    assert finder.specs["wu_pkg.a"].loader_state is Loader.State.LOAD
+    assert finder.specs["wu_pkg.b"].loader_state is Loader.State.LAZY
+
+    report = str(tmp_path / "warm-{pid}.json")
+
+    if not (pid := os.fork()):
+        code = 1  # Any failure in the child, assertions included.
+        try:
+            assert wu_pkg.b.VALUE == "b"
+            __warmup__.save(report)
+            code = 0
+        finally:
+            os._exit(code)
+
+    assert os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) == 0
+
+    with open(report.format(pid=pid)) as file:
+        data = json.load(file)
+
+    assert data["parent"] == os.getpid() and data["after"] == ["wu_pkg.b"]
+    assert data["warm"][-2:] == ["wu_pkg.a", "wu_pkg.c"]
+    assert __warmup__.parent is None and finder.specs["wu_pkg.b"].loader_state is Loader.State.LAZY